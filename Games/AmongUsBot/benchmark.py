@@ -0,0 +1,69 @@
+"""Offline detection benchmark on recorded screenshots.
+
+    python benchmark.py --record recordings --count 200   # save live screenshots while playing
+    python benchmark.py recordings                        # replay them and measure detection speed
+"""
+import argparse
+import os
+import statistics
+import time
+
+import find_task
+from frame_source import ReplaySource
+from layout import Layout, set_layout
+from registry import prepare_tasks
+
+
+def record(directory, count, interval):
+    """Save full-screen screenshots for later replay"""
+    import pyautogui
+    os.makedirs(directory, exist_ok=True)
+    for i in range(count):
+        pyautogui.screenshot().save(os.path.join(directory, f"frame_{i:05d}.png"))
+        time.sleep(interval)
+    print(f"Saved {count} screenshots to {directory}")
+
+
+def benchmark(directory, rounds):
+    """Run detection (without solving) over every recorded frame and report throughput"""
+    source = ReplaySource(directory, loop=False)
+    height, width = source.screens[0].shape[:2]
+    box = prepare_tasks(set_layout(Layout(0, 0, width, height)))
+    # Load templates before timing
+    find_task.detect(source.grab(box))
+
+    timings = []
+    detections = {}
+    for _ in range(rounds):
+        source.index = 0
+        while True:
+            started = time.perf_counter()
+            frame = source.grab(box)
+            if frame is None:
+                break
+            registered, _ = find_task.detect(frame)
+            timings.append(time.perf_counter() - started)
+            name = registered.name if registered else "none"
+            detections[name] = detections.get(name, 0) + 1
+
+    total = sum(timings)
+    print(f"{len(timings)} frames ({len(source)} recorded x {rounds}) in {total:.2f}s: {len(timings) / total:.0f} frames/s")
+    print(f"per frame: mean {statistics.mean(timings) * 1000:.2f} ms, "
+          f"p95 {sorted(timings)[int(len(timings) * 0.95)] * 1000:.2f} ms")
+    for name, count in sorted(detections.items()):
+        print(f"  {name}: {count // rounds} of {len(source)} frames")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark task detection on recorded screenshots")
+    parser.add_argument("directory", help="folder with recorded *.png screenshots")
+    parser.add_argument("--record", action="store_true", help="record live screenshots into the folder instead")
+    parser.add_argument("--count", type=int, default=100, help="screenshots to record")
+    parser.add_argument("--interval", type=float, default=0.5, help="seconds between recorded screenshots")
+    parser.add_argument("--rounds", type=int, default=5, help="passes over the recorded frames")
+    args = parser.parse_args()
+
+    if args.record:
+        record(args.directory, args.count, args.interval)
+    else:
+        benchmark(args.directory, args.rounds)
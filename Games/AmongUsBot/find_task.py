@@ -1,24 +1,29 @@
-import pyautogui
-from tasksolver import fix_wiring
-from tasksolver import divert_power_start
-from tasksolver import divert_power_end
+import tasksolver  # registers the tasks
+from frame_source import ScreenSource
+from layout import get_layout
+from registry import TASKS, prepare_tasks
 
-images = [
-    './pictures/fix_wiring.png'
-    './pictures/divert_power_start.png'
-    './pictures/divert_power_end.png'
-]
-def find_task():
-    fix_wiring_task = pyautogui.locateOnScreen('./pictures/fix_wiring.png', grayscale=True)
-    divert_power_task_end = pyautogui.locateOnScreen('./pictures/divert_power_end.png', grayscale=True)
-    divert_power_task_start = pyautogui.locateOnScreen('./pictures/divert_power_start.png', grayscale=True)
+screen = ScreenSource()
+box = None
 
-    if fix_wiring_task is not None:  # task visible
-        print("FixWiringTask: ", fix_wiring_task)
-        fix_wiring()
-    elif divert_power_task_start is not None:  # task visible
-        print("DivertPowerTaskStart: ", divert_power_task_start)
-        divert_power_start()
-    elif divert_power_task_end is not None:  # task visible
-        print("DivertPowerTaskEnd: ", divert_power_task_end)
-        divert_power_end()
\ No newline at end of file
+
+def detect(frame):
+    """Return the first registered task visible in the frame and its position"""
+    for registered in TASKS:
+        position = registered.locate(frame)
+        if position is not None:  # task visible
+            return registered, position
+    return None, None
+
+
+def find_task(source=screen):
+    global box
+    if box is None:
+        box = prepare_tasks(get_layout())
+    frame = source.grab(box)
+    registered, position = detect(frame)
+    if registered is None:
+        return False
+    print(registered.name + ": ", position)
+    registered.solver(frame)
+    return True
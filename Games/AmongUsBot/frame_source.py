@@ -0,0 +1,62 @@
+import glob
+import os
+import cv2
+import numpy as np
+
+
+class Frame:
+    """One captured screen area, shared by every detector and solver in a tick"""
+
+    def __init__(self, image, box):
+        self.image = image  # RGB array of the capture box
+        self.box = box      # (left, top, width, height) on screen
+        self.scaled_gray = {}
+
+    def gray(self, scale):
+        """Grayscale copy downscaled by scale, computed once per frame"""
+        if scale not in self.scaled_gray:
+            gray = cv2.cvtColor(self.image, cv2.COLOR_RGB2GRAY)
+            if scale != 1:
+                gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+            self.scaled_gray[scale] = gray
+        return self.scaled_gray[scale]
+
+    def pixels(self, coordinates):
+        """RGB values at screen coordinates as an (n, 3) array"""
+        points = np.asarray(coordinates)
+        return self.image[points[:, 1] - self.box[1], points[:, 0] - self.box[0], :3]
+
+
+class ScreenSource:
+    """Live frames from the screen"""
+
+    def grab(self, box):
+        import pyautogui
+        return Frame(np.asarray(pyautogui.screenshot(region=box)), box)
+
+
+class ReplaySource:
+    """Frames from saved full-screen screenshots, for benchmarking without the game"""
+
+    def __init__(self, directory, loop=True):
+        paths = sorted(glob.glob(os.path.join(directory, "*.png")))
+        if not paths:
+            raise FileNotFoundError(f"No screenshots (*.png) in {directory}")
+        # Decode once up front so replay speed measures detection, not PNG decoding
+        self.screens = [cv2.cvtColor(cv2.imread(path, cv2.IMREAD_COLOR), cv2.COLOR_BGR2RGB) for path in paths]
+        self.names = [os.path.basename(path) for path in paths]
+        self.loop = loop
+        self.index = 0
+
+    def __len__(self):
+        return len(self.screens)
+
+    def grab(self, box):
+        if self.index >= len(self.screens):
+            if not self.loop:
+                return None
+            self.index = 0
+        screen = self.screens[self.index]
+        self.index += 1
+        left, top, width, height = box
+        return Frame(screen[top:top + height, left:left + width], box)
@@ -0,0 +1,68 @@
+# All task coordinates are written for this reference layout
+REFERENCE_WIDTH = 2560
+REFERENCE_HEIGHT = 1440
+GAME_WINDOW_TITLE = "Among Us"
+
+
+class Layout:
+    """Maps reference (2560x1440) coordinates onto the game's actual screen area.
+
+    The game keeps its aspect ratio, so the reference layout is scaled uniformly
+    and centered in the area (letterboxing on the other axis).
+    """
+
+    def __init__(self, left, top, width, height):
+        self.scale = min(width / REFERENCE_WIDTH, height / REFERENCE_HEIGHT)
+        self.offset_x = left + (width - REFERENCE_WIDTH * self.scale) / 2
+        self.offset_y = top + (height - REFERENCE_HEIGHT * self.scale) / 2
+        self.cache = {}
+
+    def point(self, x, y):
+        return int(round(self.offset_x + x * self.scale)), int(round(self.offset_y + y * self.scale))
+
+    def points(self, coordinates):
+        """Map a list of reference points; the result is cached per list"""
+        key = tuple(map(tuple, coordinates))
+        if key not in self.cache:
+            self.cache[key] = [self.point(x, y) for x, y in coordinates]
+        return self.cache[key]
+
+    def region(self, region):
+        left, top, width, height = region
+        x, y = self.point(left, top)
+        return x, y, int(round(width * self.scale)), int(round(height * self.scale))
+
+
+def locate_game_window():
+    """Find the game window once; falls back to the whole primary screen"""
+    import pyautogui
+    try:
+        windows = [window for window in pyautogui.getWindowsWithTitle(GAME_WINDOW_TITLE) if window.width > 0]
+    except AttributeError:
+        # getWindowsWithTitle is only available on Windows
+        windows = []
+    if windows:
+        window = windows[0]
+        print("Game window: ", (window.left, window.top, window.width, window.height))
+        return Layout(window.left, window.top, window.width, window.height)
+    width, height = pyautogui.size()
+    print("Game window not found, using the whole screen: ", (width, height))
+    return Layout(0, 0, width, height)
+
+
+current = None
+
+
+def get_layout():
+    """Layout of the game, looked up on first use and cached"""
+    global current
+    if current is None:
+        current = locate_game_window()
+    return current
+
+
+def set_layout(layout):
+    """Use a fixed layout, e.g. the size of recorded screenshots"""
+    global current
+    current = layout
+    return layout
@@ -1,15 +1,23 @@
+# add other tasks and so on with threading
 import time
 import keyboard
 from find_task import find_task
 
+# Detection rate; one screenshot per tick
+FPS = 20
+FRAME_TIME = 1 / FPS
+
 
 # main code start
 time.sleep(1)   # tab into the game
 
 print("Starting over")
 while not keyboard.is_pressed('p'):
+    tick_start = time.perf_counter()
     try:
         find_task()
-    except:
-      print("No Task found. Retrying")
+    except Exception as e:
+        print("Task detection failed: ", e)
+    # Keep a steady frame rate instead of spinning
+    time.sleep(max(0.0, FRAME_TIME - (time.perf_counter() - tick_start)))
 print("Ending Code")
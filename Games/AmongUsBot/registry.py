@@ -0,0 +1,84 @@
+import cv2
+
+# Templates are matched at half resolution; the task panels stay easy to tell apart
+SCALE = 0.5
+CONFIDENCE = 0.8
+
+
+class Task:
+    """A detector (template + search region) paired with the solver that handles it"""
+
+    def __init__(self, name, template_path, region, solver, points=()):
+        self.name = name
+        self.template_path = template_path
+        self.region = region    # (left, top, width, height) on the 2560x1440 reference layout
+        self.solver = solver
+        self.points = points    # reference coordinates the solver reads from the frame
+        self.screen_region = None
+        self.screen_points = []
+        self.template = None
+
+    def prepare(self, layout):
+        """Map region and points onto the screen and load the template at the matching scale"""
+        self.screen_region = layout.region(self.region)
+        self.screen_points = layout.points(self.points) if self.points else []
+        image = cv2.imread(self.template_path, cv2.IMREAD_GRAYSCALE)
+        if image is None:
+            raise FileNotFoundError(self.template_path)
+        # Templates were cut from the reference layout
+        scale = SCALE * layout.scale
+        self.template = cv2.resize(image, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
+    def locate(self, frame):
+        """Search the template inside its region of the frame; returns the screen position or None"""
+        template = self.template
+        region = self.screen_region
+        box = frame.box
+        left = int((region[0] - box[0]) * SCALE)
+        top = int((region[1] - box[1]) * SCALE)
+        area = frame.gray(SCALE)[top:top + int(region[3] * SCALE), left:left + int(region[2] * SCALE)]
+        if area.shape[0] < template.shape[0] or area.shape[1] < template.shape[1]:
+            return None
+        result = cv2.matchTemplate(area, template, cv2.TM_CCOEFF_NORMED)
+        _, score, _, (x, y) = cv2.minMaxLoc(result)
+        if score < CONFIDENCE:
+            return None
+        # Back to full-resolution screen coordinates
+        return int(box[0] + (left + x) / SCALE), int(box[1] + (top + y) / SCALE)
+
+
+# Registered tasks, checked in registration order; the first match wins
+TASKS = []
+
+
+def task(name, template_path, region, points=()):
+    """Decorator that registers a solver together with its detector"""
+    def register(solver):
+        TASKS.append(Task(name, template_path, region, solver, points))
+        return solver
+    return register
+
+
+def prepare_tasks(layout):
+    """Map every task onto the layout once; returns the capture box for the frames"""
+    for registered in TASKS:
+        registered.prepare(layout)
+    return capture_box()
+
+
+def capture_box():
+    """Smallest box containing every search region and sample point, so one screenshot serves all tasks"""
+    lefts, tops, rights, bottoms = [], [], [], []
+    for registered in TASKS:
+        left, top, width, height = registered.screen_region
+        lefts.append(left)
+        tops.append(top)
+        rights.append(left + width)
+        bottoms.append(top + height)
+        for x, y in registered.screen_points:
+            lefts.append(x)
+            tops.append(y)
+            rights.append(x + 1)
+            bottoms.append(y + 1)
+    left, top = min(lefts), min(tops)
+    return left, top, max(rights) - left, max(bottoms) - top
@@ -1,83 +1,102 @@
-import pyautogui
+import numpy as np
+from layout import get_layout
+from registry import task
 
+# Solvers get the tick's frame and read pixels from it instead of taking screenshots.
+# Coordinates are on the 2560x1440 reference layout and mapped to the screen with get_layout().
+# pyautogui is only imported when a solver clicks, so detection works without it (e.g. benchmark.py).
+WIRING_START = [
+    [884, 274],
+    [884, 457],
+    [884, 642],
+    [884, 830]
+]
+WIRING_END = [
+    [1658, 274],
+    [1658, 457],
+    [1658, 642],
+    [1658, 830]
+]
+POWER_NAMES = [
+    "Upper Engine",
+    "Lower Engine",
+    "Weapons",
+    "Shields",
+    "Navigation",
+    "Communications",
+    "O2",
+    "Security"
+]
+POWER_START = [
+    [972, 762],  # Upper Engine
+    [1066, 762],  # Lower Engine
+    [1160, 762],  # Weapons
+    [1256, 762],  # Shields
+    [1360, 762],  # Navigation
+    [1453, 762],  # Communication
+    [1551, 762],  # 02
+    [1649, 762]  # Security
+]
+POWER_END = [
+    [972, 1357],
+    [1066, 1357],
+    [1160, 1357],
+    [1256, 1357],
+    [1360, 1357],
+    [1453, 1357],
+    [1551, 1357],
+    [1649, 1357]
+]
 
-def fix_wiring():
-    start_coordinates = [
-            [884, 274],
-            [884, 457],
-            [884, 642],
-            [884, 830]
-        ]
-    ending_coordinates = [
-            [1658, 274],
-            [1658, 457],
-            [1658, 642],
-            [1658, 830]
-        ]
-    for i in start_coordinates:
-        print("start_coordinates: ", i)
-        r1, g1, b1 = pyautogui.pixel(i[0], i[1])
-        print(r1, g1, b1)
-        for y in ending_coordinates:
-            r2, g2, b2 = pyautogui.pixel(y[0], y[1])
-            if ((r1 == r2) and (g1 == g2) and (b1 == b2)):
-                pyautogui.moveTo(i[0], i[1])
-                pyautogui.mouseDown()
-                pyautogui.moveTo(y[0], y[1], 0.2)
-                pyautogui.mouseUp()
-                print("Matching ending_coordinates: ", y)
+
+def drag(start, end):
+    """Drag the mouse from start to end (screen coordinates)"""
+    import pyautogui
+    pyautogui.moveTo(start[0], start[1])
+    pyautogui.mouseDown()
+    pyautogui.moveTo(end[0], end[1], 0.2)
+    pyautogui.mouseUp()
+
+
+def click(point):
+    """Click at a point (screen coordinates)"""
+    import pyautogui
+    pyautogui.click(*point)
+
+
+@task("FixWiringTask", './pictures/fix_wiring.png', (800, 200, 960, 760), points=WIRING_START + WIRING_END)
+def fix_wiring(frame):
+    layout = get_layout()
+    starts = layout.points(WIRING_START)
+    endings = layout.points(WIRING_END)
+    start_colors = frame.pixels(starts)
+    ending_colors = frame.pixels(endings)
+    print("start colors: ", start_colors.tolist())
+    # matches[i, j]: start wire i has the same color as ending j
+    matches = np.all(start_colors[:, None, :] == ending_colors[None, :, :], axis=2)
+    for i, y in zip(*np.nonzero(matches)):
+        start, end = starts[i], endings[y]
+        print("start_coordinates: ", start, "Matching ending_coordinates: ", end)
+        drag(start, end)
     print("Finished Fix_Wiring. Searching for new Task")
 
-def divert_power_start():
-    start_coordinates = [
-        [972, 762],  # Upper Engine
-        [1066, 762],  # Lower Engine
-        [1160, 762],  # Weapons
-        [1256, 762],  # Shields
-        [1360, 762],  # Navigation
-        [1453, 762],  # Communication
-        [1551, 762],  # 02
-        [1649, 762]  # Security
-    ]
-    ending_coordinates = [
-        [972, 1357],
-        [1066, 1357],
-        [1160, 1357],
-        [1256, 1357],
-        [1360, 1357],
-        [1453, 1357],
-        [1551, 1357],
-        [1649, 1357]
-    ]
-    for i in start_coordinates:
-        r1, g1, b1 = pyautogui.pixel(i[0], i[1])
-        print(r1, g1, b1)
-        for y in ending_coordinates:
-            if (r1 == 255):
-                if i[0] == 972:
-                    print("Diverting Power to Upper Engine")
-                elif i[0] == 1066:
-                    print("Diverting Power to Lower Engine")
-                elif i[0] == 1160:
-                    print("Diverting Power to Weapons")
-                elif i[0] == 1250:
-                    print("Diverting Power to Shields")
-                elif i[0] == 1350:
-                    print("Diverting Power to Navigation")
-                elif i[0] == 1453:
-                    print("Diverting Power to Communications")
-                elif i[0] == 1551:
-                    print("Diverting Power to O2")
-                elif i[0] == 1649:
-                    print("Diverting Power to Security")
-                pyautogui.moveTo(i[0], i[1])
-                pyautogui.mouseDown()
-                pyautogui.moveTo(y[0], y[1], 0.2)
-                pyautogui.mouseUp()
+
+@task("DivertPowerTaskStart", './pictures/divert_power_start.png', (880, 1200, 880, 240), points=POWER_START)
+def divert_power_start(frame):
+    layout = get_layout()
+    starts = layout.points(POWER_START)
+    endings = layout.points(POWER_END)
+    start_colors = frame.pixels(starts)
+    print(start_colors.tolist())
+    # The slider that needs power is the one with a full red channel
+    for i in np.flatnonzero(start_colors[:, 0] == 255):
+        start, end = starts[i], endings[i]
+        print("Diverting Power to " + POWER_NAMES[i])
+        drag(start, end)
     print("Diverted Power from Electrical. Searching for new Task")
 
 
-def divert_power_end():
+@task("DivertPowerTaskEnd", './pictures/divert_power_end.png', (1180, 380, 200, 340))
+def divert_power_end(frame):
     print("Finished Diverting Power. Searching for new Task")
-    pyautogui.click(1282, 540)
-
+    click(get_layout().point(1282, 540))
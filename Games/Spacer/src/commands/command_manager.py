@@ -3,8 +3,12 @@ Main command router for player inputs.
 """
 import time
 from src.commands.registry import cmd_registry
-from src.commands.station_commands import handle_station_input, handle_planet_input
+from src.commands.station_commands import handle_station_command, handle_planet_command, show_station_options, show_surface_options
 from src.core.save_manager import SaveManager
+from src.world.dimension import get_dimension
+from src.utils.perf import perf
+from src.utils.batch_mode import batch_mode, batch_depth, error_count
+from src.config import BATCH_MAX_DEPTH
 
 # Create save manager instance
 save_mgr = SaveManager()
@@ -22,46 +26,103 @@ def initialize_commands():
         cmd_registry.load_all_commands()
         _commands_initialized = True
 
-def handle_input(player):
-    """Process player commands and execute appropriate actions"""
+def get_prompt(player):
+    """Get the input prompt for the player's current context"""
+    if player.docked_at:
+        return f"\n[{player.docked_at.name}] {player.name}> "
+    if player.landed_on:
+        return f"\n[{player.landed_on}] {player.name}> "
+    return f"\n[{player.position('dimension')}:{player.position('x')},{player.position('y')}] {player.name} > "
+
+def show_context(player):
+    """Show the station or surface options when the player just arrived there"""
+    if player.docked_at:
+        show_station_options(player)
+    elif player.landed_on:
+        show_surface_options(player)
+
+def execute_line(player, user_input):
+    """Execute one line of player input in the player's current context"""
+    # Pick up dimension data reloaded by another session
+    player.dimension = get_dimension(player.dimension.name)
+    
+    # Several commands separated by ";" run as one batch
+    commands = [command.strip() for command in user_input.split(";")]
+    if len(commands) > 1:
+        result = run_batch(player, commands)
+    else:
+        result = dispatch(player, user_input)
+    
+    # Save after every command (only if not already returning "negative" or "logout")
+    if result != "negative" and result != "logout":
+        save_mgr.save_game(player)
+    
+    return result
+
+def dispatch(player, user_input):
+    """Execute one command in the player's current context without saving"""
     # Check if player is docked at a station
     if player.docked_at:
-        return handle_station_input(player)
+        with perf.timer("command.station"):
+            return handle_station_command(player, user_input.strip().lower())
     
     # Check if player is landed on a planet
     if player.landed_on:
-        return handle_planet_input(player)
+        with perf.timer("command.surface"):
+            return handle_planet_command(player, user_input.strip().lower())
     
     # Don't accept commands if player is dead
     if player.is_dead:
         print("\n☠ You are deceased. Game over.")
         return "negative"
-        
-    # Get the raw user input (without converting to lowercase)
-    user_input = input(f"\n[{player.position('dimension')}:{player.position('x')},{player.position('y')}] {player.name} > ")
     
     # Handle empty input
     if not user_input.strip():
         return "positive"
     
-    # Split input into command and arguments
-    parts = user_input.split(None, 1)
-    command_name = parts[0].lower()
-    args = parts[1] if len(parts) > 1 else ""
-    
-    # Get the command object
-    command = cmd_registry.get_command(command_name)
-    
-    # If command not found
-    if not command:
-        print(f"\n✗ Unknown command: '{command_name}'. Type 'help' for available commands.")
+    # Look up and execute the command through the registry
+    return cmd_registry.handle_command(player, user_input)
+
+def run_batch(player, commands):
+    """
+    Execute commands as one transaction: animations are skipped and nothing is saved
+    in between (the caller saves once). Stops at the first command that prints an
+    error, raises, ends the session or kills the player.
+    """
+    commands = [command for command in commands if command]
+    if batch_depth() >= BATCH_MAX_DEPTH:
+        print(f"\n✗ Batches can only be nested {BATCH_MAX_DEPTH} levels deep.")
         return "positive"
     
-    # Execute the command
-    result = command.execute(player, args)
+    result = "positive"
+    with batch_mode():
+        for number, command in enumerate(commands, 1):
+            print(f"\n» [{number}/{len(commands)}] {command}")
+            errors = error_count()
+            try:
+                result = dispatch(player, command)
+            except Exception as e:
+                print(f"\n✗ Command failed: {e}")
+                result = "positive"
+            
+            if result == "negative" or result == "logout" or player.is_dead:
+                break
+            if error_count() > errors:
+                skipped = len(commands) - number
+                if skipped:
+                    print(f"\n✗ Batch stopped at '{command}', {skipped} command(s) skipped.")
+                break
+    return result
+
+def handle_input(player):
+    """Process player commands and execute appropriate actions"""
+    # Don't accept commands if player is dead
+    if player.is_dead and not player.docked_at and not player.landed_on:
+        print("\n☠ You are deceased. Game over.")
+        return "negative"
     
-    # Save after every command (only if not already returning "negative" or "logout")
-    if result != "negative" and result != "logout":
-        save_mgr.save_game(player)
+    show_context(player)
     
-    return result
+    # Get the raw user input (without converting to lowercase)
+    user_input = input(get_prompt(player))
+    return execute_line(player, user_input)
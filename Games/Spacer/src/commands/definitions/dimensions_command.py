@@ -3,7 +3,7 @@ Dimensions command for showing available star systems.
 """
 from src.commands.base_command import BaseCommand
 from src.config import WARP_PATHS
-from src.world.dimension import Dimension
+from src.world.dimension import get_dimension
 
 class DimensionsCommand(BaseCommand):
     def __init__(self):
@@ -33,7 +33,7 @@ class DimensionsCommand(BaseCommand):
                 for dest in destinations:
                     # Load dimension data to get title
                     try:
-                        dim = Dimension(dest)
+                        dim = get_dimension(dest)
                         description = dim.title
                     except:
                         # Fallback if dimension can't be loaded
@@ -0,0 +1,37 @@
+"""
+Find command for searching discovered objects across all known systems.
+"""
+from src.commands.base_command import BaseCommand
+from src.world.search_index import search_index
+
+class FindCommand(BaseCommand):
+    def __init__(self):
+        # Load configuration from the YAML file
+        super().__init__()
+    
+    def execute(self, player, args):
+        """Execute the find command"""
+        # Validate context
+        if not self.validate_context(player):
+            return "positive"
+        
+        text = args.strip()
+        if not text:
+            print(f"\n✗ {self.error_messages.get('no_text', 'No search text provided. Usage: find <text>')}")
+            return "positive"
+        
+        results = search_index.search(text, player)
+        if not results:
+            print(f"\nNo known objects match '{text}'.")
+            return "positive"
+        
+        print(f"\n=== SEARCH RESULTS: {text} ===")
+        print(f"{'Type':<15} {'Name':<22} {'System':<8} {'Coordinates':<16} {'Location':<18} {'Match':<8}")
+        print("-" * 92)
+        for entry, match in results:
+            coords = f"({entry.coords[0]}, {entry.coords[1]})" if entry.coords else ""
+            location = entry.parent or ""
+            print(f"{entry.kind:<15} {entry.name:<22} {entry.dimension:<8} {coords:<16} {location:<18} {match:<8}")
+        print("=" * 92 + "\n")
+        
+        return "positive"
@@ -3,10 +3,6 @@ Move command for Spacer game.
 """
 from src.commands.base_command import BaseCommand
 from src.functions.navigation_functions import perform_move
-from src.core.save_manager import SaveManager
-
-# Create save manager for saving after command execution
-save_mgr = SaveManager()
 
 class MoveCommand(BaseCommand):
     def __init__(self):
@@ -32,11 +28,6 @@ class MoveCommand(BaseCommand):
             print(f"\n✗ {self.error_messages['invalid_coords']}")
             return "positive"
         
-        # Perform the move
-        success = perform_move(player, x, y)
-        
-        # Save game after movement
-        if success:
-            save_mgr.save_game(player)
-        
+        # Perform the move; the command manager saves after every command
+        perform_move(player, x, y)
         return "positive"
@@ -0,0 +1,35 @@
+"""
+Perf command for viewing command and world query latencies.
+"""
+from src.commands.base_command import BaseCommand
+from src.utils.perf import perf
+
+class PerfCommand(BaseCommand):
+    def __init__(self):
+        # Load configuration from the YAML file
+        super().__init__()
+    
+    def execute(self, player, args):
+        """Execute the perf command"""
+        action = args.strip().lower()
+        
+        if action == "reset":
+            perf.reset()
+            print("\n» Performance metrics reset.")
+            return "positive"
+        
+        if action == "dump":
+            try:
+                path = perf.dump(player.name)
+                print(f"\n» Metrics written to {path}")
+            except OSError as e:
+                print(f"\n✗ Could not write metrics: {e}")
+            return "positive"
+        
+        # Any other argument filters metrics by name prefix (e.g. "perf world")
+        print("\n=== PERFORMANCE ===")
+        for line in perf.report(action):
+            print(line)
+        print("Idle: share of time spent in animations or waiting for input")
+        print("===================\n")
+        return "positive"
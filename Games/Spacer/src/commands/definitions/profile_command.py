@@ -0,0 +1,20 @@
+"""
+Profile command for capturing cProfile/tracemalloc data of a single command.
+"""
+from src.commands.base_command import BaseCommand
+from src.commands.registry import cmd_registry
+from src.utils.profiler import profile_call
+
+class ProfileCommand(BaseCommand):
+    def __init__(self):
+        # Load configuration from the YAML file
+        super().__init__()
+    
+    def execute(self, player, args):
+        """Execute the profile command"""
+        command_line = args.strip()
+        if not command_line:
+            print(f"\n✗ {self.error_messages.get('no_command', 'No command provided. Usage: profile <command>')}")
+            return "positive"
+        
+        return profile_call(command_line, cmd_registry.handle_command, player, command_line)
@@ -1,8 +1,9 @@
 """
-Reload command for refreshing command configurations.
+Reload command for refreshing command configurations and dimension data.
 """
 from src.commands.base_command import BaseCommand
 from src.commands.registry import cmd_registry
+from src.world.dimension import get_dimension, reload_dimensions
 
 class ReloadCommand(BaseCommand):
     def __init__(self):
@@ -14,4 +15,9 @@ class ReloadCommand(BaseCommand):
         print("\nReloading command configurations...")
         count = cmd_registry.reload_all_commands()
         print(f"Successfully reloaded {count} commands.")
+        
+        print("Reloading dimension data...")
+        count = reload_dimensions()
+        player.dimension = get_dimension(player.dimension.name)
+        print(f"Successfully reloaded {count} dimensions.")
         return "positive"
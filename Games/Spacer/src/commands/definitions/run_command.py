@@ -0,0 +1,55 @@
+"""
+Run command for executing a script file of commands as one batch.
+"""
+import os
+from src.commands.base_command import BaseCommand
+from src.commands.command_manager import run_batch
+from src.config import SCRIPTS_DIRECTORY
+
+class RunCommand(BaseCommand):
+    def __init__(self):
+        # Load configuration from the YAML file
+        super().__init__()
+    
+    def execute(self, player, args):
+        """Execute the run command"""
+        # Validate context
+        if not self.validate_context(player):
+            return "positive"
+        
+        file_name = args.strip()
+        if not file_name:
+            print(f"\n✗ {self.error_messages.get('no_file', 'No script file provided. Usage: run <file>')}")
+            return "positive"
+        
+        path = self.find_script(file_name)
+        if path is None:
+            print(f"\n✗ {self.error_messages.get('not_found', 'Script file not found.')} ({file_name})")
+            return "positive"
+        
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                lines = f.read().splitlines()
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"\n✗ Could not read script {path}: {e}")
+            return "positive"
+        
+        # One command per line or several separated by ";", lines starting with # are comments
+        commands = []
+        for line in lines:
+            if line.strip().startswith("#"):
+                continue
+            commands.extend(command.strip() for command in line.split(";"))
+        
+        print(f"\n» Running {path}...")
+        return run_batch(player, commands)
+    
+    def find_script(self, file_name):
+        """Path of the script as given, or in the scripts directory"""
+        candidates = [file_name]
+        if not os.path.isabs(file_name):
+            candidates.append(os.path.join(SCRIPTS_DIRECTORY, file_name))
+        for candidate in candidates:
+            if os.path.isfile(candidate):
+                return candidate
+        return None
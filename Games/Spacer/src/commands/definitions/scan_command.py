@@ -2,7 +2,7 @@
 Scan command for detecting celestial bodies.
 """
 from src.commands.base_command import BaseCommand
-from src.commands.scan_commands import handle_scan_command, handle_specific_scan_command
+from src.commands.scan_commands import handle_scan_command, handle_delta_scan_command, handle_specific_scan_command
 
 class ScanCommand(BaseCommand):
     def __init__(self):
@@ -17,7 +17,10 @@ class ScanCommand(BaseCommand):
         
         # Check if we're scanning a specific body or doing a general scan
         body_name = args.strip()
-        if body_name:
+        if body_name.lower() in ("--delta", "-d"):
+            # Only what changed since the last scan
+            handle_delta_scan_command(player)
+        elif body_name:
             # Scan specific celestial body
             handle_specific_scan_command(player, body_name)
         else:
@@ -1,10 +1,11 @@
 """
 Navigation and movement command handlers.
 """
-import time
-from src.world.dimension import Dimension
+from src.world.dimension import get_dimension
 from src.config import MOVEMENT_SPEED, WARP_PATHS, DANGEROUS_BODY_TYPES, DANGER_WARNING_DISTANCE
-from src.world.station import load_stations_from_dimension, check_coords_for_objects, is_safe_location, get_nearby_dangers
+from src.world.station import check_coords_for_objects, is_safe_location, get_nearby_dangers
+from src.world.spatial_index import sweep_path
+from src.utils.batch_mode import pause
 
 def move(player, x, y):
     """Move the player to specified coordinates"""
@@ -43,6 +44,20 @@ def move(player, x, y):
             print("\n✓ Navigation aborted.")
             return
     
+    # Check the course itself - the ship does not need to stop inside a star to burn up
+    distance = max(abs(x - player.x), abs(y - player.y))
+    crossing = next((hit for hit in sweep_path(player, x, y) if hit.kind == "hazard" and hit.step < distance), None)
+    if crossing and not target_is_dangerous:
+        print(f"\n⚠️ CRITICAL WARNING: Your course passes through {crossing.name} ({crossing.type}) at [{crossing.point[0]}, {crossing.point[1]}]!")
+        confirm = input("\nOverride safety protocols? This will result in death! (type 'override' to confirm): ")
+        if confirm.lower() != "override":
+            print("\n✓ Navigation aborted. Safety protocols maintained.")
+            return
+        
+        # The ship will not get past the hazard
+        print(f"\n⚠️ Safety protocols overridden. Proceeding with dangerous navigation...")
+        x, y = crossing.point
+    
     # Calculate the distance (maximum of x or y difference for diagonal movement)
     distance = max(abs(x - player.x), abs(y - player.y))
     
@@ -80,12 +95,12 @@ def move(player, x, y):
         
         # Display improved movement animation with spaceship
         print(f"\r[{spacebar}] Moving... {remaining} second{'s' if remaining != 1 else ''} remaining [{display_percent}%]{buffer_space}", end="", flush=True)
-        time.sleep(MOVEMENT_SPEED)
+        pause(MOVEMENT_SPEED)
         
         # After waiting for the regular countdown, show final approach message for the last step
         if remaining == 1:
             print(f"\r[{spacebar}] Moving... Final approach [{display_percent}%]{buffer_space}", end="", flush=True)
-            time.sleep(0.2)  # Add extra wait for final approach
+            pause(0.2)  # Add extra wait for final approach
     
     # Force a direct check for dangerous location at destination
     final_check = check_coords_for_objects(x, y, player.dimension.name, {'bodies': player.dimension.properties})
@@ -127,14 +142,8 @@ def handle_move_command(player, x, y):
     station = get_station_at_coords(player.x, player.y, player.dimension.name)
     if station:
         print(f"\nYou've discovered {station.name}!")
-        # Add to known bodies if not already there
-        dim_name = player.dimension.name
-        if dim_name not in player.known_bodies:
-            player.known_bodies[dim_name] = []
-        # We'll use a special notation for stations: "STATION:stationname"
-        station_entry = f"STATION:{station.name}"
-        if station_entry not in player.known_bodies[dim_name]:
-            player.known_bodies[dim_name].append(station_entry)
+        # Add to known bodies, using a special notation for stations: "STATION:stationname"
+        player.known_bodies.add(player.dimension.name, f"STATION:{station.name}")
             
         dock = input("Would you like to dock? (y/n): ").strip().lower()
         if dock == "y" or dock == "yes":
@@ -162,7 +171,7 @@ def handle_jump_command(player, dimension_name):
             print(f"  Available warp destinations from {current_dimension}: {', '.join(WARP_PATHS[current_dimension])}")
             return
             
-        new_dimension = Dimension(dimension_name)
+        new_dimension = get_dimension(dimension_name)
         print(f"\n▼ DIMENSIONAL JUMP SEQUENCE INITIATED ▼")
         print(f"➤ Target: {new_dimension.title}")
         print(f"➤ Preparing and calibrating jump engines...")
@@ -183,18 +192,18 @@ def handle_jump_command(player, dimension_name):
             
             # Print loading bar with "Charging" prefix
             print(f"\rCharging [" + bar + f"] {percent}%", end="", flush=True)
-            time.sleep(0.1)
+            pause(0.1)
         print()  # Line break after loading completes
 
         print(f"\n➤ Jump sequence activated! Entering hyperspace...")
-        time.sleep(1)
+        pause(1)
         
         # Animation for the jump
         jump_animation = ["■□□□□", "□■□□□", "□□■□□", "□□□■□", "□□□□■", "□□□■□", "□□■□□", "□■□□□"]
         for _ in range(3):  # 3 cycles of animation
             for frame in jump_animation:
                 print(f"\r▻▻▻ {frame} ◅◅◅", end="", flush=True)
-                time.sleep(0.1)
+                pause(0.1)
         
         # Update player state
         player.dimension = new_dimension
@@ -210,9 +219,6 @@ def handle_jump_command(player, dimension_name):
         print(f"» {new_dimension.description}")
         print(f"» Starting coordinates: [10, 10]\n")
         
-        # Load stations from the new dimension
-        load_stations_from_dimension({'bodies': new_dimension.properties}, dimension_name)
-        
     except ValueError as e:
         print(f"\n✗ JUMP FAILED: {str(e)}\n")
 
@@ -37,7 +37,7 @@ def handle_player_info_command(player, other_player_name=None):
         print(f"» Dimensions visited: {len(player.known_dimensions)}")
         
         # Count total discovered bodies
-        total_bodies = sum(len(bodies) for bodies in player.known_bodies.values())
+        total_bodies = player.known_bodies.count()
         print(f"» Celestial bodies discovered: {total_bodies}")
         
         # Display playtime from player object
@@ -5,6 +5,8 @@ import importlib
 import os
 import pkgutil
 from src.commands.base_command import BaseCommand
+from src.utils.perf import perf
+from src.utils.profiler import should_profile, profile_call
 
 class CommandRegistry:
     def __init__(self):
@@ -12,6 +14,7 @@ class CommandRegistry:
         self.aliases = {}   # Map of aliases to primary command names
         self.registered_aliases = set()  # Track which aliases have been registered
         self.command_classes = {}  # Store command classes for reloading
+        self.version = 0  # Incremented on every registration, e.g. to rebuild completion
     
     def register(self, command):
         """Register a command in the registry"""
@@ -23,6 +26,7 @@ class CommandRegistry:
         
         # Register primary command name
         self.commands[command.name] = command
+        self.version += 1
         
         # Register aliases, skipping duplicates silently
         for alias in command.aliases:
@@ -133,7 +137,10 @@ class CommandRegistry:
             return "positive"
         
         # Execute the command
-        return command.execute(player, args)
+        with perf.timer(f"command.{command.name}"):
+            if should_profile(command.name):
+                return profile_call(input_text.strip(), command.execute, player, args)
+            return command.execute(player, args)
 
 # Create a singleton instance of CommandRegistry for use across the application
 cmd_registry = CommandRegistry()
@@ -1,15 +1,19 @@
 """
 Scanner command handlers for celestial body detection.
 """
-import time
-from src.world.scanner import handle_scan, scan_celestial_body
+from src.world.scanner import handle_scan, handle_delta_scan, scan_celestial_body, scan_cache
 from src.world.station import check_coords_for_objects
 from src.config import HIDDEN_SIGNALS
+from src.utils.batch_mode import pause
 
 def handle_scan_command(player):
     """Handle the scan command to scan the current system"""
     handle_scan(player)
 
+def handle_delta_scan_command(player):
+    """Handle scan --delta to show only changes since the last scan"""
+    handle_delta_scan(player)
+
 def handle_specific_scan_command(player, body_name):
     """Handle scanning a specific celestial body"""
     scan_celestial_body(player, body_name)
@@ -39,11 +43,13 @@ def handle_coordinate_scan(player, coords):
     animation_chars = ["⣾", "⣽", "⣻", "⢿", "⡿", "⣟", "⣯", "⣷"]
     for i in range(10):
         print(f"\r{animation_chars[i % len(animation_chars)]} Focusing scanning array... {'▰' * (i+1)}{'▱' * (9-i)} {(i+1)*10}%", end="", flush=True)
-        time.sleep(0.15)
+        pause(0.15)
     print()  # New line after animation
     
-    # Get the result from the coordinates check
-    result = check_coords_for_objects(x, y, player.dimension.name, {"bodies": player.dimension.properties})
+    # Get the result from the coordinates check (does not depend on discoveries, so shared by all players)
+    dimension = player.dimension
+    result = scan_cache.get((dimension.name, "coords", x, y),
+                            lambda: check_coords_for_objects(x, y, dimension.name, {"bodies": dimension.properties}))
     
     # Process and display the results
     if result["found"]:
@@ -62,13 +68,7 @@ def handle_coordinate_scan(player, coords):
             
             # Add to player's discovered objects if not already known
             obj_name = obj["name"]
-            dim_name = player.dimension.name
-            
-            if dim_name not in player.known_bodies:
-                player.known_bodies[dim_name] = []
-                
-            if obj_name not in player.known_bodies[dim_name]:
-                player.known_bodies[dim_name].append(obj_name)
+            if player.known_bodies.add(player.dimension.name, obj_name):
                 print(f"» New discovery added to log: {obj_name}")
                 
         print("===================================")
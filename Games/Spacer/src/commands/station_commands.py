@@ -4,6 +4,7 @@ Station and landing interaction command handlers.
 import time
 from src.world.station import get_station_at_coords, get_city_at_coords
 from src.core.save_manager import SaveManager
+from src.utils.batch_mode import pause
 
 # Create save manager instance for saving after docking/landing
 save_mgr = SaveManager()
@@ -19,7 +20,7 @@ def handle_dock_command(player):
     station = get_station_at_coords(player.x, player.y, player.dimension.name)
     if station:
         print(f"\nDocking at {station.name}...")
-        time.sleep(1)
+        pause(1)
         player.docked_at = station
         
         # Save the game after successful docking
@@ -44,15 +45,20 @@ def handle_dock_command(player):
                 print(f"  {station.name} - Distance: {distance:.1f} units")
             print("\nNavigate to a station's coordinates to dock.")
 
-def handle_station_input(player):
-    """Handle input while docked at a station"""
-    # Display station options only once when first docking
+def show_station_options(player):
+    """Display station options only once when first docking"""
     if not hasattr(player, "_station_options_shown") or player._station_options_shown != player.docked_at.name:
         player.docked_at.display_options()
         player._station_options_shown = player.docked_at.name
-    
+
+def handle_station_input(player):
+    """Handle input while docked at a station"""
+    show_station_options(player)
     user_input = input(f"\n[{player.docked_at.name}] {player.name}> ").strip().lower()
-    
+    return handle_station_command(player, user_input)
+
+def handle_station_command(player, user_input):
+    """Handle one command while docked at a station"""
     # Global commands that work everywhere
     if user_input == "exit" or user_input == "quit":
         # Save before quitting
@@ -187,18 +193,13 @@ def handle_land_command(player, body_name=None):
     dim_name = player.dimension.name
     is_known = False
     
-    if dim_name in player.known_bodies:
-        # Check for the body directly
-        if parent_body in player.known_bodies[dim_name]:
-            is_known = True
-        
-        # If it's on a moon, check if the specific moon is known
-        if parent_moon and not is_known:
-            moon_entry = f"{parent_body}:{parent_moon}"
-            for known_body in player.known_bodies[dim_name]:
-                if known_body == moon_entry:
-                    is_known = True
-                    break
+    # Check for the body directly
+    if player.known_bodies.knows(dim_name, parent_body):
+        is_known = True
+    
+    # If it's on a moon, check if the specific moon is known
+    if parent_moon and not is_known:
+        is_known = player.known_bodies.knows(dim_name, f"{parent_body}:{parent_moon}")
     
     if not is_known:
         print(f"\n✗ Cannot land at {city.name}: You haven't discovered this location yet.")
@@ -209,7 +210,7 @@ def handle_land_command(player, body_name=None):
     print(f"\nInitiating landing sequence on {parent_moon or parent_body}, {city.name}...")
     for i in range(3, 0, -1):
         print(f"Landing in {i}...")
-        time.sleep(0.5)
+        pause(0.5)
     
     landing_location = f"{city.name}"
     if parent_moon:
@@ -229,8 +230,8 @@ def handle_land_command(player, body_name=None):
     save_mgr.save_game(player)
     return
 
-def handle_planet_input(player):
-    """Handle input while landed on a planet or moon"""
+def get_surface_location(player):
+    """Get the city, body, moon and display name of the player's landing site"""
     city_name = player.landed_on
     body_name = getattr(player, "landed_on_body", "Unknown Body")
     moon_name = getattr(player, "landed_on_moon", None)
@@ -238,8 +239,11 @@ def handle_planet_input(player):
     display_location = body_name
     if moon_name:
         display_location = f"{moon_name} (Moon of {body_name})"
-    
-    # Display options only once when first landing
+    return city_name, body_name, moon_name, display_location
+
+def show_surface_options(player):
+    """Display surface options only once when first landing"""
+    city_name, _, _, display_location = get_surface_location(player)
     if not hasattr(player, "_city_options_shown") or player._city_options_shown != city_name:
         print(f"\n== {city_name} on {display_location} ==")
         print("Available commands:")
@@ -251,8 +255,16 @@ def handle_planet_input(player):
         print("  logout     - Save and return to login screen")
         print("  exit/quit  - Save and exit game")
         player._city_options_shown = city_name
-    
-    user_input = input(f"\n[{city_name}] {player.name}> ").strip().lower()
+
+def handle_planet_input(player):
+    """Handle input while landed on a planet or moon"""
+    show_surface_options(player)
+    user_input = input(f"\n[{player.landed_on}] {player.name}> ").strip().lower()
+    return handle_planet_command(player, user_input)
+
+def handle_planet_command(player, user_input):
+    """Handle one command while landed on a planet or moon"""
+    city_name, body_name, moon_name, display_location = get_surface_location(player)
     
     # Global commands that work everywhere
     if user_input == "exit" or user_input == "quit":
@@ -332,7 +344,7 @@ def handle_planet_input(player):
     # Launch command
     elif user_input == "launch":
         print(f"\nLaunching from {city_name} on {display_location}...")
-        time.sleep(1)
+        pause(1)
         player.landed_on = None
         player.landed_on_body = None
         if hasattr(player, "landed_on_moon"):
@@ -356,7 +368,7 @@ def handle_planet_input(player):
     elif user_input == "analyze":
         print("\n== Surface Analysis ==")
         print("Analyzing surface composition...")
-        time.sleep(1)
+        pause(1)
         
         # Adjust the location display based on whether it's a moon or planet
         location_display = display_location
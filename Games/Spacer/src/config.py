@@ -20,6 +20,31 @@ SAVE_DIRECTORY = "saves"
 DIMENSIONS_DIRECTORY = "dimensions"
 DIMENSIONS_CONFIG = "dimensions.json"
 
+# Multiplayer server settings (python -m src.core.game_server)
+SERVER_HOST = "127.0.0.1"
+SERVER_PORT = 4242
+SERVER_MAX_SESSIONS = 64  # Each session can run one command at a time on a worker thread
+
+# Player saves: a snapshot plus an append-only journal of changes since the snapshot
+JOURNAL_COMPACT_BYTES = 64 * 1024  # Rewrite the snapshot once the journal grows past this size
+
+# Latency metrics (perf command)
+METRICS_DIRECTORY = "metrics"
+METRICS_DUMP_ON_LOGOUT = True  # Write the collected metrics to METRICS_DIRECTORY at logout
+
+# Command profiling (profile command or SPACER_PROFILE environment variable)
+PROFILES_DIRECTORY = "profiles"
+PROFILE_TOP_FUNCTIONS = 30
+PROFILE_TOP_ALLOCATIONS = 25
+
+# Command line history of the local game (stored in SAVE_DIRECTORY)
+HISTORY_FILE = ".history"
+HISTORY_LENGTH = 1000
+
+# Command batches ("cmd1; cmd2" lines and the run command)
+SCRIPTS_DIRECTORY = "scripts"  # Searched by run when the file is not found as given
+BATCH_MAX_DEPTH = 8  # Maximum nesting of scripts running other scripts
+
 # Game UI settings
 LOADING_BAR_LENGTH = 40
 ANIMATION_SPEED = 0.1
@@ -37,9 +62,18 @@ NAME_PATTERN = r'^[a-zA-Z0-9_]{3,15}$'
 DEFAULT_SCAN_RANGE = 60
 STARS_ALWAYS_VISIBLE = True  # Stars are always visible regardless of discovery status
 
+# Scan results kept in memory (least recently used entries are dropped first)
+SCAN_CACHE_SIZE = 256
+SCAN_DISTANCE_BAND = 10  # scan --delta reports bodies that moved into another band of this width
+
+# Universe-wide name search (find command)
+FIND_MAX_RESULTS = 20
+FIND_MIN_SIMILARITY = 0.25  # Share of common trigrams needed for a fuzzy match
+
 # Dangerous celestial body types and safety settings
 DANGEROUS_BODY_TYPES = ["Star", "Black Hole", "Pulsar"]
 DANGER_WARNING_DISTANCE = 15  # Distance at which to warn about dangerous celestial bodies
+PATH_SENSOR_RANGE = 3  # Stations and signals this close to a flight path are picked up on the way
 
 # Special hidden coordinates
 HIDDEN_SIGNALS = {
@@ -0,0 +1,91 @@
+"""
+Discovery log storing each dimension's discoveries as a bitset of body IDs.
+"""
+import itertools
+from src.world.dimension import get_dimension
+
+# Unique ID per log, so caches can tell the logs of different players apart
+_log_ids = itertools.count(1)
+
+class DiscoveryLog:
+    def __init__(self, known_bodies=None):
+        self.bits = {}     # Dimension name -> bitset over the dimension's body table
+        self.version = 0   # Incremented on every new discovery
+        self.unsaved = []  # (dimension, name) discovered since the last save
+        self.uid = next(_log_ids)
+        if known_bodies:
+            self.load(known_bodies)
+    
+    def load(self, known_bodies):
+        """Load discoveries from the save format ({dimension: [names]})"""
+        for dim_name, names in known_bodies.items():
+            # Older saves stored the names as dictionary keys
+            if isinstance(names, dict):
+                names = list(names.keys())
+            try:
+                table = get_dimension(dim_name).body_table
+            except ValueError as e:
+                print(f"Warning: Skipping discoveries in {dim_name}: {e}")
+                continue
+            bits = self.bits.get(dim_name, 0)
+            for name in names:
+                bits |= 1 << table.get_id(name)
+            self.bits[dim_name] = bits
+    
+    def add(self, dim_name, name):
+        """Record a discovery, returns True if it is new"""
+        bit = 1 << get_dimension(dim_name).body_table.get_id(name)
+        bits = self.bits.get(dim_name, 0)
+        if bits & bit:
+            return False
+        self.bits[dim_name] = bits | bit
+        self.version += 1
+        self.unsaved.append((dim_name, name))
+        return True
+    
+    def knows(self, dim_name, name):
+        """Check if a body has been discovered in a dimension"""
+        bits = self.bits.get(dim_name, 0)
+        if not bits:
+            return False
+        body_id = get_dimension(dim_name).body_table.ids.get(name)
+        return body_id is not None and bool(bits >> body_id & 1)
+    
+    def names(self, dim_name):
+        """Discovery names of a dimension in body table order"""
+        bits = self.bits.get(dim_name, 0)
+        if not bits:
+            return []
+        table = get_dimension(dim_name).body_table
+        return [table.names[i] for i in range(bits.bit_length()) if bits >> i & 1]
+    
+    def count(self, dim_name=None):
+        """Number of discoveries in one dimension or in all of them"""
+        if dim_name is not None:
+            return self.bits.get(dim_name, 0).bit_count()
+        return sum(bits.bit_count() for bits in self.bits.values())
+    
+    def dimensions(self):
+        """Names of all dimensions with at least one discovery"""
+        return [dim_name for dim_name, bits in self.bits.items() if bits]
+    
+    def tree(self, dim_name):
+        """Discovered top-level bodies sorted by name, each with its discovered moons"""
+        bits = self.bits.get(dim_name, 0)
+        table = get_dimension(dim_name).body_table
+        tree = []
+        for body_id in table.sorted_ids():
+            if table.parents[body_id] is not None or not bits >> body_id & 1:
+                continue
+            moons = [table.labels[i] for i in table.children.get(body_id, []) if bits >> i & 1]
+            tree.append((table.labels[body_id], moons))
+        return tree
+    
+    def take_unsaved(self):
+        """Return the discoveries made since the last call and forget them"""
+        unsaved, self.unsaved = self.unsaved, []
+        return unsaved
+    
+    def to_dict(self):
+        """Discoveries in the save format ({dimension: [names]})"""
+        return {dim_name: self.names(dim_name) for dim_name in self.bits}
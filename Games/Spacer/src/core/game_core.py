@@ -9,6 +9,8 @@ from src.core.save_manager import SaveManager
 from src.utils.ui_display import display_help, display_loading_animation
 from src.commands.command_manager import handle_input, initialize_commands
 from src.world.station import load_all_stations
+from src.utils.perf import dump_metrics_on_logout
+from src.utils.line_editor import line_editor
 
 # Global save manager instance
 save_mgr = SaveManager()
@@ -99,7 +101,7 @@ def create_new_captain():
         return name, False, True  # New captain, don't load save, show tutorial
 
 def update_playtime(player_obj, session_start):
-    """Update player's total playtime by adding the current session time"""
+    """Update player's total playtime by adding the current session time and save, returns True if saved"""
     try:
         session_end = datetime.datetime.now()
         session_duration = (session_end - session_start).total_seconds()
@@ -108,10 +110,59 @@ def update_playtime(player_obj, session_start):
             player_obj.playtime += session_duration
         else:
             player_obj.playtime = session_duration
-            
-        save_mgr.save_game(player_obj)
+        
+        # Logging out writes the full snapshot and clears the journal
+        return save_mgr.save_game(player_obj, compact=True)
     except Exception as e:
         print(f"Error updating playtime: {e}")
+        return False
+
+def load_player(name, load_save, show_help):
+    """Create the player for a session, restoring their save if requested"""
+    # Create player with name but don't set position yet - will be set by load_save_data for existing players
+    player = Player(name, set_default_position=not load_save)
+    
+    # Load saved game if requested
+    if load_save:
+        save_data = save_mgr.load_game(name)
+        if player.load_save_data(save_data):
+            print(f"\nWelcome back, Captain {name}!")
+            
+            # Check if player was docked or landed and inform them
+            if player.docked_at:
+                print(f"You are currently docked at {player.docked_at.name}.")
+            elif player.landed_on:
+                location = player.landed_on
+                if player.landed_on_moon:
+                    print(f"You are currently on the surface of {location} on {player.landed_on_moon}, Moon of {player.landed_on_body}.")
+                else:
+                    print(f"You are currently on the surface of {location} on {player.landed_on_body}.")
+            else:
+                print(f"Resuming from {player.dimension.title}, coordinates [{player.x}, {player.y}]")
+            
+            # Parse playtime from save data
+            if "playtime" in save_data:
+                playtime_str = save_data["playtime"]
+                player.playtime = save_mgr.parse_playtime(playtime_str)
+            else:
+                player.playtime = 0
+            
+            # Load creation date and last login from save
+            if "creation_date" in save_data:
+                player.creation_date = save_data["creation_date"]
+        else:
+            print("\nError loading save. Starting new game.")
+            show_help = True
+            player.playtime = 0
+            player.creation_date = datetime.datetime.now().isoformat()
+    else:
+        # New player
+        player.playtime = 0
+        player.creation_date = datetime.datetime.now().isoformat()
+    
+    # Record session start time
+    player.session_start = datetime.datetime.now()
+    return player, show_help
 
 def main_game_loop():
     """Main game loop that handles player sessions"""
@@ -128,51 +179,13 @@ def main_game_loop():
             # Load all stations first to ensure they're available when restoring player state
             print("\nLoading station data...")
             load_all_stations()
-                
-            # Create player with name but don't set position yet - will be set by load_save_data for existing players
-            player = Player(name, set_default_position=not load_save)
-            
-            # Load saved game if requested
-            if load_save:
-                save_data = save_mgr.load_game(name)
-                if player.load_save_data(save_data):
-                    print(f"\nWelcome back, Captain {name}!")
-                    
-                    # Check if player was docked or landed and inform them
-                    if player.docked_at:
-                        print(f"You are currently docked at {player.docked_at.name}.")
-                    elif player.landed_on:
-                        location = player.landed_on
-                        if player.landed_on_moon:
-                            print(f"You are currently on the surface of {location} on {player.landed_on_moon}, Moon of {player.landed_on_body}.")
-                        else:
-                            print(f"You are currently on the surface of {location} on {player.landed_on_body}.")
-                    else:
-                        print(f"Resuming from {player.dimension.title}, coordinates [{player.x}, {player.y}]")
-                    
-                    # Parse playtime from save data
-                    if "playtime" in save_data:
-                        playtime_str = save_data["playtime"]
-                        player.playtime = save_mgr.parse_playtime(playtime_str)
-                    else:
-                        player.playtime = 0
-                    
-                    # Load creation date and last login from save
-                    if "creation_date" in save_data:
-                        player.creation_date = save_data["creation_date"]
-                else:
-                    print("\nError loading save. Starting new game.")
-                    show_help = True
-                    player.playtime = 0
-                    player.creation_date = datetime.datetime.now().isoformat()
-            else:
-                # New player
-                player.playtime = 0
-                player.creation_date = datetime.datetime.now().isoformat()
             
-            # Record session start time
-            session_start = datetime.datetime.now()
-            player.session_start = session_start
+            player, show_help = load_player(name, load_save, show_help)
+            session_start = player.session_start
+            
+            # History and tab completion for commands and known names
+            line_editor.setup()
+            line_editor.attach(player)
             
             # Show help menu for new players
             if show_help:
@@ -186,11 +199,13 @@ def main_game_loop():
                     # Exit game entirely
                     running = False
                     update_playtime(player, session_start)
+                    dump_metrics_on_logout(player)
                     return
                 elif check == "logout":
                     # Return to login screen
                     running = False
                     update_playtime(player, session_start)
+                    dump_metrics_on_logout(player)
                     # Don't print duplicate logout messages - they're now handled in the input handlers
                     time.sleep(1)
                     # Removed the os.system("clear") command to prevent clearing the console on logout
@@ -198,8 +213,8 @@ def main_game_loop():
         except KeyboardInterrupt:
             # Handle Ctrl+C gracefully
             print("\n\nEmergency shutdown initiated. Saving game...")
-            update_playtime(player, session_start)
-            if save_mgr.save_game(player):
+            # update_playtime already writes the full snapshot
+            if update_playtime(player, session_start):
                 print("Game saved successfully. Goodbye!")
             else:
                 print("Warning: Game could not be saved.")
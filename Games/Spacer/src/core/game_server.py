@@ -0,0 +1,312 @@
+"""
+Multiplayer server that hosts many captains in one process.
+
+All sessions share the loaded universe (dimension cache, body tables and stations)
+and the command registry; every session has its own Player. Clients talk a plain
+line protocol over TCP or a Unix socket, e.g. `nc localhost 4242`.
+"""
+import argparse
+import asyncio
+import datetime
+import io
+import queue
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from src.config import SERVER_HOST, SERVER_PORT, SERVER_MAX_SESSIONS, GAME_TITLE
+from src.core.game_core import load_player, update_playtime, save_mgr
+from src.commands.command_manager import initialize_commands, execute_line, get_prompt, show_context
+from src.utils.ui_display import display_help
+from src.world.station import load_all_stations
+from src.utils.perf import dump_metrics_on_logout
+
+# Session bound to the current worker thread, used to route print() and input()
+_current = threading.local()
+
+class SessionStdout:
+    """sys.stdout replacement that sends output to the session of the current thread"""
+    def __init__(self, console):
+        self.console = console
+    
+    def write(self, text):
+        session = getattr(_current, "session", None)
+        if session is None:
+            return self.console.write(text)
+        session.send(text)
+        return len(text)
+    
+    def flush(self):
+        if getattr(_current, "session", None) is None:
+            self.console.flush()
+    
+    def fileno(self):
+        # Makes input() use write/readline instead of the console for sessions
+        if getattr(_current, "session", None) is not None:
+            raise io.UnsupportedOperation("fileno")
+        return self.console.fileno()
+    
+    def isatty(self):
+        return False
+    
+    def __getattr__(self, name):
+        return getattr(self.console, name)
+
+class SessionStdin:
+    """sys.stdin replacement that reads lines the client sent while a command is running"""
+    def __init__(self, console):
+        self.console = console
+    
+    def readline(self, size=-1):
+        session = getattr(_current, "session", None)
+        if session is None:
+            return self.console.readline(size)
+        return session.read_line()
+    
+    def fileno(self):
+        if getattr(_current, "session", None) is not None:
+            raise io.UnsupportedOperation("fileno")
+        return self.console.fileno()
+    
+    def isatty(self):
+        return False
+    
+    def __getattr__(self, name):
+        return getattr(self.console, name)
+
+class Session:
+    """One connected captain"""
+    def __init__(self, server, writer):
+        self.server = server
+        self.loop = server.loop
+        self.writer = writer
+        self.lines = queue.Queue()  # Answers to input() prompts of the running command
+        self.waiting = False        # True while an input() prompt waits for exactly one answer
+        self.player = None
+        self.closed = False
+    
+    def send(self, text):
+        """Send text to the client, safe to call from worker threads"""
+        if not self.closed:
+            self.loop.call_soon_threadsafe(self._write, text.encode("utf-8", errors="replace"))
+    
+    def _write(self, data):
+        if not self.writer.is_closing():
+            self.writer.write(data)
+    
+    def read_line(self):
+        """Block the worker thread until the client sends a line ("" once disconnected)"""
+        self.waiting = True
+        line = self.lines.get()
+        return "" if line is None else line + "\n"
+    
+    def run(self, function, *args):
+        """Run a game function on the current worker thread with this session's I/O"""
+        _current.session = self
+        try:
+            return function(*args)
+        except EOFError:
+            # Client disconnected while a command was waiting for input
+            return "logout"
+        finally:
+            _current.session = None
+    
+    async def call(self, function, *args):
+        return await self.loop.run_in_executor(self.server.executor, self.run, function, *args)
+
+def login(server):
+    """Ask for a captain name and load or create that captain (runs on a worker thread)"""
+    print(f"\n{GAME_TITLE}")
+    print(f"Captains online: {len(server.online)}")
+    while True:
+        name = input("\nEnter captain name, 'new' for a new captain, or 'exit' to quit: ").strip()
+        if not name or name.lower() == "exit":
+            return None
+        
+        if name.lower() == "new":
+            name = input("Who are you, Captain? ").strip()
+            if not save_mgr.is_valid_player_name(name):
+                print("\n⚠ Invalid name. Names must be 3-15 characters long and can contain letters, numbers and underscores.")
+                continue
+            if save_mgr.player_exists(name):
+                print(f"\n⚠ A captain named {name} already exists. Choose another name.")
+                continue
+            load_save = False
+        elif save_mgr.player_exists(name):
+            if save_mgr.is_player_dead(name):
+                print(f"\n☠ Captain {name} is deceased. Their journey has ended.")
+                continue
+            # Use the exact name stored in the save
+            name = save_mgr.load_game(name)["name"]
+            load_save = True
+        else:
+            print("Captain not found. Please try again.")
+            continue
+        
+        if not server.claim(name):
+            print(f"\n⚠ Captain {name} is already online.")
+            continue
+        
+        player, show_help = load_player(name, load_save, not load_save)
+        if show_help:
+            display_help(first_time=True)
+        return player
+
+def prompt(player):
+    """Show station/surface menus if needed and the prompt for the next command"""
+    show_context(player)
+    print(get_prompt(player), end="")
+
+class GameServer:
+    def __init__(self):
+        self.loop = None
+        self.executor = ThreadPoolExecutor(max_workers=SERVER_MAX_SESSIONS, thread_name_prefix="session")
+        self.online = set()  # Lowercase names of captains in a session
+        self.online_lock = threading.Lock()
+        self.sessions = 0
+    
+    def claim(self, name):
+        """Reserve a captain for one session, False if someone is already playing them"""
+        with self.online_lock:
+            if name.lower() in self.online:
+                return False
+            self.online.add(name.lower())
+            return True
+    
+    def release(self, name):
+        with self.online_lock:
+            self.online.discard(name.lower())
+    
+    def load_universe(self):
+        """Load commands, dimensions and stations once for all sessions"""
+        initialize_commands()
+        load_all_stations()
+    
+    async def handle_client(self, reader, writer):
+        if self.sessions >= SERVER_MAX_SESSIONS:
+            writer.write(b"Server full. Try again later.\n")
+            await writer.drain()
+            writer.close()
+            return
+        
+        self.sessions += 1
+        session = Session(self, writer)
+        peer = writer.get_extra_info("peername")
+        print(f"Session opened: {peer}")
+        running = None  # Future of the command or login currently running for this session
+        
+        try:
+            running = self.start(session, self.start_session, session)
+            while True:
+                data = await reader.readline()
+                if not data:
+                    break
+                line = data.decode("utf-8", errors="replace").rstrip("\r\n")
+                
+                # While something runs, a line answers its input() prompt. Lines typed ahead of a
+                # command's prompt are rejected, so a later prompt (e.g. "proceed anyway?") never
+                # reads a stale answer; login only asks for names and takes lines in advance.
+                if not running.done():
+                    if session.waiting or session.player is None:
+                        session.waiting = False
+                        session.lines.put(line)
+                    else:
+                        session.send(f"\n⚠ Still busy, input ignored: {line}\n")
+                    continue
+                
+                if session.player is None:
+                    break
+                running = self.start(session, self.run_command, session, line)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            await self.close_session(session, running)
+            print(f"Session closed: {peer}")
+    
+    def start(self, session, function, *args):
+        """Start a game function for the session on a worker thread"""
+        running = asyncio.ensure_future(session.call(function, *args))
+        running.add_done_callback(lambda future: self.after_command(session, future))
+        return running
+    
+    def start_session(self, session):
+        """Log in a captain for the session (runs on a worker thread)"""
+        player = login(self)
+        if player is None:
+            return "negative"
+        session.player = player
+        prompt(player)
+        return "positive"
+    
+    def run_command(self, session, line):
+        """Execute one command line for the session (runs on a worker thread)"""
+        result = execute_line(session.player, line)
+        if session.player.is_dead:
+            result = "negative"
+        if result not in ("negative", "logout"):
+            prompt(session.player)
+        return result
+    
+    def after_command(self, session, future):
+        """Close the connection once a command ends the session"""
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            session.send(f"\nUnexpected error: {future.exception()}\n")
+            if session.player is not None:
+                session.send(get_prompt(session.player))
+            return
+        if future.result() in ("negative", "logout"):
+            session.writer.close()
+    
+    async def close_session(self, session, running):
+        # Unblock a command that is still waiting for input and let it finish
+        session.lines.put(None)
+        if running is not None:
+            try:
+                await running
+            except Exception:
+                pass
+        
+        if session.player is not None:
+            await session.call(update_playtime, session.player, session.player.session_start)
+            await session.call(dump_metrics_on_logout, session.player)
+            self.release(session.player.name)
+        session.closed = True
+        self.sessions -= 1
+        if not session.writer.is_closing():
+            session.writer.close()
+    
+    async def serve(self, host=None, port=None, unix_path=None):
+        self.loop = asyncio.get_running_loop()
+        
+        # Route print()/input() of worker threads to their sessions
+        sys.stdout = SessionStdout(sys.__stdout__)
+        sys.stdin = SessionStdin(sys.__stdin__)
+        
+        print("Loading universe...")
+        await self.loop.run_in_executor(self.executor, self.load_universe)
+        
+        if unix_path:
+            server = await asyncio.start_unix_server(self.handle_client, path=unix_path)
+            print(f"Spacer server listening on {unix_path}")
+        else:
+            server = await asyncio.start_server(self.handle_client, host or SERVER_HOST, port or SERVER_PORT)
+            print(f"Spacer server listening on {host or SERVER_HOST}:{port or SERVER_PORT}")
+        
+        async with server:
+            await server.serve_forever()
+
+def main():
+    parser = argparse.ArgumentParser(description="Host many Spacer captains in one process")
+    parser.add_argument("--host", default=SERVER_HOST, help="Address to listen on")
+    parser.add_argument("--port", type=int, default=SERVER_PORT, help="TCP port to listen on")
+    parser.add_argument("--unix", metavar="PATH", help="Listen on a Unix socket instead of TCP")
+    args = parser.parse_args()
+    
+    try:
+        asyncio.run(GameServer().serve(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        print("\nServer stopped.")
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,8 @@ Player class with core attributes and state tracking.
 """
 import uuid
 from src.world.station import STATIONS
-from src.world.dimension import Dimension
+from src.world.dimension import get_dimension
+from src.core.discovery_log import DiscoveryLog
 from src.config import DEFAULT_START_POSITION, DEFAULT_START_DIMENSION, DEFAULT_START_LANDED, DEFAULT_START_CITY, DEFAULT_START_BODY, DEFAULT_START_MOON
 
 class Player:
@@ -13,7 +14,7 @@ class Player:
         if set_default_position:
             self.x = DEFAULT_START_POSITION["x"]
             self.y = DEFAULT_START_POSITION["y"]
-            self.dimension = Dimension(DEFAULT_START_DIMENSION)
+            self.dimension = get_dimension(DEFAULT_START_DIMENSION)
             self.known_dimensions = [DEFAULT_START_DIMENSION]  # Start with the first dimension as known
             self.landed_on = DEFAULT_START_CITY if DEFAULT_START_LANDED else None
             self.landed_on_body = DEFAULT_START_BODY if DEFAULT_START_LANDED else None
@@ -28,13 +29,15 @@ class Player:
             self.landed_on_body = None
             self.landed_on_moon = None
             
-        self.known_bodies = {}  # Dictionary for discovered celestial bodies by dimension
+        self.known_bodies = DiscoveryLog()  # Discovered celestial bodies by dimension
         self.uuid = str(uuid.uuid4())  # Generate unique ID for the player
         self.creation_date = None  # Will be set during game initialization
         self.playtime = 0  # Playtime in seconds
         self.last_login = None  # Will be updated when saving
         self.is_dead = False  # Player's living status
         self.docked_at = None  # Will hold station object when docked
+        self.saved_state = None  # Journal state at the last save, see SaveManager.save_game
+        self.scan_snapshots = {}  # Dimension name -> result of the last scan, see scan --delta
     
     def change_name(self, new_name):
         """Change the player's name"""
@@ -82,7 +85,7 @@ class Player:
                 if "dimension" in position:
                     # Load the dimension object
                     dim_name = position["dimension"]
-                    self.dimension = Dimension(dim_name)
+                    self.dimension = get_dimension(dim_name)
             
             # Load discoveries
             if "discoveries" in save_data:
@@ -92,11 +95,7 @@ class Player:
                     self.known_dimensions = discoveries["known_dimensions"]
                 # Load discovered celestial bodies
                 if "known_bodies" in discoveries:
-                    self.known_bodies = discoveries["known_bodies"]
-                    # Ensure each dimension value is a list, not a dict
-                    for dim_name in self.known_bodies:
-                        if isinstance(self.known_bodies[dim_name], dict):
-                            self.known_bodies[dim_name] = list(self.known_bodies[dim_name].keys())
+                    self.known_bodies = DiscoveryLog(discoveries["known_bodies"])
             
             # Load creation date
             if "creation_date" in save_data:
@@ -132,11 +131,35 @@ class Player:
             if "landed_on_moon" in save_data and save_data["landed_on_moon"]:
                 self.landed_on_moon = save_data["landed_on_moon"]
             
+            # The loaded state is already on disk
+            self.known_bodies.take_unsaved()
+            self.saved_state = self.get_journal_state()
+            
             return True  # Successfully loaded save data
         except Exception as e:
             print(f"Error loading save data: {e}")
             return False  # Failed to load save data
     
+    def get_docked_station_id(self):
+        """Get the STATIONS id of the station the player is docked at"""
+        for sid, station in STATIONS.items():
+            if station is self.docked_at:
+                return sid
+        return None
+    
+    def get_journal_state(self):
+        """Small, fixed-size part of the player state that the save journal tracks"""
+        return {
+            "name": self.name,
+            "x": self.x,
+            "y": self.y,
+            "dimension": self.dimension.name if self.dimension else None,
+            "known_dimensions": list(self.known_dimensions),
+            "docked_at": self.get_docked_station_id() if self.docked_at else None,
+            "landed": [self.landed_on, self.landed_on_body, getattr(self, "landed_on_moon", None)],
+            "is_dead": self.is_dead
+        }
+    
     def get_save_data(self):
         """Get player data to save"""
         data = {
@@ -149,7 +172,7 @@ class Player:
             },
             "discoveries": {
                 "known_dimensions": self.known_dimensions,
-                "known_bodies": self.known_bodies
+                "known_bodies": self.known_bodies.to_dict()
             },
             "creation_date": self.creation_date,
             "last_login": self.last_login,
@@ -162,11 +185,7 @@ class Player:
         # Save docked status
         if self.docked_at:
             # Find station id
-            station_id = None
-            for sid, station in STATIONS.items():
-                if station is self.docked_at:
-                    station_id = sid
-                    break
+            station_id = self.get_docked_station_id()
                     
             # Make sure we found a station ID
             if station_id:
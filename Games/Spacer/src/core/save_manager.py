@@ -7,7 +7,9 @@ import re
 import sys
 from pathlib import Path
 import datetime
-from src.config import RESERVED_NAMES, NAME_PATTERN
+from src.config import RESERVED_NAMES, NAME_PATTERN, JOURNAL_COMPACT_BYTES
+from src.utils.perf import perf
+from src.utils.batch_mode import in_batch
 
 class SaveManager:
     def __init__(self):
@@ -118,8 +120,126 @@ class SaveManager:
         except Exception:
             return 0  # Default to 0 if parsing fails
 
-    def save_game(self, player):
-        """Save the game data to a JSON file"""
+    def journal_path(self, player_uuid):
+        """Path of the journal holding a player's changes since their snapshot"""
+        return self.save_directory / f"{player_uuid}.journal"
+    
+    def get_journal_events(self, player, state):
+        """Describe the changes since the last save as small journal events"""
+        saved = player.saved_state
+        events = []
+        
+        if state["dimension"] != saved["dimension"]:
+            events.append({"event": "jumped", "dimension": state["dimension"], "x": state["x"], "y": state["y"]})
+        elif state["x"] != saved["x"] or state["y"] != saved["y"]:
+            events.append({"event": "moved", "x": state["x"], "y": state["y"]})
+        
+        for dim_name in state["known_dimensions"]:
+            if dim_name not in saved["known_dimensions"]:
+                events.append({"event": "charted", "dimension": dim_name})
+        
+        for dim_name, name in player.known_bodies.take_unsaved():
+            events.append({"event": "discovered", "dimension": dim_name, "name": name})
+        
+        if state["docked_at"] != saved["docked_at"]:
+            if state["docked_at"]:
+                events.append({"event": "docked", "station": state["docked_at"]})
+            else:
+                events.append({"event": "undocked"})
+        
+        if state["landed"] != saved["landed"]:
+            if state["landed"][0]:
+                on, body, moon = state["landed"]
+                events.append({"event": "landed", "on": on, "body": body, "moon": moon})
+            else:
+                events.append({"event": "launched"})
+        
+        return events
+    
+    def apply_journal_event(self, data, event):
+        """Apply one journal event to save data loaded from a snapshot"""
+        kind = event.get("event")
+        position = data.setdefault("position", {})
+        discoveries = data.setdefault("discoveries", {})
+        
+        if kind == "moved":
+            position["x"] = event["x"]
+            position["y"] = event["y"]
+        elif kind == "jumped":
+            position.update(dimension=event["dimension"], x=event["x"], y=event["y"])
+        elif kind == "charted":
+            known_dimensions = discoveries.setdefault("known_dimensions", [])
+            if event["dimension"] not in known_dimensions:
+                known_dimensions.append(event["dimension"])
+        elif kind == "discovered":
+            bodies = discoveries.setdefault("known_bodies", {}).setdefault(event["dimension"], [])
+            if event["name"] not in bodies:
+                bodies.append(event["name"])
+        elif kind == "docked":
+            data["docked_at"] = event["station"]
+        elif kind == "undocked":
+            data["docked_at"] = None
+        elif kind == "landed":
+            data.update(landed_on=event["on"], landed_on_body=event["body"], landed_on_moon=event["moon"])
+        elif kind == "launched":
+            data.update(landed_on=None, landed_on_body=None, landed_on_moon=None)
+    
+    def replay_journal(self, data, player_uuid):
+        """Apply the journal written since the snapshot, e.g. after a crash"""
+        path = self.journal_path(player_uuid)
+        if not path.exists():
+            return data
+        with open(path, 'r') as f:
+            for line in f:
+                try:
+                    self.apply_journal_event(data, json.loads(line))
+                except (json.JSONDecodeError, KeyError):
+                    # A crash can leave the last line incomplete
+                    continue
+        return data
+    
+    @perf.timed("save.game")
+    def save_game(self, player, compact=False):
+        """
+        Save the game data.
+        
+        Changes since the last save are appended to the player's journal, so the cost
+        does not grow with the discovery log. The full snapshot is rewritten (and the
+        journal emptied) for new players, on name changes and death, when compact is
+        set (logout) and once the journal grows past JOURNAL_COMPACT_BYTES.
+        Saves during a command batch are skipped, the batch saves once when it ends.
+        """
+        if in_batch() and not compact:
+            return True
+        
+        try:
+            state = player.get_journal_state()
+            saved = player.saved_state
+            snapshot_path = self.save_directory / f"{player.uuid}.json"
+            
+            if (compact or saved is None or not snapshot_path.exists()
+                    or state["name"] != saved["name"] or state["is_dead"] != saved["is_dead"]):
+                return self.write_snapshot(player, state)
+            
+            events = self.get_journal_events(player, state)
+            if not events:
+                return True
+            
+            with open(self.journal_path(player.uuid), 'a') as f:
+                f.write("".join(json.dumps(event) + "\n" for event in events))
+                journal_size = f.tell()
+            player.saved_state = state
+            
+            if journal_size > JOURNAL_COMPACT_BYTES:
+                return self.write_snapshot(player, state)
+            return True
+        except Exception as e:
+            print(f"Error saving game: {e}")
+            return False
+    
+    @perf.timed("save.snapshot")
+    def write_snapshot(self, player, state):
+        """Write the full save file and start a new, empty journal"""
         try:
             # Get save data from player
             save_data = player.get_save_data()
@@ -147,16 +267,26 @@ class SaveManager:
             # Update last login time
             save_data["last_login"] = datetime.datetime.now().strftime("%d.%m.%y - %H:%M")
             
-            # Save to file using player's UUID
+            # Save to file using player's UUID; replace atomically so a crash keeps the old snapshot
             file_path = self.save_directory / f"{player.uuid}.json"
-            with open(file_path, 'w') as f:
+            temp_path = file_path.with_suffix(".tmp")
+            with open(temp_path, 'w') as f:
                 json.dump(save_data, f, indent=4)
+            os.replace(temp_path, file_path)
+            
+            # The snapshot contains everything the journal recorded
+            journal_path = self.journal_path(player.uuid)
+            if journal_path.exists():
+                journal_path.unlink()
+            player.known_bodies.take_unsaved()
+            player.saved_state = state
                 
             return True
         except Exception as e:
             print(f"Error saving game: {e}")
             return False
     
+    @perf.timed("save.load")
     def load_game(self, player_name):
         """Load a player's game state from their save file"""
         # We need to search for the player by name in all save files
@@ -166,6 +296,10 @@ class SaveManager:
                     data = json.load(f)
                     # Case-insensitive name comparison
                     if data.get("name", "").lower() == player_name.lower():
+                        # Apply changes recorded after the snapshot
+                        if "uuid" in data:
+                            self.replay_journal(data, data["uuid"])
+                        
                         # Don't allow loading dead players
                         if data.get("is_dead", False):
                             print(f"\n☠ Captain {data['name']} is deceased. Their journey has ended.")
@@ -2,10 +2,10 @@
 Navigation functions for the Spacer game.
 Handles movement and dimension jumping.
 """
-import time
-from src.world.dimension import Dimension
+from src.world.dimension import get_dimension
 from src.core.save_manager import SaveManager
-from src.world.station import load_stations_from_dimension
+from src.world.spatial_index import sweep_path, get_hazard_bounds
+from src.utils.batch_mode import pause
 
 # Create save manager instance
 save_mgr = SaveManager()
@@ -43,7 +43,7 @@ def perform_move(player, x, y):
             progress = int((i+1)/distance * 20)
             bar = "█" * progress + "▒" * (20 - progress)
             print(f"\r[{bar}] {i+1}/{distance} units traveled", end="", flush=True)
-            time.sleep(0.1)
+            pause(0.1)
         
         # Player has arrived at the star and is now dead
         print(f"\nYou've reached coordinates [{x}, {y}]")
@@ -67,6 +67,35 @@ def perform_move(player, x, y):
     # Calculate distance (which is also movement time)
     distance = max(abs(player.x - x), abs(player.y - y))
     
+    # Check the whole course, not only the destination: flying through a star is fatal too
+    path_hits = sweep_path(player, x, y)
+    crossing = next((hit for hit in path_hits if hit.kind == "hazard" and hit.step < distance), None)
+    if crossing:
+        print(f"\n⚠️  WARNING: Your course to [{x}, {y}] passes through {crossing.name} ({crossing.type})!")
+        print(f"The ship would enter it at [{crossing.point[0]}, {crossing.point[1]}] and be destroyed.")
+        
+        confirm = input("\nDo you want to proceed anyway? (y/n): ").strip().lower()
+        if confirm != 'y':
+            print("\nNavigation aborted. Staying at current position.")
+            return False
+        
+        print(f"\nNavigating to coordinates [{x}, {y}]...")
+        for i in range(crossing.step):
+            progress = int((i+1)/distance * 20)
+            bar = "█" * progress + "▒" * (20 - progress)
+            print(f"\r[{bar}] {i+1}/{distance} units traveled", end="", flush=True)
+            pause(0.1)
+        
+        print(f"\n\n⚠️ CRITICAL ERROR: Entering {crossing.name}! Temperature exceeding safe limits!")
+        print("\n☠️ Your ship has been incinerated by intense stellar radiation.")
+        print("\nYou are dead. Type 'restart' to begin a new game.")
+        
+        # The ship never got past the hazard
+        player.x, player.y = crossing.point
+        player.is_dead = True
+        save_mgr.save_game(player)
+        return True
+    
     # Start movement
     print(f"\nNavigating to coordinates [{x}, {y}]...")
     
@@ -75,10 +104,17 @@ def perform_move(player, x, y):
         progress = int((i+1)/distance * 20)
         bar = "█" * progress + "▒" * (20 - progress)
         print(f"\r[{bar}] {i+1}/{distance} units traveled", end="", flush=True)
-        time.sleep(0.1)
+        pause(0.1)
     
     print(f"\nArrived at coordinates [{x}, {y}]")
     
+    # Report what the sensors picked up along the way
+    for hit in path_hits:
+        if hit.kind == "station" and hit.coords != (x, y):
+            print(f"» Passed {hit.name} ({hit.type}) at [{hit.coords[0]}, {hit.coords[1]}].")
+        elif hit.kind == "signal":
+            print(f"» Sensors picked up an unknown signal near [{hit.point[0]}, {hit.point[1]}].")
+    
     # Update player position
     player.x = x
     player.y = y
@@ -90,7 +126,7 @@ def perform_move(player, x, y):
 
 def is_inside_star(player, dest_x, dest_y):
     """
-    Check if the destination coordinates are inside a star
+    Check if the destination coordinates are inside a star or black hole
     
     Args:
         player: The player object
@@ -105,29 +141,14 @@ def is_inside_star(player, dest_x, dest_y):
         
     dimension = player.dimension
     
-    # Check all bodies in the dimension
-    for body_name, body_data in dimension.properties.items():
-        # Only check stars
-        if body_data.get("type", "").lower() == "star" and "Coordinates" in body_data and "size" in body_data:
-            try:
-                star_x = int(body_data["Coordinates"]["x"])
-                star_y = int(body_data["Coordinates"]["y"])
-                
-                # Get the star's boundaries directly from size
-                # The size represents how far the star extends in each direction from its center
-                star_width = int(body_data["size"]["width"])
-                star_height = int(body_data["size"]["height"])
-                
-                # Check if destination is within the star's boundaries
-                # If dest_x is between (star_x - star_width) and (star_x + star_width)
-                # AND dest_y is between (star_y - star_height) and (star_y + star_height)
-                if (star_x - star_width <= dest_x <= star_x + star_width and 
-                    star_y - star_height <= dest_y <= star_y + star_height):
-                    return True
-            except (ValueError, KeyError):
-                # Skip if we can't parse the coordinates or size properly
-                continue
-                
+    # Same bounds as the path sweep uses, so arriving in a hazard and passing through it agree
+    for body_data in dimension.properties.values():
+        bounds = get_hazard_bounds(body_data)
+        if bounds is not None:
+            min_x, max_x, min_y, max_y = bounds
+            if min_x <= dest_x <= max_x and min_y <= dest_y <= max_y:
+                return True
+    
     return False
 
 def perform_jump(player, dimension_name):
@@ -143,7 +164,7 @@ def perform_jump(player, dimension_name):
     """
     # Check if dimension exists
     try:
-        new_dimension = Dimension(dimension_name)
+        new_dimension = get_dimension(dimension_name)
     except Exception as e:
         print(f"\n✗ Jump failed: {str(e)}")
         return False
@@ -159,7 +180,7 @@ def perform_jump(player, dimension_name):
         bar = "█" * progress + "▒" * (20 - progress)
         status = f"{char}Jump in progress [{bar}] {(i+1)*10}%"
         print(f"\r{status}", end="", flush=True)
-        time.sleep(0.2)
+        pause(0.2)
     print()  # New line after animation
     
     # Set new dimension
@@ -177,9 +198,6 @@ def perform_jump(player, dimension_name):
     # Clear screen and show message
     print(f"\nJump complete! Welcome to {new_dimension.title}.")
     
-    # Load stations for this dimension
-    load_stations_from_dimension({'bodies': new_dimension.properties}, dimension_name)
-    
     # Check location after jump
     check_location(player)
     
@@ -198,12 +216,7 @@ def check_location(player):
             body_y = int(body_data["Coordinates"]["y"])
             if body_x == player.x and body_y == player.y:
                 # Check if this is a new discovery
-                is_new = False
-                if dimension.name not in player.known_bodies:
-                    player.known_bodies[dimension.name] = []
-                if body_name not in player.known_bodies[dimension.name]:
-                    player.known_bodies[dimension.name].append(body_name)
-                    is_new = True
+                is_new = player.known_bodies.add(dimension.name, body_name)
                 
                 # Print discovery message
                 if is_new:
@@ -1,6 +1,7 @@
 """
 Game state management for Spacer.
 """
+from src.core.discovery_log import DiscoveryLog
 
 class GameState:
     def __init__(self, player):
@@ -14,7 +15,7 @@ class GameState:
         self.player.y = 0
         self.player.dimension = None
         self.player.known_dimensions = []
-        self.player.known_bodies = {}
+        self.player.known_bodies = DiscoveryLog()
         self.player.docked_at = None
 
     def process_command(self, command):
@@ -0,0 +1,50 @@
+"""
+Thread-local batch mode: animations are skipped and saves deferred until the batch ends.
+"""
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+_local = threading.local()
+
+class BatchOutput:
+    """Passes output through and counts error lines (✗) printed by threads in batch mode"""
+    def __init__(self, stream):
+        self.stream = stream
+    
+    def write(self, text):
+        if "✗" in text and in_batch():
+            _local.errors = error_count() + 1
+        return self.stream.write(text)
+    
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+def in_batch():
+    """Check if the current thread runs a command batch"""
+    return batch_depth() > 0
+
+def batch_depth():
+    """Number of nested batches running in the current thread"""
+    return getattr(_local, "depth", 0)
+
+def error_count():
+    """Error lines printed by the current thread while in batch mode"""
+    return getattr(_local, "errors", 0)
+
+@contextmanager
+def batch_mode():
+    """Run the enclosed commands as one batch (can be nested)"""
+    if not isinstance(sys.stdout, BatchOutput):
+        sys.stdout = BatchOutput(sys.stdout)
+    _local.depth = batch_depth() + 1
+    try:
+        yield
+    finally:
+        _local.depth -= 1
+
+def pause(seconds):
+    """Sleep for an animation, skipped in batch mode"""
+    if not in_batch():
+        time.sleep(seconds)
@@ -132,6 +132,14 @@ class DataLoader:
         except (FileNotFoundError, json.JSONDecodeError):
             return []
     
+    @staticmethod
+    def get_dimension_files():
+        """Get the data file of every dimension in the dimensions directory by dimension name"""
+        dimensions_dir = DataLoader._get_base_path() / DIMENSIONS_DIRECTORY
+        if not dimensions_dir.exists():
+            return {}
+        return {path.stem: path for path in sorted(dimensions_dir.glob('*.json'))}
+    
     @staticmethod
     def normalize_moon_data(body_data):
         """Normalize moon data to ensure consistent format"""
@@ -0,0 +1,191 @@
+"""
+Line editing with history and tab completion for the local game.
+Completion uses prefix tries of command names and aliases and of the names a player knows.
+"""
+import atexit
+import os
+from src.config import SAVE_DIRECTORY, HISTORY_FILE, HISTORY_LENGTH, STARS_ALWAYS_VISIBLE
+from src.commands.registry import cmd_registry
+from src.world.dimension import get_dimension, on_dimension_reload
+from src.world.search_index import search_index
+
+class PrefixTrie:
+    """Case-insensitive prefix tree; each node is a dict of characters, words end under the key None"""
+    def __init__(self, words=()):
+        self.root = {}
+        self.size = 0
+        for word in words:
+            self.insert(word)
+    
+    def insert(self, word):
+        node = self.root
+        for char in word.casefold():
+            node = node.setdefault(char, {})
+        words = node.setdefault(None, [])
+        if word not in words:
+            words.append(word)
+            self.size += 1
+    
+    def complete(self, prefix):
+        """All words starting with prefix, sorted"""
+        node = self.root
+        for char in prefix.casefold():
+            node = node.get(char)
+            if node is None:
+                return []
+        
+        words = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            for char, child in node.items():
+                if char is None:
+                    words.extend(child)
+                else:
+                    stack.append(child)
+        return sorted(words)
+
+class Completer:
+    """
+    Completion candidates for one player.
+    The command trie follows the registry version; name tries per dimension only add the
+    discoveries that are new since the last completion, found by diffing the discovery bitsets.
+    """
+    def __init__(self):
+        self.player = None
+        self.command_trie = None
+        self.command_version = None
+        self.name_tries = {}  # Dimension name -> [trie, seen discovery bits, number of seen known dimensions]
+        on_dimension_reload(self.forget_dimension)
+    
+    def attach(self, player):
+        """Complete for another player, e.g. after logging in"""
+        self.player = player
+        self.name_tries = {}
+    
+    def forget_dimension(self, dim_name):
+        """Rebuild the names of a reloaded dimension on the next completion"""
+        self.name_tries.pop(dim_name, None)
+    
+    def get_command_trie(self):
+        if self.command_version != cmd_registry.version:
+            self.command_trie = PrefixTrie(list(cmd_registry.commands) + list(cmd_registry.aliases))
+            self.command_version = cmd_registry.version
+        return self.command_trie
+    
+    def get_name_trie(self, dimension):
+        """Trie of known names in a dimension, updated with discoveries made since the last call"""
+        player = self.player
+        state = self.name_tries.get(dimension.name)
+        if state is None:
+            trie = PrefixTrie()
+            if STARS_ALWAYS_VISIBLE:
+                for body_name, body_data in dimension.properties.items():
+                    if body_data.get("type", "").lower() == "star":
+                        trie.insert(body_name)
+            state = self.name_tries[dimension.name] = [trie, 0, 0]
+        trie, seen_bits, seen_dimensions = state
+        
+        # Only the bits that were set since the last completion
+        table = dimension.body_table
+        bits = player.known_bodies.bits.get(dimension.name, 0)
+        new_bits = bits & ~seen_bits
+        while new_bits:
+            lowest = new_bits & -new_bits
+            trie.insert(table.labels[lowest.bit_length() - 1])
+            new_bits ^= lowest
+        
+        for dim_name in player.known_dimensions[seen_dimensions:]:
+            trie.insert(dim_name)
+        
+        state[1] = bits
+        state[2] = len(player.known_dimensions)
+        return trie
+    
+    def candidates(self, line, word):
+        """Completions for word, where line is the text before it"""
+        if self.player is None:
+            return []
+        
+        words = line.split()
+        if not words:
+            return self.get_command_trie().complete(word)
+        
+        dimension = get_dimension(self.player.dimension.name)
+        command = cmd_registry.get_command(words[0].lower())
+        command_name = command.name if command else words[0].lower()
+        
+        if command_name == "jump":
+            return [name for name in self.player.known_dimensions if name.casefold().startswith(word.casefold())]
+        
+        # A fully typed body name after move completes to its coordinates
+        if command_name == "move" and len(words) == 1 and word:
+            coords = self.get_coordinates(dimension, word)
+            if coords is not None:
+                return [f"{coords[0]} {coords[1]}"]
+        return self.get_name_trie(dimension).complete(word)
+    
+    def get_coordinates(self, dimension, name):
+        """Coordinates of a known object in the dimension, None if unknown"""
+        for entry, match in search_index.search(name, self.player, limit=5):
+            if match == "exact" and entry.dimension == dimension.name and entry.coords is not None:
+                return entry.coords
+        return None
+
+class LineEditor:
+    """Sets up readline (if available) with history and completion for input()"""
+    def __init__(self):
+        self.completer = Completer()
+        self.readline = None
+        self.matches = []
+    
+    def setup(self):
+        """Enable history and tab completion, returns False where readline is unavailable (e.g. Windows)"""
+        if self.readline is not None:
+            return True
+        try:
+            import readline
+        except ImportError:
+            return False
+        self.readline = readline
+        
+        # macOS ships libedit, which uses a different binding syntax
+        if "libedit" in (readline.__doc__ or ""):
+            readline.parse_and_bind("bind ^I rl_complete")
+        else:
+            readline.parse_and_bind("tab: complete")
+        readline.set_completer_delims(" \t\n")
+        readline.set_completer(self.complete)
+        
+        history_path = os.path.join(SAVE_DIRECTORY, HISTORY_FILE)
+        readline.set_history_length(HISTORY_LENGTH)
+        try:
+            readline.read_history_file(history_path)
+        except OSError:
+            pass  # No history yet
+        atexit.register(self.save_history, history_path)
+        return True
+    
+    def save_history(self, history_path):
+        try:
+            os.makedirs(os.path.dirname(history_path) or ".", exist_ok=True)
+            self.readline.write_history_file(history_path)
+        except OSError as e:
+            print(f"⚠ Could not save command history: {e}")
+    
+    def attach(self, player):
+        self.completer.attach(player)
+    
+    def complete(self, text, state):
+        """readline completer function"""
+        if state == 0:
+            line = self.readline.get_line_buffer()[:self.readline.get_begidx()]
+            try:
+                self.matches = self.completer.candidates(line, text)
+            except Exception:
+                # Errors inside readline callbacks are swallowed silently, so never raise here
+                self.matches = []
+        return self.matches[state] if state < len(self.matches) else None
+
+# Create a singleton instance for the local game
+line_editor = LineEditor()
@@ -0,0 +1,159 @@
+"""
+Latency metrics for commands, world queries, dimension loads and saves.
+"""
+import datetime
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from src.config import METRICS_DIRECTORY, METRICS_DUMP_ON_LOGOUT
+
+# Upper bounds of the histogram buckets in milliseconds, the last bucket takes everything above
+BUCKET_BOUNDS_MS = [0.1 * 2 ** i for i in range(20)]  # 0.1 ms up to about 52 s
+
+class Histogram:
+    """Latency histogram with power-of-two buckets"""
+    def __init__(self):
+        self.buckets = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total = 0.0    # Wall time in seconds
+        self.cpu = 0.0      # Time the thread actually ran, the rest is sleeps and waiting for input
+        self.max = 0.0
+
+    def add(self, seconds, cpu_seconds):
+        milliseconds = seconds * 1000
+        index = 0
+        while index < len(BUCKET_BOUNDS_MS) and milliseconds > BUCKET_BOUNDS_MS[index]:
+            index += 1
+        self.buckets[index] += 1
+        self.count += 1
+        self.total += seconds
+        self.cpu += cpu_seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, fraction):
+        """Upper bucket bound (in seconds) below which the given fraction of samples fall"""
+        needed = fraction * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= needed and bucket_count:
+                if index < len(BUCKET_BOUNDS_MS):
+                    return min(BUCKET_BOUNDS_MS[index] / 1000, self.max)
+                return self.max
+        return self.max
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "total": round(self.total, 6),
+            "cpu": round(self.cpu, 6),
+            "max": round(self.max, 6),
+            "p50": round(self.percentile(0.5), 6),
+            "p95": round(self.percentile(0.95), 6),
+            "buckets_ms": {f"<={bound:g}": n for bound, n in zip(BUCKET_BOUNDS_MS, self.buckets) if n},
+            "overflow": self.buckets[-1]
+        }
+
+class PerfMetrics:
+    """Named latency histograms shared by all sessions of the process"""
+    def __init__(self):
+        self.histograms = {}
+        self.lock = threading.Lock()
+        self.started = time.time()
+
+    def record(self, name, seconds, cpu_seconds=0.0):
+        with self.lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.add(seconds, cpu_seconds)
+
+    @contextmanager
+    def timer(self, name):
+        """Time the enclosed block under the given metric name"""
+        start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start, time.thread_time() - cpu_start)
+
+    def timed(self, name):
+        """Decorator timing every call of a function"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.timer(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def reset(self):
+        with self.lock:
+            self.histograms = {}
+            self.started = time.time()
+
+    def snapshot(self):
+        """Copy of all histograms as plain data"""
+        with self.lock:
+            return {name: histogram.to_dict() for name, histogram in sorted(self.histograms.items())}
+
+    def report(self, prefix=""):
+        """Table of all metrics, optionally only those starting with prefix"""
+        data = {name: values for name, values in self.snapshot().items() if name.startswith(prefix)}
+        if not data:
+            return ["No measurements yet."]
+
+        lines = [
+            f"{'Metric':<28} {'Count':>6} {'Mean':>9} {'p50':>9} {'p95':>9} {'Max':>9} {'Idle':>6}",
+            "-" * 82
+        ]
+        for name, values in data.items():
+            mean = values["total"] / values["count"]
+            # Idle share is time spent in animation sleeps or waiting for input
+            idle = 1 - values["cpu"] / values["total"] if values["total"] > 0 else 0
+            lines.append(
+                f"{name:<28} {values['count']:>6} {format_seconds(mean):>9} {format_seconds(values['p50']):>9} "
+                f"{format_seconds(values['p95']):>9} {format_seconds(values['max']):>9} {max(idle, 0):>6.0%}"
+            )
+        return lines
+
+    def dump(self, label=None):
+        """Write all metrics to a JSON file in the metrics directory, returns the path"""
+        os.makedirs(METRICS_DIRECTORY, exist_ok=True)
+        now = datetime.datetime.now()
+        file_name = now.strftime("%Y%m%d-%H%M%S")
+        if label:
+            file_name += f"-{label}"
+        path = os.path.join(METRICS_DIRECTORY, f"{file_name}.json")
+        data = {
+            "since": datetime.datetime.fromtimestamp(self.started).isoformat(),
+            "written": now.isoformat(),
+            "label": label,
+            "metrics": self.snapshot()
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        return path
+
+def format_seconds(seconds):
+    """Short human readable duration"""
+    if seconds < 1:
+        return f"{seconds * 1000:.1f}ms"
+    return f"{seconds:.2f}s"
+
+def dump_metrics_on_logout(player):
+    """Write the metrics file at the end of a player session if enabled"""
+    if not METRICS_DUMP_ON_LOGOUT or not perf.histograms:
+        return
+    try:
+        perf.dump(player.name if player else None)
+    except OSError as e:
+        print(f"⚠ Could not write metrics: {e}")
+
+# Create a singleton instance for use across the application
+perf = PerfMetrics()
@@ -0,0 +1,89 @@
+"""
+On-demand cProfile/tracemalloc capture of single commands.
+"""
+import cProfile
+import datetime
+import io
+import os
+import pstats
+import re
+import threading
+import time
+import tracemalloc
+from src.config import PROFILES_DIRECTORY, PROFILE_TOP_FUNCTIONS, PROFILE_TOP_ALLOCATIONS
+
+# SPACER_PROFILE=1 (or "all") profiles every command, a comma separated list only those commands
+PROFILE_ENV = os.environ.get("SPACER_PROFILE", "").strip().lower()
+
+_local = threading.local()
+
+def should_profile(command_name):
+    """Check if the SPACER_PROFILE switch selects a command"""
+    if not PROFILE_ENV or PROFILE_ENV in ("0", "false", "no"):
+        return False
+    if PROFILE_ENV in ("1", "true", "yes", "all"):
+        return True
+    return command_name in [name.strip() for name in PROFILE_ENV.split(",")]
+
+def profile_call(label, func, *args, **kwargs):
+    """
+    Run func under cProfile and tracemalloc and write the results to the profiles directory.
+    The profiler measures thread CPU time, so animation sleeps and waiting for input are left out.
+    """
+    # A profile of a profile (e.g. "profile profile scan") would only measure the same call twice
+    if getattr(_local, "active", False):
+        return func(*args, **kwargs)
+
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    profiler = cProfile.Profile(time.thread_time)
+
+    _local.active = True
+    wall_start = time.perf_counter()
+    try:
+        result = profiler.runcall(func, *args, **kwargs)
+    finally:
+        wall_time = time.perf_counter() - wall_start
+        _local.active = False
+        after = tracemalloc.take_snapshot()
+        if started_tracing:
+            tracemalloc.stop()
+        try:
+            path = write_profile(label, profiler, before, after, wall_time)
+            print(f"\n» Profile written to {path}")
+        except OSError as e:
+            print(f"\n⚠ Could not write profile: {e}")
+    return result
+
+def write_profile(label, profiler, before, after, wall_time):
+    """Write pstats data and a text report, returns the report path"""
+    os.makedirs(PROFILES_DIRECTORY, exist_ok=True)
+    safe_label = re.sub(r'[^a-zA-Z0-9_-]+', '_', label).strip('_') or "command"
+    base = os.path.join(PROFILES_DIRECTORY, f"{datetime.datetime.now():%Y%m%d-%H%M%S}-{safe_label}")
+
+    # Binary stats for pstats/snakeviz
+    profiler.dump_stats(f"{base}.pstats")
+
+    report = io.StringIO()
+    stats = pstats.Stats(profiler, stream=report)
+    report.write(f"Profile of: {label}\n")
+    report.write(f"Wall time: {wall_time:.3f}s, CPU time: {stats.total_tt:.3f}s "
+                 f"(the rest is animation sleeps and waiting for input)\n\n")
+    stats.strip_dirs().sort_stats("cumulative").print_stats(PROFILE_TOP_FUNCTIONS)
+
+    # Allocation sites of the command, without the profilers' own allocations
+    ignored = [tracemalloc.Filter(False, tracemalloc.__file__),
+               tracemalloc.Filter(False, cProfile.__file__),
+               tracemalloc.Filter(False, __file__),
+               tracemalloc.Filter(False, "<frozen importlib._bootstrap*>")]
+    differences = after.filter_traces(ignored).compare_to(before.filter_traces(ignored), "lineno")
+    report.write(f"\nTop {PROFILE_TOP_ALLOCATIONS} allocation sites (size change during the command):\n")
+    for difference in differences[:PROFILE_TOP_ALLOCATIONS]:
+        report.write(f"{difference}\n")
+
+    path = f"{base}.txt"
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(report.getvalue())
+    return path
@@ -62,7 +62,7 @@ def display_help(first_time=False):
             for cmd_name, cmd in registry.commands.items():
                 if cmd_name in ["move", "jump", "whereami", "dimensions"]:
                     navigation_commands.append(cmd)
-                elif cmd_name in ["scan", "scancoords"]:
+                elif cmd_name in ["scan", "scancoords", "find"]:
                     scan_commands.append(cmd)
                 elif cmd_name in ["dock", "land", "launch", "trade", "repair", "quests"]:
                     interaction_commands.append(cmd)
@@ -135,47 +135,23 @@ def display_discoveries(player):
         print(f"  » {dimension}")
     
     # Show celestial bodies discovered, organized by dimension
-    if hasattr(player, 'known_bodies') and player.known_bodies:
+    discovered_dimensions = player.known_bodies.dimensions()
+    if discovered_dimensions:
         print("\nCelestial bodies discovered:")
-        total_bodies = 0
+        from src.world.dimension import get_dimension
         
-        for dimension, bodies in player.known_bodies.items():
-            if bodies:  # Only show dimensions with discoveries
-                total_bodies += len(bodies)
-                bodies_list = sorted(bodies)  # Sort alphabetically
-                
-                # Try to get dimension title if available
-                try:
-                    from src.world.dimension import Dimension
-                    dim_obj = Dimension(dimension)
-                    dim_title = f"{dimension} - {dim_obj.title}"
-                except:
-                    dim_title = dimension
-                
-                print(f"  » {dim_title}: {len(bodies)}")
-                
-                # Display each celestial body, checking for moon notation (parent:moon)
-                planets = []
-                moons = {}
-                
-                for body in bodies_list:
-                    if ":" in body:
-                        parent, moon = body.split(":", 1)
-                        if parent not in moons:
-                            moons[parent] = []
-                        moons[parent].append(moon)
-                    else:
-                        planets.append(body)
-                
-                # Display planets first
-                for planet in planets:
-                    print(f"    • {planet}")
-                    # If this planet has moons, list them indented
-                    if planet in moons:
-                        for moon in moons[planet]:
-                            print(f"      - {moon}")
+        for dimension in discovered_dimensions:
+            # Dimension titles come from the dimension cache
+            dim_title = f"{dimension} - {get_dimension(dimension).title}"
+            print(f"  » {dim_title}: {player.known_bodies.count(dimension)}")
+            
+            # Display planets first, each followed by its discovered moons (parent:moon entries)
+            for planet, moons in player.known_bodies.tree(dimension):
+                print(f"    • {planet}")
+                for moon in moons:
+                    print(f"      - {moon}")
         
-        print(f"\nTotal celestial bodies discovered: {total_bodies}")
+        print(f"\nTotal celestial bodies discovered: {player.known_bodies.count()}")
     else:
         print("\nNo celestial bodies have been discovered yet.")
         
@@ -208,9 +184,8 @@ def display_other_player_info(player_name):
             
             # Try to get dimension title
             try:
-                from src.world.dimension import Dimension
-                dim = Dimension(dim_name)
-                dim_title = dim.title
+                from src.world.dimension import get_dimension
+                dim_title = get_dimension(dim_name).title
                 print(f"» Current system: {dim_name} ({dim_title})")
             except:
                 print(f"» Current system: {dim_name}")
@@ -3,9 +3,81 @@ Dimension class and celestial body definitions for interstellar travel.
 """
 import json
 import os
+import threading
 from pathlib import Path
 from src.utils.data_loader import DataLoader
-from src.config import DIMENSIONS_DIRECTORY, DIMENSIONS_CONFIG
+from src.config import DIMENSIONS_DIRECTORY, DIMENSIONS_CONFIG, HIDDEN_SIGNALS
+from src.utils.perf import perf
+
+# Loaded dimensions by name, shared by everything that only reads dimension data
+DIMENSION_CACHE = {}
+_cache_lock = threading.Lock()
+
+# Callbacks run with the dimension name after its data was reloaded
+_reload_listeners = []
+
+class BodyTable:
+    """
+    Integer IDs for everything that can be discovered in a dimension.
+    IDs never change once handed out, so discoveries can be stored as bitsets.
+    """
+    def __init__(self, bodies, hidden_signals=None, previous=None):
+        self.ids = {}        # Discovery name (as stored in saves) -> ID
+        self.names = []      # ID -> discovery name
+        self.labels = []     # ID -> display name
+        self.parents = []    # ID -> parent ID for "parent:moon" entries, else None
+        self.children = {}   # Parent ID -> IDs of its moon entries
+        self.display_order = None
+        self.lock = threading.Lock()  # Sessions of the game server share one table
+        
+        # Keep the IDs of a reloaded dimension so stored discoveries stay valid
+        if previous is not None:
+            for name in previous.names:
+                self.get_id(name)
+        
+        for body_name, body_data in bodies.items():
+            self.get_id(body_name)
+            for moon_name in body_data.get('Moons', {}):
+                self.get_id(f"{body_name}:{moon_name}")
+            for station_name in body_data.get('Stations', {}):
+                self.get_id(f"STATION:{station_name}")
+        for signal_name in hidden_signals or {}:
+            self.get_id(signal_name)
+    
+    def get_id(self, name):
+        """Get the ID for a discovery name, adding names that are not in the dimension data yet"""
+        body_id = self.ids.get(name)
+        if body_id is not None:
+            return body_id
+        
+        # Moon notation (parent:moon) is split once here instead of on every display
+        parent_id = None
+        label = name
+        if ":" in name:
+            parent, label = name.split(":", 1)
+            parent_id = self.get_id(parent)
+        
+        with self.lock:
+            # Another session may have added the name in the meantime
+            if name in self.ids:
+                return self.ids[name]
+            body_id = len(self.names)
+            self.names.append(name)
+            self.labels.append(label)
+            self.parents.append(parent_id)
+            if parent_id is not None:
+                self.children.setdefault(parent_id, []).append(body_id)
+            self.display_order = None
+            self.ids[name] = body_id
+        return body_id
+    
+    def sorted_ids(self):
+        """All IDs sorted alphabetically by discovery name, computed once per table change"""
+        if self.display_order is None:
+            self.display_order = sorted(range(len(self.names)), key=lambda i: self.names[i])
+            for moon_ids in self.children.values():
+                moon_ids.sort(key=lambda i: self.names[i])
+        return self.display_order
 
 class Dimension:
     """
@@ -18,8 +90,10 @@ class Dimension:
         self.properties = {}
         self.title = ""
         self.description = ""
+        self.body_table = None
         self.load_dimension()
     
+    @perf.timed("dimension.load")
     def load_dimension(self):
         """Load dimension data from the corresponding JSON file"""
         try:
@@ -37,6 +111,8 @@ class Dimension:
                 # Store the body data
                 self.properties[body_name] = body_data
                 
+            self.body_table = BodyTable(self.properties, HIDDEN_SIGNALS.get(self.name))
+            
             # Load stations for this dimension
             from src.world.station import load_stations_from_dimension
             load_stations_from_dimension({'bodies': self.properties}, self.name)
@@ -50,3 +126,41 @@ class Dimension:
     def get_available_dimensions():
         """Get a list of all available dimensions"""
         return DataLoader.get_available_dimensions()
+
+def get_dimension(name):
+    """Get a dimension from the cache, loading it from disk on first use"""
+    dimension = DIMENSION_CACHE.get(name)
+    if dimension is None:
+        with _cache_lock:
+            dimension = DIMENSION_CACHE.get(name)
+            if dimension is None:
+                dimension = Dimension(name)
+                DIMENSION_CACHE[name] = dimension
+    return dimension
+
+def on_dimension_reload(callback):
+    """Register a callback(dimension_name) for dimension data reloads"""
+    _reload_listeners.append(callback)
+
+def reload_dimension(name):
+    """Re-read a dimension's data file and replace it in the cache"""
+    with _cache_lock:
+        previous = DIMENSION_CACHE.get(name)
+        dimension = Dimension(name)
+        if previous is not None:
+            dimension.body_table = BodyTable(dimension.properties, HIDDEN_SIGNALS.get(name), previous.body_table)
+        DIMENSION_CACHE[name] = dimension
+    for callback in _reload_listeners:
+        callback(name)
+    return dimension
+
+def reload_dimensions():
+    """Reload every cached dimension, returns the number of reloaded dimensions"""
+    count = 0
+    for name in list(DIMENSION_CACHE):
+        try:
+            reload_dimension(name)
+            count += 1
+        except ValueError as e:
+            print(f"Error reloading dimension {name}: {e}")
+    return count
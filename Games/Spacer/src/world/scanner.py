@@ -1,12 +1,95 @@
 """
 System scanning functionality and celestial body detection.
 """
-import time
 import math
-from src.config import DEFAULT_SCAN_RANGE, HIDDEN_SIGNALS, ANIMATION_SPEED
+import threading
+from collections import OrderedDict
+from src.config import DEFAULT_SCAN_RANGE, HIDDEN_SIGNALS, ANIMATION_SPEED, SCAN_CACHE_SIZE, SCAN_DISTANCE_BAND
+from src.world.dimension import on_dimension_reload
+from src.utils.perf import perf
+from src.utils.batch_mode import pause
+
+class ScanCache:
+    """
+    Least recently used cache for scan results.
+    Keys start with the dimension name so a reloaded dimension can be dropped.
+    Cached results are shared, callers must not modify them.
+    """
+    def __init__(self, max_size=SCAN_CACHE_SIZE):
+        self.entries = OrderedDict()
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()  # Sessions of the game server share the cache
+    
+    def get(self, key, compute):
+        """Get the cached value for key, calling compute() on a miss"""
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key]
+            self.misses += 1
+        
+        value = compute()
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+        return value
+    
+    def invalidate(self, dimension_name=None):
+        """Drop the results of one dimension, or all results"""
+        with self.lock:
+            if dimension_name is None:
+                self.entries.clear()
+                return
+            for key in [key for key in self.entries if key[0] == dimension_name]:
+                del self.entries[key]
+
+scan_cache = ScanCache()
+on_dimension_reload(scan_cache.invalidate)
 
 def scan_system(player):
     """Scan the current star system for celestial bodies"""
+    # Same position and discovery state give the same results, so repeated scans come from memory
+    discoveries = player.known_bodies
+    key = (player.dimension.name, "system", player.position("x"), player.position("y"),
+           discoveries.uid, discoveries.version)
+    scan_results = scan_cache.get(key, lambda: compute_scan(player))
+
+    # Enhanced loading screen animation
+    print("\nInitiating System Scan...\n")
+    animation_chars = ["◓ ", "◑ ", "◒ ", "◐ "]
+    scan_stages = [
+        "Calibrating sensors   ",
+        "Scanning for radiation",
+        "Analyzing composition ",
+        "Measuring mass        ",
+        "Processing data       "
+    ]
+    
+    line_length = 50  # Ensure this is long enough to overwrite previous lines
+    
+    for stage in scan_stages:
+        for i in range(20):
+            char = animation_chars[i % len(animation_chars)]
+            progress = int((i+1)/20 * 10)
+            bar = "█" * progress + "▒" * (10 - progress)
+            status = f"{char}{stage} [{bar}] {min((i+1)*5, 100)}%"
+            print(f"\r{status}{' ' * (line_length - len(status))}", end="", flush=True)
+            pause(ANIMATION_SPEED)
+        print()  # Move to next line after stage completes
+    
+    print("\nScan complete! Processing results...\n")
+    pause(1)
+    
+    return scan_results
+
+@perf.timed("world.scan")
+def compute_scan(player):
+    """Compute scan results for the player's position and discovery state"""
     # Get player position
     player_x = player.position("x")
     player_y = player.position("y")
@@ -16,10 +99,6 @@ def scan_system(player):
     # Initialize list to store results
     scan_results = []
     
-    # Check if this dimension is in known bodies dictionary
-    if dimension_name not in player.known_bodies:
-        player.known_bodies[dimension_name] = []
-    
     # Scan all properties in the dimension
     for body_name, body_data in current_dimension.properties.items():
         # Extract coordinates and convert to integers
@@ -34,14 +113,13 @@ def scan_system(player):
         
         # Determine if body should be identified (if it's close enough or already known)
         # Using DEFAULT_SCAN_RANGE as the maximum identifiable distance
-        if movement_distance <= DEFAULT_SCAN_RANGE or body_name in player.known_bodies.get(dimension_name, []):
+        is_known = player.known_bodies.knows(dimension_name, body_name)
+        if movement_distance <= DEFAULT_SCAN_RANGE or is_known:
             # Body is close enough to identify or already known
             body_type = body_data["type"]
             
             # Check if this is a new discovery
-            is_new_discovery = False
-            if dimension_name not in player.known_bodies or body_name not in player.known_bodies.get(dimension_name, []):
-                is_new_discovery = True
+            is_new_discovery = not is_known
                 
             # Count signals (moons + stations)
             signals_count = 0
@@ -107,49 +185,47 @@ def scan_system(player):
     
     # Sort by distance to player
     scan_results.sort(key=lambda x: x["distance"])
-
-    # Enhanced loading screen animation
-    print("\nInitiating System Scan...\n")
-    animation_chars = ["◓ ", "◑ ", "◒ ", "◐ "]
-    scan_stages = [
-        "Calibrating sensors   ",
-        "Scanning for radiation",
-        "Analyzing composition ",
-        "Measuring mass        ",
-        "Processing data       "
-    ]
-    
-    line_length = 50  # Ensure this is long enough to overwrite previous lines
-    
-    for stage in scan_stages:
-        for i in range(20):
-            char = animation_chars[i % len(animation_chars)]
-            progress = int((i+1)/20 * 10)
-            bar = "█" * progress + "▒" * (10 - progress)
-            status = f"{char}{stage} [{bar}] {min((i+1)*5, 100)}%"
-            print(f"\r{status}{' ' * (line_length - len(status))}", end="", flush=True)
-            time.sleep(ANIMATION_SPEED)
-        print()  # Move to next line after stage completes
-    
-    print("\nScan complete! Processing results...\n")
-    time.sleep(1)
-    
     return scan_results
 
+def filter_scan_results(raw_results):
+    """Drop moons from scan results, returns (result, distance) pairs"""
+    filtered_results = []
+    for item in raw_results:
+        # Skip moon objects
+        if isinstance(item, dict) and 'type' in item and item['type'].lower() == 'moon':
+            continue
+            
+        filtered_results.append((item, item['distance']))
+    return filtered_results
+
+def update_scan_snapshot(player, filtered_results):
+    """
+    Store a compact snapshot of a scan and return the previous one.
+    Objects are keyed by coordinates since unidentified objects have no name.
+    """
+    snapshot = {}
+    for obj_dict, distance in filtered_results:
+        snapshot[obj_dict['coords']] = (obj_dict['name'], int(distance) // SCAN_DISTANCE_BAND)
+    dimension_name = player.dimension.name
+    previous = player.scan_snapshots.get(dimension_name)
+    player.scan_snapshots[dimension_name] = snapshot
+    return previous
+
+def add_scan_discoveries(player, filtered_results):
+    """Add identified objects of a scan to the player's discoveries"""
+    current_dimension = player.position('dimension')
+    for obj_dict, _ in filtered_results:
+        # Only add named objects
+        obj_name = obj_dict['name']
+        if obj_name != 'Unknown':
+            player.known_bodies.add(current_dimension, obj_name)
+
 def handle_scan(player):
     """Process and display scan results"""
     try:
         # Get scan results
-        raw_results = scan_system(player)
-        
-        # Filter results
-        filtered_results = []
-        for item in raw_results:
-            # Skip moon objects
-            if isinstance(item, dict) and 'type' in item and item['type'].lower() == 'moon':
-                continue
-                
-            filtered_results.append((item, item['distance']))
+        filtered_results = filter_scan_results(scan_system(player))
+        update_scan_snapshot(player, filtered_results)
         
         # Display results as a table
         if filtered_results:
@@ -179,15 +255,7 @@ def handle_scan(player):
             print(f"\nNo objects detected in this system.")
         
         # Add discovered objects to player's knowledge
-        current_dimension = player.position('dimension')
-        for obj_dict, _ in filtered_results:
-            # Only add named objects
-            obj_name = obj_dict['name']
-            if obj_name != 'Unknown':
-                if current_dimension not in player.known_bodies:
-                    player.known_bodies[current_dimension] = []
-                if obj_name not in player.known_bodies[current_dimension]:
-                    player.known_bodies[current_dimension].append(obj_name)
+        add_scan_discoveries(player, filtered_results)
         
         return filtered_results
         
@@ -195,6 +263,61 @@ def handle_scan(player):
         print(f"\nError during scan: {e}")
         return []
 
+def handle_delta_scan(player):
+    """Scan the system and display only what changed since the last scan"""
+    try:
+        filtered_results = filter_scan_results(scan_system(player))
+        previous = update_scan_snapshot(player, filtered_results)
+        if previous is None:
+            print("No earlier scan of this system, showing all objects.")
+            previous = {}
+        
+        # Objects that appeared, were identified or moved into another distance band
+        changes = []
+        current = player.scan_snapshots[player.dimension.name]
+        for obj_dict, distance in filtered_results:
+            name, band = current[obj_dict['coords']]
+            old = previous.get(obj_dict['coords'])
+            if old is None:
+                change = "Detected"
+            elif old[0] == "Unknown" and name != "Unknown":
+                change = "Identified"
+            elif band < old[1]:
+                change = "Closer"
+            elif band > old[1]:
+                change = "Farther"
+            else:
+                continue
+            changes.append((obj_dict, distance, change))
+        
+        # Objects that are no longer detected (signals out of range)
+        lost = [coords for coords in previous if coords not in current]
+        
+        if changes or lost:
+            print("\n=== SCAN CHANGES ===")
+            print(f"{len(changes)} changed, {len(lost)} lost, {len(filtered_results) - len(changes)} unchanged")
+            print(f"{'Type':<15} {'Name':<20} {'Coordinates':<20} {'Distance':<10} {'Change':<12} {'Status':<10}")
+            print("-" * 87)
+            
+            for obj_dict, distance, change in changes:
+                coords = f"({obj_dict['coords'][0]}, {obj_dict['coords'][1]})"
+                status = "NEW!" if obj_dict.get('new_discovery', False) else ""
+                print(f"{obj_dict.get('type', 'Unknown'):<15} {obj_dict['name']:<20} {coords:<20} {f'{int(distance)}s':<10} {change:<12} {status:<10}")
+            for coords in lost:
+                name = previous[coords][0]
+                print(f"{'':<15} {name:<20} {f'({coords[0]}, {coords[1]})':<20} {'':<10} {'Lost':<12}")
+            
+            print("====================\n")
+        else:
+            print(f"\nNo changes since the last scan ({len(filtered_results)} objects).")
+        
+        add_scan_discoveries(player, filtered_results)
+        return changes
+        
+    except Exception as e:
+        print(f"\nError during scan: {e}")
+        return []
+
 def scan_celestial_body(player, body_name):
     """Scan a specific celestial body for detailed information"""
     # Check if player's current dimension is known
@@ -226,10 +349,7 @@ def scan_celestial_body(player, body_name):
                         print("==========================\n")
                         
                         # Add to known bodies
-                        if dim_name not in player.known_bodies:
-                            player.known_bodies[dim_name] = []
-                        if signal_name not in player.known_bodies[dim_name]:
-                            player.known_bodies[dim_name].append(signal_name)
+                        player.known_bodies.add(dim_name, signal_name)
                     else:
                         print(f"\n=== SCANNING UNKNOWN SIGNAL ===")
                         print("Signal detected but too weak for detailed analysis.")
@@ -271,7 +391,7 @@ def scan_celestial_body(player, body_name):
     # If not found as a primary body, check if it's a moon
     if not body_data:
         for planet_name, planet_data in player.dimension.properties.items():
-            if 'Moons' in planet_data and planet_name in player.known_bodies.get(dim_name, []):
+            if 'Moons' in planet_data and player.known_bodies.knows(dim_name, planet_name):
                 # Only search for moons of planets that are already known
                 for moon_name, moon_data in planet_data['Moons'].items():
                     if moon_name.lower() == body_name.lower():
@@ -287,7 +407,7 @@ def scan_celestial_body(player, body_name):
     if not body_data:
         print(f"\n✗ Cannot scan {body_name}: Object not found in this system.")
         return
-    elif is_moon and parent_planet not in player.known_bodies.get(dim_name, []):
+    elif is_moon and not player.known_bodies.knows(dim_name, parent_planet):
         print(f"\n✗ Cannot scan {body_name}: You need to discover its parent planet first.")
         print("   Perform a system scan to discover the parent planet.")
         return
@@ -300,7 +420,7 @@ def scan_celestial_body(player, body_name):
         # Stars are always considered known
         if is_star:
             is_known = True
-        elif dim_name in player.known_bodies and body_name in player.known_bodies[dim_name]:
+        elif player.known_bodies.knows(dim_name, body_name):
             is_known = True
             
         if not is_known:
@@ -374,14 +494,8 @@ def scan_celestial_body(player, body_name):
         for name, typ, coords, desc in stations_info:
             print(f"{name.ljust(15)}{typ.ljust(10)}{coords.ljust(15)}{desc}")
     
-    # Add celestial body to player's known bodies - maintaining the list format for compatibility
-    if dim_name not in player.known_bodies:
-        player.known_bodies[dim_name] = []
-        
-    # Only add primary bodies (not moons) to the known bodies list
+    # Only add primary bodies (not moons) to the known bodies
     if not is_moon:
-        # Add the body to the list if not already present
-        if body_name not in player.known_bodies[dim_name]:
-            player.known_bodies[dim_name].append(body_name)
+        player.known_bodies.add(dim_name, body_name)
     
     print("==========================\n")
\ No newline at end of file
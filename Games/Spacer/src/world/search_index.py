@@ -0,0 +1,199 @@
+"""
+Universe-wide name index for bodies, moons, stations, signals and dimensions.
+"""
+import bisect
+import os
+import threading
+from src.config import HIDDEN_SIGNALS, STARS_ALWAYS_VISIBLE, FIND_MAX_RESULTS, FIND_MIN_SIMILARITY
+from src.utils.data_loader import DataLoader
+from src.utils.perf import perf
+
+def fold(text):
+    """Case-folded form used for all lookups"""
+    return text.casefold().strip()
+
+def trigrams(text):
+    """Trigrams of a folded name, padded so that short names and word starts match too"""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+class SearchEntry:
+    """One searchable object and the discoveries that make it visible to a player"""
+    def __init__(self, dimension, name, kind, coords=None, parent=None, visible_if=(), always_visible=False):
+        self.dimension = dimension
+        self.name = name
+        self.kind = kind
+        self.coords = coords
+        self.parent = parent
+        self.visible_if = visible_if          # Discovery names, any of which reveals the entry
+        self.always_visible = always_visible  # Visible as soon as the dimension is known
+        self.folded = fold(name)
+        self.trigrams = trigrams(self.folded)
+    
+    def is_visible(self, player):
+        """Check the player's discovery state for this entry"""
+        if self.dimension not in player.known_dimensions:
+            return False
+        if self.always_visible:
+            return True
+        return any(player.known_bodies.knows(self.dimension, name) for name in self.visible_if)
+
+def read_coords(data, fallback=None):
+    """Coordinates of a body/moon/station as integers"""
+    try:
+        return int(data["Coordinates"]["x"]), int(data["Coordinates"]["y"])
+    except (KeyError, TypeError, ValueError):
+        return fallback
+
+def build_entries(dim_name, dimension_data):
+    """Create the search entries for one dimension's data"""
+    entries = [SearchEntry(dim_name, dim_name, "Dimension", always_visible=True)]
+    if dimension_data.get("title"):
+        entries.append(SearchEntry(dim_name, dimension_data["title"], "Dimension", always_visible=True))
+    
+    for body_name, body_data in dimension_data.get("bodies", {}).items():
+        body_data = DataLoader.normalize_moon_data(body_data)
+        body_type = body_data.get("type", "Unknown")
+        body_coords = read_coords(body_data)
+        is_star = STARS_ALWAYS_VISIBLE and body_type.lower() == "star"
+        entries.append(SearchEntry(dim_name, body_name, body_type, body_coords,
+                                   visible_if=(body_name,), always_visible=is_star))
+        
+        # Scanning a body reveals its moons and stations
+        for station_name, station_data in body_data.get("Stations", {}).items():
+            entries.append(SearchEntry(dim_name, station_name, station_data.get("type", "Station"),
+                                       read_coords(station_data, body_coords), body_name,
+                                       visible_if=(body_name, f"STATION:{station_name}", station_name)))
+        
+        for moon_name, moon_data in body_data.get("Moons", {}).items():
+            moon_coords = read_coords(moon_data, body_coords)
+            entries.append(SearchEntry(dim_name, moon_name, "Moon", moon_coords, body_name,
+                                       visible_if=(body_name, f"{body_name}:{moon_name}", moon_name)))
+            for station_name, station_data in moon_data.get("Stations", {}).items():
+                entries.append(SearchEntry(dim_name, station_name, station_data.get("type", "Station"),
+                                           read_coords(station_data, moon_coords), moon_name,
+                                           visible_if=(body_name, f"STATION:{station_name}", station_name)))
+    
+    # Hidden signals only show up once they have been identified
+    for signal_name, coords in HIDDEN_SIGNALS.get(dim_name, {}).items():
+        entries.append(SearchEntry(dim_name, signal_name, "Special Signal", (coords["x"], coords["y"]),
+                                   visible_if=(signal_name,)))
+    return entries
+
+class SearchIndex:
+    """
+    Inverted index from case-folded names and trigrams to entries of all dimensions.
+    Built on first use; refresh() only re-reads dimension files that changed.
+    """
+    def __init__(self):
+        self.entries = {}          # Entry ID -> SearchEntry
+        self.by_dimension = {}     # Dimension name -> entry IDs
+        self.exact = {}            # Folded name -> entry IDs
+        self.by_trigram = {}       # Trigram -> entry IDs
+        self.sorted_names = []     # (folded name, entry ID), sorted for prefix search
+        self.file_times = {}       # Dimension name -> modification time of its file when indexed
+        self.next_id = 0
+        # Reentrant, search() holds it across refresh() and the lookups so sessions on other threads
+        # cannot re-index a dimension while a search reads the index
+        self.lock = threading.RLock()
+    
+    def refresh(self):
+        """Re-index dimensions whose files were added, changed or removed"""
+        with self.lock:
+            files = DataLoader.get_dimension_files()
+            for dim_name in list(self.file_times):
+                if dim_name not in files:
+                    self.remove_dimension(dim_name)
+            
+            for dim_name, path in files.items():
+                try:
+                    mtime = os.path.getmtime(path)
+                except OSError:
+                    continue
+                if self.file_times.get(dim_name) == mtime:
+                    continue
+                try:
+                    dimension_data = DataLoader.load_dimension_data(dim_name)
+                except ValueError as e:
+                    print(f"Warning: Cannot index dimension {dim_name}: {e}")
+                    continue
+                self.remove_dimension(dim_name)
+                self.add_dimension(dim_name, dimension_data)
+                self.file_times[dim_name] = mtime
+    
+    def add_dimension(self, dim_name, dimension_data):
+        ids = []
+        for entry in build_entries(dim_name, dimension_data):
+            entry_id = self.next_id
+            self.next_id += 1
+            self.entries[entry_id] = entry
+            ids.append(entry_id)
+            self.exact.setdefault(entry.folded, set()).add(entry_id)
+            for trigram in entry.trigrams:
+                self.by_trigram.setdefault(trigram, set()).add(entry_id)
+            bisect.insort(self.sorted_names, (entry.folded, entry_id))
+        self.by_dimension[dim_name] = ids
+    
+    def remove_dimension(self, dim_name):
+        removed = set(self.by_dimension.pop(dim_name, []))
+        if not removed:
+            return
+        for entry_id in removed:
+            entry = self.entries.pop(entry_id)
+            self.exact[entry.folded].discard(entry_id)
+            for trigram in entry.trigrams:
+                self.by_trigram[trigram].discard(entry_id)
+        self.sorted_names = [item for item in self.sorted_names if item[1] not in removed]
+        self.file_times.pop(dim_name, None)
+    
+    @perf.timed("world.find")
+    def search(self, text, player=None, limit=None):
+        """
+        Find entries by exact name, name prefix or trigram similarity.
+        Returns (entry, match) pairs, best matches first; with a player only visible entries.
+        """
+        query = fold(text)
+        if not query:
+            return []
+        
+        with self.lock:
+            self.refresh()
+            
+            limit = limit or FIND_MAX_RESULTS
+            ranked = {}  # Entry ID -> (rank, -similarity, match)
+            
+            for entry_id in self.exact.get(query, ()):
+                ranked[entry_id] = (0, 0, "exact")
+            
+            start = bisect.bisect_left(self.sorted_names, (query, -1))
+            for folded, entry_id in self.sorted_names[start:]:
+                if not folded.startswith(query):
+                    break
+                ranked.setdefault(entry_id, (1, 0, "prefix"))
+            
+            # Fuzzy matches: count shared trigrams per candidate
+            query_trigrams = trigrams(query)
+            shared = {}
+            for trigram in query_trigrams:
+                for entry_id in self.by_trigram.get(trigram, ()):
+                    shared[entry_id] = shared.get(entry_id, 0) + 1
+            for entry_id, count in shared.items():
+                if entry_id in ranked:
+                    continue
+                entry_trigrams = self.entries[entry_id].trigrams
+                similarity = count / (len(query_trigrams) + len(entry_trigrams) - count)
+                if similarity >= FIND_MIN_SIMILARITY:
+                    ranked[entry_id] = (2, -similarity, "similar")
+            
+            results = []
+            for entry_id, (rank, score, match) in sorted(ranked.items(), key=lambda item: (item[1][:2], self.entries[item[0]].folded)):
+                entry = self.entries[entry_id]
+                if player is not None and not entry.is_visible(player):
+                    continue
+                results.append((entry, match))
+                if len(results) >= limit:
+                    break
+            return results
+
+# Shared index for all players and sessions
+search_index = SearchIndex()
@@ -0,0 +1,140 @@
+"""
+Spatial index of hazards, stations and hidden signals for swept-path checks.
+
+A move travels max(|dx|, |dy|) steps (Chebyshev distance); step i of n is at
+start + round(i * delta / n) on each axis. Instead of testing every step, each
+object is an axis-aligned box and the index answers "which boxes does this path
+enter, and at which step" with a binary search over the sorted boxes plus a
+per-candidate solve, i.e. O(log n + candidates) per move.
+"""
+import bisect
+import threading
+from src.config import DANGEROUS_BODY_TYPES, HIDDEN_SIGNALS, PATH_SENSOR_RANGE
+from src.utils.perf import perf
+
+def round_div(a, b):
+    """a / b rounded half away from zero, for b > 0"""
+    if a >= 0:
+        return (2 * a + b) // (2 * b)
+    return -((-2 * a + b) // (2 * b))
+
+def path_point(start, end, step, steps):
+    """Position after step of steps along the straight Chebyshev path"""
+    return (start[0] + round_div((end[0] - start[0]) * step, steps),
+            start[1] + round_div((end[1] - start[1]) * step, steps))
+
+def steps_inside(origin, delta, steps, low, high):
+    """Range of steps (1..steps) whose coordinate on one axis lies in [low, high], or None"""
+    def coordinate(step):
+        return origin + round_div(delta * step, steps)
+    
+    # The coordinate changes monotonically along the path
+    sign = 1 if delta >= 0 else -1
+    key = lambda step: sign * coordinate(step)
+    bounds = sorted((sign * low, sign * high))
+    first = bisect.bisect_left(range(1, steps + 1), bounds[0], key=key) + 1
+    last = bisect.bisect_right(range(1, steps + 1), bounds[1], key=key)
+    if first > last:
+        return None
+    return first, last
+
+def get_hazard_bounds(body_data):
+    """
+    Bounds (min_x, max_x, min_y, max_y) of a star or black hole, None for other bodies.
+    Size is how far the body reaches from its center, at least 2 in each direction.
+    Used for passing through and arriving in a hazard alike, so both always agree.
+    """
+    if body_data.get("type", "").lower() not in [t.lower() for t in DANGEROUS_BODY_TYPES]:
+        return None
+    try:
+        body_x = int(body_data["Coordinates"]["x"])
+        body_y = int(body_data["Coordinates"]["y"])
+        reach_x = max(int(body_data.get("size", {}).get("width", 1)), 2)
+        reach_y = max(int(body_data.get("size", {}).get("height", 1)), 2)
+    except (KeyError, ValueError, TypeError):
+        return None
+    return body_x - reach_x, body_x + reach_x, body_y - reach_y, body_y + reach_y
+
+class PathHit:
+    """An object whose box the path enters, at the first step inside it"""
+    def __init__(self, kind, name, object_type, coords, step, point):
+        self.kind = kind              # "hazard", "station" or "signal"
+        self.name = name
+        self.type = object_type
+        self.coords = coords          # Object center
+        self.step = step
+        self.point = point            # Path position at that step
+
+class SpatialIndex:
+    """Boxes of one dimension sorted by their left edge"""
+    def __init__(self, dimension, stations):
+        self.boxes = []  # (min_x, max_x, min_y, max_y, kind, name, type, (x, y))
+        for body_name, body_data in dimension.properties.items():
+            bounds = get_hazard_bounds(body_data)
+            if bounds is None:
+                continue
+            center = (int(body_data["Coordinates"]["x"]), int(body_data["Coordinates"]["y"]))
+            self.boxes.append((*bounds, "hazard", body_name, body_data["type"], center))
+        
+        for station in stations:
+            if station.dimension == dimension.name and station.type in ("Station", "Beacon"):
+                self.add_point("station", station.name, station.type, station.x, station.y)
+        
+        for signal_name, coords in HIDDEN_SIGNALS.get(dimension.name, {}).items():
+            self.add_point("signal", signal_name, "Unknown Signal", coords["x"], coords["y"])
+        
+        self.boxes.sort(key=lambda box: box[0])
+        self.min_xs = [box[0] for box in self.boxes]
+        self.max_width = max((box[1] - box[0] for box in self.boxes), default=0)
+    
+    def add_point(self, kind, name, object_type, x, y):
+        r = PATH_SENSOR_RANGE
+        self.boxes.append((x - r, x + r, y - r, y + r, kind, name, object_type, (x, y)))
+    
+    def sweep(self, start, end):
+        """All objects the path from start to end enters, ordered by step"""
+        steps = max(abs(end[0] - start[0]), abs(end[1] - start[1]))
+        if steps == 0:
+            return []
+        low_x, high_x = sorted((start[0], end[0]))
+        low_y, high_y = sorted((start[1], end[1]))
+        
+        # Only boxes whose left edge is within the path's x range (widened by the widest box)
+        first = bisect.bisect_left(self.min_xs, low_x - self.max_width)
+        last = bisect.bisect_right(self.min_xs, high_x)
+        
+        hits = []
+        for min_x, max_x, min_y, max_y, kind, name, object_type, coords in self.boxes[first:last]:
+            if max_x < low_x or max_y < low_y or min_y > high_y:
+                continue
+            x_steps = steps_inside(start[0], end[0] - start[0], steps, min_x, max_x)
+            y_steps = steps_inside(start[1], end[1] - start[1], steps, min_y, max_y)
+            if x_steps is None or y_steps is None:
+                continue
+            entry = max(x_steps[0], y_steps[0])
+            if entry > min(x_steps[1], y_steps[1]):
+                continue
+            hits.append(PathHit(kind, name, object_type, coords, entry, path_point(start, end, entry, steps)))
+        
+        hits.sort(key=lambda hit: hit.step)
+        return hits
+
+# Index per dimension name, rebuilt when the player's dimension object changes
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+def get_spatial_index(dimension):
+    """Get the spatial index for a loaded dimension"""
+    from src.world.station import STATIONS
+    cached = _indexes.get(dimension.name)
+    if cached is not None and cached[0] is dimension:
+        return cached[1]
+    with _indexes_lock:
+        index = SpatialIndex(dimension, list(STATIONS.values()))
+        _indexes[dimension.name] = (dimension, index)
+    return index
+
+@perf.timed("world.sweep_path")
+def sweep_path(player, x, y):
+    """Objects along the player's path to [x, y], ordered by when they are reached"""
+    return get_spatial_index(player.dimension).sweep((player.x, player.y), (x, y))
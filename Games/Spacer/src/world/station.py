@@ -3,6 +3,8 @@ Station module for the Spacer game.
 Handles station functionality and interactions in console-based interface.
 """
 from src.world.dimension import Dimension
+from src.utils.perf import perf
+from src.world.spatial_index import get_hazard_bounds
 
 class Station:
     def __init__(self, name, description, station_type, x=0, y=0, dimension="A01"):
@@ -188,6 +190,7 @@ def get_city_at_coords(x, y, dimension_name):
                 return station
     return None
 
+@perf.timed("world.check_coords")
 def check_coords_for_objects(x, y, dimension_name, data=None):
     """Check what objects exist at specific coordinates"""
     # Import dangerous body types here to avoid circular imports
@@ -220,16 +223,15 @@ def check_coords_for_objects(x, y, dimension_name, data=None):
                     size_width = 1
                     size_height = 1
                     
-                # Special case for stars and black holes - ensure minimum size
-                if body_data.get("type", "").lower() in [t.lower() for t in DANGEROUS_BODY_TYPES]:
-                    size_width = max(size_width, 5)  # Minimum size of 5 for stars and black holes
-                    size_height = max(size_height, 5)  # Minimum size of 5 for stars and black holes
-                
-                # Calculate the coordinate bounds
-                min_x = body_x - (size_width // 2)
-                max_x = body_x + (size_width // 2)
-                min_y = body_y - (size_height // 2)
-                max_y = body_y + (size_height // 2)
+                # Calculate the coordinate bounds (stars and black holes use the shared hazard bounds)
+                hazard_bounds = get_hazard_bounds(body_data)
+                if hazard_bounds is not None:
+                    min_x, max_x, min_y, max_y = hazard_bounds
+                else:
+                    min_x = body_x - (size_width // 2)
+                    max_x = body_x + (size_width // 2)
+                    min_y = body_y - (size_height // 2)
+                    max_y = body_y + (size_height // 2)
                 
                 # Check if coordinates are within the body's bounds
                 if min_x <= x <= max_x and min_y <= y <= max_y:
@@ -377,15 +379,15 @@ def get_nearby_dangers(x, y, dimension_name, dimension_data, warning_distance=15
 
 def load_all_stations():
     """Load stations from all available dimensions"""
-    from src.world.dimension import Dimension
+    from src.world.dimension import Dimension, get_dimension
     
     # Get all available dimensions
     dimensions = Dimension.get_available_dimensions()
     
-    # Load stations from each dimension
+    # Load stations from each dimension (this also fills the dimension cache)
     for dim_name in dimensions:
         try:
-            dim = Dimension(dim_name)
+            dim = get_dimension(dim_name)
             load_stations_from_dimension(
                 {'bodies': dim.properties}, 
                 dim_name
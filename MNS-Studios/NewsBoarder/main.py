@@ -8,6 +8,9 @@ from tkinter import filedialog, messagebox, simpledialog
 import calendar
 import locale
 import json
+import argparse
+import sys
+from template_engine import load_template
 
 class CalendarEvent:
     def __init__(self, summary: str, start_date: datetime, end_date: datetime = None):
@@ -25,7 +28,7 @@ class CalendarEvent:
             return f"{self.start_date.day}."
 
 class NewsBoardGenerator:
-    def __init__(self):
+    def __init__(self, headless: bool = False):
         self.events: List[CalendarEvent] = []
         self.selected_events: List[CalendarEvent] = []
         self.all_events: List[CalendarEvent] = []  # Alle geparsten Events
@@ -35,13 +38,8 @@ class NewsBoardGenerator:
         self.config_dir = os.path.join(os.path.expanduser("~"), ".newsboarder")
         self.config_file = os.path.join(self.config_dir, "config.json")
         
-        # Kalender-URL und Filter laden
-        self.calendar_url = self.load_or_request_calendar_url()
-        self.filter_words = self.load_filter_words()
-        
-        # Wenn keine URL (Benutzer hat abgebrochen), Programm beenden
-        if not self.calendar_url:
-            return
+        # Kompiliertes Template (wird nur einmal geladen)
+        self.template = None
         
         # Deutsche Monatsnamen
         self.german_months = {
@@ -50,6 +48,24 @@ class NewsBoardGenerator:
             9: "September", 10: "Oktober", 11: "November", 12: "Dezember"
         }
         
+        # Kalender-URL und Filter laden (ohne GUI keine Nachfrage)
+        if headless:
+            self.calendar_url = self.load_calendar_url()
+        else:
+            self.calendar_url = self.load_or_request_calendar_url()
+        self.filter_words = self.load_filter_words()
+        
+        # Wenn keine URL (Benutzer hat abgebrochen) oder Batch-Modus: keine GUI
+        if not self.calendar_url or headless:
+            return
+        
+        # Anzahl auswählbarer Termine richtet sich nach den Slots im Template
+        try:
+            self.max_events = self.get_template().slot_count
+        except Exception as e:
+            print(f"Fehler beim Laden des Templates: {e}")
+            self.max_events = 4
+        
         # GUI Setup
         ctk.set_appearance_mode("dark")
         ctk.set_default_color_theme("blue")
@@ -127,7 +143,7 @@ class NewsBoardGenerator:
         right_frame = ctk.CTkFrame(main_frame)
         right_frame.pack(side="right", fill="both", expand=True, padx=(10, 0))
         
-        selected_label = ctk.CTkLabel(right_frame, text="Ausgewählte Termine (max. 4):", 
+        selected_label = ctk.CTkLabel(right_frame, text=f"Ausgewählte Termine (max. {self.max_events}):", 
                                     font=ctk.CTkFont(size=16, weight="bold"))
         selected_label.pack(anchor="w", padx=20, pady=(20, 10))
         
@@ -220,8 +236,8 @@ class NewsBoardGenerator:
                                        command=lambda idx=i: self.move_event_down(idx))
                 down_btn.pack(side="left", padx=2)
         
-        # Füge leere Zeilen hinzu falls weniger als 4 Events
-        for i in range(len(self.selected_events), 4):
+        # Füge leere Zeilen hinzu falls weniger Events als Template-Slots
+        for i in range(len(self.selected_events), self.max_events):
             row_frame = ctk.CTkFrame(self.table_frame)
             row_frame.pack(fill="x", pady=2)
             
@@ -258,8 +274,11 @@ class NewsBoardGenerator:
                 self.selected_events[index+1], self.selected_events[index]
             self.update_edit_table()
 
-    def parse_ical(self, ical_content: str) -> List[CalendarEvent]:
-        """Parst iCal Content und extrahiert Events"""
+    def parse_ical(self, ical_content: str, min_date=None) -> List[CalendarEvent]:
+        """Parst iCal Content und extrahiert Events (ab min_date, Standard: heute)"""
+        if min_date is None:
+            min_date = datetime.now().date()
+        
         events = []
         current_event = {}
         all_events_debug = []  # Für Debugging der ersten 10 Events
@@ -330,11 +349,10 @@ class NewsBoardGenerator:
                                 except:
                                     continue
                         
-                        # Prüfe ob Event in der Zukunft liegt
-                        today = datetime.now().date()
+                        # Prüfe ob Event nicht vor dem Startdatum liegt
                         event_date = start_date.date()
                         
-                        if event_date >= today:
+                        if event_date >= min_date:
                             event = CalendarEvent(current_event['SUMMARY'], start_date, end_date)
                             events.append(event)
                             
@@ -532,8 +550,8 @@ class NewsBoardGenerator:
             
             info_text = f"{date_str} {month_name} - {event.summary}"
             
-            # Nur Auswählen-Button anzeigen wenn weniger als 4 Events ausgewählt
-            if len(self.selected_events) < 4:
+            # Nur Auswählen-Button anzeigen wenn noch Slots frei sind
+            if len(self.selected_events) < self.max_events:
                 event_button = ctk.CTkButton(event_frame, text="Auswählen", 
                                            command=lambda e=event: self.select_event(e))
                 event_button.pack(side="right", padx=10, pady=5)
@@ -551,7 +569,7 @@ class NewsBoardGenerator:
     
     def select_event(self, event: CalendarEvent):
         """Wählt ein Event aus"""
-        if len(self.selected_events) < 4 and event not in self.selected_events:
+        if len(self.selected_events) < self.max_events and event not in self.selected_events:
             self.selected_events.append(event)
             self.update_edit_table()
             self.display_events()  # Refresh um ausgewählte Events zu verstecken
@@ -574,11 +592,6 @@ class NewsBoardGenerator:
             return
             
         try:
-            # Template laden
-            template_path = os.path.join(os.path.dirname(__file__), "template.setting")
-            with open(template_path, 'r', encoding='utf-8') as f:
-                template_content = f.read()
-            
             # Monat für Überschrift bestimmen (vom ersten Event mit Datum)
             month_name = "Aktueller Monat"
             for i, event in enumerate(self.selected_events):
@@ -588,7 +601,7 @@ class NewsBoardGenerator:
             
             # Template ausfüllen mit aktuellen Werten
             modified_content = self.fill_template_with_current_values(
-                template_content, month_name, current_dates, current_events)
+                month_name, current_dates, current_events)
             
             # In Zwischenablage kopieren
             self.root.clipboard_clear()
@@ -600,38 +613,72 @@ class NewsBoardGenerator:
         except Exception as e:
             messagebox.showerror("Fehler", f"Fehler beim Kopieren:\n{str(e)}")
     
-    def fill_template_with_current_values(self, template: str, month_name: str, 
+    def get_template(self):
+        """Gibt das kompilierte Template zurück (wird nur einmal geladen)"""
+        if self.template is None:
+            self.template = load_template()
+        return self.template
+    
+    def fill_template_with_current_values(self, month_name: str, 
                                         dates: List[str], events: List[str]) -> str:
         """Füllt das Template mit den aktuellen Werten aus der Tabelle"""
-        # Überschrift
-        template = template.replace('Termine im <Monat>', f'Termine im {month_name}')
-        
-        # Events einsetzen basierend auf Tabellenwerten
-        template_replacements = [
-            ('StyledText = Input { Value = "01.-02.", }', 'StyledText = Input { Value = "Beispiel Feiertag [schulfrei]", }'),
-            ('StyledText = Input { Value = "10.", }', 'StyledText = Input { Value = "Beispiel Konzert", }'),
-            ('StyledText = Input { Value = "17.-20.", }', 'StyledText = Input { Value = "Beispiel Sporttag", }'),
-            ('StyledText = Input { Value = "30.", }', 'StyledText = Input { Value = "Beispiel Irgendwas [schulfrei]", }')
-        ]
-        
-        for i in range(4):
-            date_str = dates[i] if i < len(dates) and dates[i] else ""
-            event_str = events[i] if i < len(events) and events[i] else ""
-            
-            # Ersetze Template-Werte
-            if i < len(template_replacements):
-                old_date, old_event = template_replacements[i]
-                new_date = f'StyledText = Input {{ Value = "{date_str}", }}'
-                new_event = f'StyledText = Input {{ Value = "{event_str}", }}'
-                
-                template = template.replace(old_date, new_date)
-                template = template.replace(old_event, new_event)
-        
-        return template
+        return self.get_template().render(month_name, dates, events)
+    
+    def fetch_events(self, min_date=None) -> List[CalendarEvent]:
+        """Lädt den Kalender ohne GUI und gibt die gefilterten Events zurück"""
+        response = requests.get(self.calendar_url, timeout=10)
+        response.raise_for_status()
+        return self.parse_ical(response.text, min_date)
+    
+    def group_events_into_boards(self, events: List[CalendarEvent], start_date, end_date) -> List[tuple]:
+        """Gruppiert Events pro Monat in Boards mit je so vielen Events wie das Template Slots hat"""
+        slot_count = self.get_template().slot_count
+        months: Dict[tuple, List[CalendarEvent]] = {}
+        for event in events:
+            event_date = event.start_date.date()
+            if start_date <= event_date <= end_date:
+                key = (event.start_date.year, event.start_date.month)
+                months.setdefault(key, []).append(event)
+        
+        boards = []
+        for (year, month), month_events in sorted(months.items()):
+            for part, i in enumerate(range(0, len(month_events), slot_count), start=1):
+                boards.append((year, month, part, month_events[i:i + slot_count]))
+        return boards
+    
+    def export_boards(self, start_date, end_date, output_dir: str) -> List[str]:
+        """Erzeugt pro Board eine .setting Datei im Ausgabeordner"""
+        events = self.fetch_events(start_date)
+        boards = self.group_events_into_boards(events, start_date, end_date)
+        template = self.get_template()
+        
+        os.makedirs(output_dir, exist_ok=True)
+        written = []
+        for year, month, part, board_events in boards:
+            content = template.render(
+                self.german_months[month],
+                [event.get_date_string() for event in board_events],
+                [event.summary for event in board_events])
+            
+            file_path = os.path.join(output_dir, f"NewsBoard_{year}-{month:02d}_{part}.setting")
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            written.append(file_path)
+        
+        print(f"{len(written)} News Boards aus {len(events)} Terminen nach {output_dir} exportiert")
+        return written
 
     def load_or_request_calendar_url(self) -> str:
         """Lädt die Kalender-URL aus der Config oder fragt den Benutzer"""
-        # Prüfe ob Config existiert
+        url = self.load_calendar_url()
+        if url:
+            return url
+        
+        # Config existiert nicht oder ist fehlerhaft - Benutzer fragen
+        return self.request_calendar_url()
+    
+    def load_calendar_url(self) -> str:
+        """Lädt die Kalender-URL aus der Config (ohne Nachfrage)"""
         if os.path.exists(self.config_file):
             try:
                 with open(self.config_file, 'r', encoding='utf-8') as f:
@@ -639,9 +686,7 @@ class NewsBoardGenerator:
                     return config.get('calendar_url', '')
             except Exception as e:
                 print(f"Fehler beim Laden der Config: {e}")
-        
-        # Config existiert nicht oder ist fehlerhaft - Benutzer fragen
-        return self.request_calendar_url()
+        return ""
     
     def load_filter_words(self) -> List[str]:
         """Lädt die Filterwörter aus der Config"""
@@ -840,7 +885,46 @@ class NewsBoardGenerator:
         if hasattr(self, 'root'):
             self.root.mainloop()
 
+def parse_start_date(value: str):
+    """Parst JJJJ-MM oder JJJJ-MM-TT (Monat: ab dem Ersten)"""
+    for fmt in ('%Y-%m-%d', '%Y-%m'):
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            continue
+    raise argparse.ArgumentTypeError(f"Ungültiges Datum: {value} (erwartet JJJJ-MM oder JJJJ-MM-TT)")
+
+def parse_end_date(value: str):
+    """Parst JJJJ-MM oder JJJJ-MM-TT (Monat: bis zum Monatsende)"""
+    date = parse_start_date(value)
+    if len(value) == 7:
+        date = date.replace(day=calendar.monthrange(date.year, date.month)[1])
+    return date
+
+def run_batch(argv: List[str]) -> int:
+    """Batch-Modus: exportiert News Boards für einen Zeitraum ohne GUI"""
+    parser = argparse.ArgumentParser(description="News Boards für einen Zeitraum als .setting Dateien exportieren")
+    parser.add_argument("--batch", action="store_true", help="Batch-Modus ohne GUI")
+    parser.add_argument("--von", type=parse_start_date, required=True, help="Startdatum (JJJJ-MM oder JJJJ-MM-TT)")
+    parser.add_argument("--bis", type=parse_end_date, required=True, help="Enddatum (JJJJ-MM oder JJJJ-MM-TT, Monat inklusive)")
+    parser.add_argument("--ausgabe", default="boards", help="Ausgabeordner für die .setting Dateien")
+    parser.add_argument("--url", help="iCal-URL (Standard: URL aus der Config)")
+    args = parser.parse_args(argv)
+    
+    generator = NewsBoardGenerator(headless=True)
+    if args.url:
+        generator.calendar_url = args.url
+    if not generator.calendar_url:
+        print("Keine Kalender-URL konfiguriert (--url angeben oder einmal die GUI starten)")
+        return 1
+    
+    generator.export_boards(args.von, args.bis, args.ausgabe)
+    return 0
+
 if __name__ == "__main__":
+    if "--batch" in sys.argv[1:]:
+        sys.exit(run_batch(sys.argv[1:]))
+    
     app = NewsBoardGenerator()
     if hasattr(app, 'root'):
         app.run()
@@ -0,0 +1,161 @@
+import os
+import re
+from typing import Dict, List, Tuple
+
+# Namen der Text-Tools im Fusion-Makro
+HEADLINE_TOOL = 'Überschrift'
+DATE_TOOL_PREFIX = 'Datum_T'
+EVENT_TOOL_PREFIX = 'Event_T'
+MONTH_PLACEHOLDER = '<Monat>'
+
+# Tool-Definitionen wie `Datum_T1 = TextPlus {` oder `["Überschrift"] = TextPlus {`
+TOOL_PATTERN = re.compile(r'^\s*(?:\["(?P<quoted>[^"]+)"\]|(?P<name>\w+))\s*=\s*\w+\s*\{', re.MULTILINE)
+STYLED_TEXT_PATTERN = re.compile(r'\bStyledText\s*=\s*Input\s*\{\s*Value\s*=\s*"')
+SLOT_PATTERN = re.compile(rf'^({DATE_TOOL_PREFIX}|{EVENT_TOOL_PREFIX})(\d+)$')
+
+
+def find_string_end(text: str, start: int) -> int:
+    """Gibt die Position des schließenden Anführungszeichens ab start zurück"""
+    pos = start
+    while True:
+        pos = text.find('"', pos)
+        if pos == -1:
+            raise ValueError("Nicht abgeschlossener String im Template")
+        # Anzahl der Backslashes davor entscheidet, ob das Zeichen escaped ist
+        backslashes = 0
+        while text[pos - 1 - backslashes] == '\\':
+            backslashes += 1
+        if backslashes % 2 == 0:
+            return pos
+        pos += 1
+
+
+def find_block_end(text: str, start: int) -> int:
+    """Sucht die schließende Klammer zum Block, der bei start ('{') beginnt"""
+    depth = 0
+    pos = start
+    length = len(text)
+    while pos < length:
+        char = text[pos]
+        if char == '"':
+            pos = find_string_end(text, pos + 1)
+        elif char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return pos
+        pos += 1
+    raise ValueError("Nicht abgeschlossener Block im Template")
+
+
+def block_depth(text: str, start: int, end: int) -> int:
+    """Zählt die Verschachtelungstiefe an Position end relativ zu start"""
+    depth = 0
+    pos = start
+    while pos < end:
+        char = text[pos]
+        if char == '"':
+            pos = find_string_end(text, pos + 1)
+        elif char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+        pos += 1
+    return depth
+
+
+def escape_value(value: str) -> str:
+    """Escaped einen Text für einen Fusion-String"""
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def find_styled_text_spans(template: str) -> Dict[str, Tuple[int, int]]:
+    """Findet für jedes Tool mit StyledText-Eingang Start/Ende des Werts"""
+    spans = {}
+    for match in TOOL_PATTERN.finditer(template):
+        name = match.group('quoted') or match.group('name')
+        block_start = match.end() - 1
+        block_end = find_block_end(template, block_start)
+
+        # Nur direkter StyledText-Eingang (Tool { Inputs = { ... } }), keine verschachtelten Tools
+        value_match = STYLED_TEXT_PATTERN.search(template, block_start, block_end)
+        if value_match is None or name in spans:
+            continue
+        if block_depth(template, block_start, value_match.start()) != 2:
+            continue
+
+        value_start = value_match.end()
+        spans[name] = (value_start, find_string_end(template, value_start))
+    return spans
+
+
+class CompiledTemplate:
+    """Template, das einmal in feste Textstücke und Slot-Positionen zerlegt wird"""
+
+    def __init__(self, template: str):
+        spans = find_styled_text_spans(template)
+
+        # Slots aus Datum_T<n>/Event_T<n> Paaren, sortiert nach Nummer
+        numbers = {}
+        for name in spans:
+            slot_match = SLOT_PATTERN.match(name)
+            if slot_match:
+                numbers.setdefault(int(slot_match.group(2)), set()).add(slot_match.group(1))
+        slot_numbers = sorted(n for n, kinds in numbers.items() if len(kinds) == 2)
+        if not slot_numbers:
+            raise ValueError(f"Keine {DATE_TOOL_PREFIX}*/{EVENT_TOOL_PREFIX}* Tools im Template gefunden")
+
+        # Index 0 ist die Überschrift (falls vorhanden), danach Datum/Event je Slot
+        names = []
+        self.headline_prefix = ''
+        self.headline_suffix = ''
+        self.has_headline = HEADLINE_TOOL in spans
+        if self.has_headline:
+            start, end = spans[HEADLINE_TOOL]
+            headline = template[start:end]
+            if MONTH_PLACEHOLDER in headline:
+                self.headline_prefix, self.headline_suffix = headline.split(MONTH_PLACEHOLDER, 1)
+            else:
+                self.headline_prefix = headline + ' '
+            names.append(HEADLINE_TOOL)
+        for number in slot_numbers:
+            names.append(f'{DATE_TOOL_PREFIX}{number}')
+            names.append(f'{EVENT_TOOL_PREFIX}{number}')
+
+        # Reihenfolge der Slots im Text merken, Stücke dazwischen vorberechnen
+        order = sorted(range(len(names)), key=lambda i: spans[names[i]][0])
+        self.chunks: List[str] = []
+        self.slot_order: List[int] = []
+        pos = 0
+        for index in order:
+            start, end = spans[names[index]]
+            self.chunks.append(template[pos:start])
+            self.slot_order.append(index)
+            pos = end
+        self.chunks.append(template[pos:])
+
+        self.slot_count = len(slot_numbers)
+
+    def render(self, month_name: str, dates: List[str], events: List[str]) -> str:
+        """Setzt Überschrift, Daten und Events in die vorberechneten Slots ein"""
+        values = []
+        if self.has_headline:
+            values.append(f'{self.headline_prefix}{escape_value(month_name)}{self.headline_suffix}')
+        for i in range(self.slot_count):
+            values.append(escape_value(dates[i]) if i < len(dates) and dates[i] else "")
+            values.append(escape_value(events[i]) if i < len(events) and events[i] else "")
+
+        parts = [self.chunks[0]]
+        for chunk, index in zip(self.chunks[1:], self.slot_order):
+            parts.append(values[index])
+            parts.append(chunk)
+        return "".join(parts)
+
+
+def load_template(path: str = None) -> CompiledTemplate:
+    """Lädt und kompiliert template.setting"""
+    if path is None:
+        path = os.path.join(os.path.dirname(__file__), "template.setting")
+    with open(path, 'r', encoding='utf-8') as f:
+        return CompiledTemplate(f.read())
@@ -9,21 +9,157 @@ import re
 import keyboard
 import pyperclip
 import sys
+import json
+import hashlib
+import time
 
 # Tray icon image
 ICON_SIZE = 64
 
-def get_ffmpeg_path():
-    """Get the correct path to FFmpeg executable, whether running as script or exe"""
+# Job queue and per-user state
+DATA_DIR = os.path.join(os.path.expanduser("~"), ".recoder")
+JOBS_FILE = os.path.join(DATA_DIR, "jobs.json")
+SETTINGS_FILE = os.path.join(DATA_DIR, "settings.json")
+PROBE_CACHE_FILE = os.path.join(DATA_DIR, "probe_cache.json")
+STATS_FILE = os.path.join(DATA_DIR, "stats.json")
+MAX_WORKERS = 4
+FFMPEG_LOG_TAIL = 20
+
+# Encoding profiles used when the source can't simply be remuxed
+PROFILES = {
+    "fast": {"preset": "veryfast", "crf": "23", "audio_bitrate": "192k"},
+    "balanced": {"preset": "medium", "crf": "20", "audio_bitrate": "256k"},
+    "archival": {"preset": "slow", "crf": "18", "audio_bitrate": "256k"},
+}
+DEFAULT_PROFILE = "archival"
+
+# Streams that can be copied into an MP4 container as they are
+MP4_VIDEO_CODECS = {"h264", "hevc", "mpeg4", "av1"}
+MP4_PIX_FMTS = {"yuv420p", "yuvj420p"}
+MP4_AUDIO_CODECS = {"aac", "mp3", "alac", "ac3", "eac3"}
+
+# Bytes hashed from the start and end of a file to identify it for the probe cache
+HASH_CHUNK_SIZE = 1024 * 1024
+
+def get_tool_path(name):
+    """Get the correct path to a bundled FFmpeg tool, whether running as script or exe"""
     if getattr(sys, 'frozen', False):
         # Running as bundled executable
         bundle_dir = sys._MEIPASS
-        ffmpeg_path = os.path.join(bundle_dir, 'ffmpeg', 'ffmpeg.exe')
+        tool_path = os.path.join(bundle_dir, 'ffmpeg', f'{name}.exe')
     else:
         # Running as script
         script_dir = os.path.dirname(os.path.abspath(__file__))
-        ffmpeg_path = os.path.join(script_dir, 'ffmpeg', 'ffmpeg.exe')
-    return ffmpeg_path
+        tool_path = os.path.join(script_dir, 'ffmpeg', f'{name}.exe')
+    return tool_path
+
+def get_ffmpeg_path():
+    """Get the correct path to FFmpeg executable, whether running as script or exe"""
+    return get_tool_path('ffmpeg')
+
+def get_ffprobe_path():
+    """Get the correct path to FFprobe executable, whether running as script or exe"""
+    return get_tool_path('ffprobe')
+
+def load_json(path, default):
+    if not os.path.exists(path):
+        return default
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"Error loading {path}: {e}")
+        return default
+
+def save_json(path, data):
+    """Write JSON atomically so a crash never leaves a half-written file"""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        print(f"Error saving {path}: {e}")
+
+def file_hash(path):
+    """Fast identity hash: size plus the first and last MiB of the file"""
+    size = os.path.getsize(path)
+    digest = hashlib.sha1(str(size).encode())
+    with open(path, 'rb') as f:
+        digest.update(f.read(HASH_CHUNK_SIZE))
+        if size > HASH_CHUNK_SIZE:
+            f.seek(max(HASH_CHUNK_SIZE, size - HASH_CHUNK_SIZE))
+            digest.update(f.read(HASH_CHUNK_SIZE))
+    return digest.hexdigest()
+
+class MediaProber:
+    """Runs ffprobe on input files and caches the results per file hash"""
+
+    def __init__(self, cache_file=PROBE_CACHE_FILE):
+        self.cache_file = cache_file
+        self.lock = threading.Lock()
+        self.cache = load_json(cache_file, {})
+
+    def probe(self, input_path):
+        """Return {'duration': seconds, 'streams': [...]} or None if ffprobe isn't available"""
+        key = file_hash(input_path)
+        with self.lock:
+            if key in self.cache:
+                return self.cache[key]
+
+        ffprobe_path = get_ffprobe_path()
+        if not os.path.exists(ffprobe_path):
+            print(f"FFprobe not found at: {ffprobe_path}, skipping analysis")
+            return None
+        cmd = [
+            ffprobe_path,
+            "-v", "error",
+            "-show_entries", "stream=codec_type,codec_name,pix_fmt:format=duration",
+            "-of", "json",
+            input_path
+        ]
+        try:
+            output = subprocess.run(cmd, stdin=subprocess.DEVNULL, capture_output=True, text=True, check=True).stdout
+            data = json.loads(output)
+        except Exception as e:
+            print(f"Error probing {input_path}: {e}")
+            return None
+
+        result = {
+            'duration': float(data.get('format', {}).get('duration', 0) or 0),
+            'streams': [
+                {'type': stream.get('codec_type'), 'codec': stream.get('codec_name'), 'pix_fmt': stream.get('pix_fmt')}
+                for stream in data.get('streams', [])
+            ],
+        }
+        with self.lock:
+            self.cache[key] = result
+            save_json(self.cache_file, self.cache)
+        return result
+
+def plan_conversion(probe, profile):
+    """Decide per stream type whether to copy or re-encode. Returns a plan dict."""
+    plan = {'profile': profile, 'copy_video': False, 'copy_audio': False, 'hevc': False, 'duration': 0}
+    if probe is None:
+        return plan
+    plan['duration'] = probe['duration']
+    video = [stream for stream in probe['streams'] if stream['type'] == 'video']
+    audio = [stream for stream in probe['streams'] if stream['type'] == 'audio']
+    plan['copy_video'] = bool(video) and all(
+        stream['codec'] in MP4_VIDEO_CODECS and (stream['codec'] != 'h264' or stream['pix_fmt'] in MP4_PIX_FMTS)
+        for stream in video
+    )
+    plan['copy_audio'] = all(stream['codec'] in MP4_AUDIO_CODECS for stream in audio)
+    plan['hevc'] = any(stream['codec'] == 'hevc' for stream in video)
+    return plan
+
+def describe_plan(plan):
+    if plan['copy_video'] and plan['copy_audio']:
+        return "remux"
+    if plan['copy_video']:
+        return "remux video + aac"
+    return plan['profile']
 
 def show_progress_bar(percent):
     image = Image.new('RGB', (ICON_SIZE, ICON_SIZE), 'white')
@@ -33,118 +169,359 @@ def show_progress_bar(percent):
     draw.rectangle([2, ICON_SIZE//2-8, 2+bar_width, ICON_SIZE//2+8], fill='blue')
     return image
 
-def run_ffmpeg_with_progress(cmd, output_path, tray_icon):
-    duration = None
+# All 101 tray icons are drawn once so progress updates only swap references
+PROGRESS_ICONS = [show_progress_bar(percent) for percent in range(101)]
+
+def read_ffmpeg_log(stream, log_lines, duration_found):
+    """Drain ffmpeg's stderr, keeping the tail for error reports and the Duration header"""
     duration_pattern = re.compile(r"Duration: (\d+):(\d+):(\d+\.\d+)")
-    time_pattern = re.compile(r"time=(\d+):(\d+):(\d+\.\d+)")
-    tray_icon.icon = show_progress_bar(0)
-    tray_icon.title = "Starting conversion..."
+    for line in stream:
+        log_lines.append(line.rstrip())
+        if len(log_lines) > FFMPEG_LOG_TAIL:
+            del log_lines[0]
+        if duration_found[0] is None:
+            m = duration_pattern.search(line)
+            if m:
+                h, m_min, s = map(float, m.groups())
+                duration_found[0] = h*3600 + m_min*60 + s
+
+def run_ffmpeg_with_progress(cmd, on_progress, duration=0):
+    """Run ffmpeg and report (current_seconds, duration_seconds) to on_progress. Returns True on success.
+
+    Progress comes from ffmpeg's machine-readable -progress output on stdout,
+    one key=value block per update; stderr is only kept for error reports.
+    """
+    cmd = cmd[:1] + ["-nostats", "-progress", "pipe:1"] + cmd[1:]
+    log_lines = []
+    duration_found = [duration or None]
     try:
-        proc = subprocess.Popen(cmd, stderr=subprocess.PIPE, universal_newlines=True, text=True)
-        for line in proc.stderr:
-            print(f"FFmpeg output: {line.strip()}")  # Debug output
-            if duration is None:
-                m = duration_pattern.search(line)
-                if m:
-                    h, m_min, s = map(float, m.groups())
-                    duration = h*3600 + m_min*60 + s
-                    print(f"Total duration: {duration} seconds")
-            
-            if duration is not None:
-                m = time_pattern.search(line)
-                if m:
-                    h, m_min, s = map(float, m.groups())
-                    current = h*3600 + m_min*60 + s
-                    percent = min(100, int((current/duration)*100))
-                    tray_icon.icon = show_progress_bar(percent)
-                    remaining = max(0, duration-current)
-                    mins, secs = divmod(int(remaining), 60)
-                    hours, mins = divmod(mins, 60)
-                    tray_icon.title = f"Progress: {percent}% - Remaining: {hours:02}:{mins:02}:{secs:02}"
+        proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                universal_newlines=True, text=True)
+        log_reader = threading.Thread(target=read_ffmpeg_log, args=(proc.stderr, log_lines, duration_found), daemon=True)
+        log_reader.start()
+        current = 0.0
+        for line in proc.stdout:
+            key, _, value = line.strip().partition("=")
+            if key == "out_time_us" or key == "out_time_ms":
+                # out_time_ms is in microseconds as well (ffmpeg naming quirk)
+                if value.isdigit():
+                    current = int(value) / 1_000_000
+            elif key == "progress":
+                total = duration_found[0]
+                if total:
+                    on_progress(min(current, total), total)
         proc.wait()
+        log_reader.join()
         if proc.returncode != 0:
-            tray_icon.title = "Conversion failed!"
-        else:
-            tray_icon.title = "Conversion complete!"
+            print("FFmpeg failed:\n" + "\n".join(log_lines))
+        return proc.returncode == 0
     except Exception as e:
         print(f"Error during conversion: {e}")
-        tray_icon.title = "Error occurred!"
-    finally:
-        tray_icon.icon = show_progress_bar(100)
-    # Show finished popup and copy folder path to clipboard
-    def show_finished_popup(output_path):
-        folder_path = os.path.dirname(output_path)
+        return False
+
+def show_finished_popup(output_paths, failed):
+    """Show finished popup and copy the output folder path to clipboard"""
+    popup = tk.Tk()
+    popup.withdraw()
+    failed_list = "\n".join(os.path.basename(path) for path in failed)
+    if output_paths:
+        folder_path = os.path.dirname(output_paths[-1])
         pyperclip.copy(folder_path)
-        popup = tk.Tk()
-        popup.withdraw()
-        messagebox.showinfo(
-            "Conversion finished",
-            f"Done! Output saved to:\n{output_path}\n\nFolder path copied to clipboard!",
-            parent=popup
-        )
-        popup.destroy()
-    threading.Thread(target=show_finished_popup, args=(output_path,), daemon=True).start()
+        message = f"Done! {len(output_paths)} file(s) converted to:\n{folder_path}"
+        if failed:
+            message += f"\n\n{len(failed)} file(s) failed:\n" + failed_list
+        messagebox.showinfo("Conversion finished", message + "\n\nFolder path copied to clipboard!", parent=popup)
+    else:
+        messagebox.showerror("Conversion failed", f"{len(failed)} file(s) could not be converted:\n" + failed_list, parent=popup)
+    popup.destroy()
+
+def build_ffmpeg_cmd(ffmpeg_path, input_path, output_path, plan, threads):
+    settings = PROFILES[plan['profile']]
+    cmd = [ffmpeg_path, "-y", "-i", input_path, "-map", "0:v", "-map", "0:a?"]
+    if plan['copy_video']:
+        cmd += ["-c:v", "copy"]
+        if plan['hevc']:
+            # Apple players only accept HEVC in MP4 with the hvc1 tag
+            cmd += ["-tag:v", "hvc1"]
+    else:
+        cmd += [
+            "-c:v", "libx264",
+            "-preset", settings['preset'],
+            "-crf", settings['crf'],
+            "-pix_fmt", "yuv420p",
+            "-threads", str(threads),
+        ]
+    if plan['copy_audio']:
+        cmd += ["-c:a", "copy"]
+    else:
+        cmd += ["-c:a", "aac", "-b:a", settings['audio_bitrate'], "-ar", "48000"]
+    cmd += ["-movflags", "+faststart", output_path]
+    return cmd
+
+class ProfileStats:
+    """Accumulates speed and size per conversion mode for the statistics view"""
+
+    def __init__(self, stats_file=STATS_FILE):
+        self.stats_file = stats_file
+        self.lock = threading.Lock()
+        self.stats = load_json(stats_file, {})
+
+    def record(self, mode, media_seconds, wall_seconds, input_bytes, output_bytes):
+        with self.lock:
+            entry = self.stats.setdefault(mode, {
+                'files': 0, 'media_seconds': 0.0, 'wall_seconds': 0.0, 'input_bytes': 0, 'output_bytes': 0,
+            })
+            entry['files'] += 1
+            entry['media_seconds'] += media_seconds
+            entry['wall_seconds'] += wall_seconds
+            entry['input_bytes'] += input_bytes
+            entry['output_bytes'] += output_bytes
+            save_json(self.stats_file, self.stats)
+
+    def report(self):
+        with self.lock:
+            stats = {mode: dict(entry) for mode, entry in self.stats.items()}
+        if not stats:
+            return "No conversions recorded yet."
+        lines = []
+        for mode, entry in sorted(stats.items()):
+            speed = entry['media_seconds'] / entry['wall_seconds'] if entry['wall_seconds'] else 0
+            size = entry['output_bytes'] / entry['input_bytes'] * 100 if entry['input_bytes'] else 0
+            lines.append(f"{mode}: {entry['files']} file(s), {speed:.1f}x realtime, output {size:.0f}% of input size")
+        return "\n".join(lines)
+
+class JobQueue:
+    """Persistent queue of conversion jobs, processed by several ffmpeg workers at once"""
+
+    def __init__(self, tray_icon, jobs_file=JOBS_FILE):
+        self.tray_icon = tray_icon
+        self.jobs_file = jobs_file
+        self.lock = threading.Lock()
+        self.jobs = []
+        self.prober = MediaProber()
+        self.stats = ProfileStats()
+        self.settings = load_json(SETTINGS_FILE, {})
+        if self.settings.get('profile') not in PROFILES:
+            self.settings['profile'] = DEFAULT_PROFILE
+        # x264 is multithreaded itself, so run a few encoders that share the cores
+        cores = os.cpu_count() or 1
+        self.worker_count = max(1, min(MAX_WORKERS, cores // 4))
+        self.threads_per_job = max(1, cores // self.worker_count)
+        self.active_workers = 0
+        self.tray_state = None
+        self.load()
+
+    def load(self):
+        """Load jobs from the last run; interrupted jobs start over"""
+        self.jobs = load_json(self.jobs_file, [])
+        # Finished jobs were already reported before the restart
+        self.jobs = [job for job in self.jobs if job['status'] in ('pending', 'running')]
+        for job in self.jobs:
+            job['status'] = 'pending'
+            job['progress'] = 0
+
+    def save(self):
+        """Write the job list to disk (caller holds the lock)"""
+        save_json(self.jobs_file, self.jobs)
+
+    def set_profile(self, profile):
+        self.settings['profile'] = profile
+        save_json(SETTINGS_FILE, self.settings)
+
+    def add(self, input_paths):
+        with self.lock:
+            queued = {job['input'] for job in self.jobs if job['status'] in ('pending', 'running')}
+            for input_path in input_paths:
+                if input_path in queued:
+                    continue
+                base, _ = os.path.splitext(input_path)
+                self.jobs.append({
+                    'input': input_path,
+                    'output': base + ".mp4",
+                    'profile': self.settings['profile'],
+                    'status': 'pending',
+                    'progress': 0,
+                })
+            self.save()
+        self.start()
+
+    def start(self):
+        """Start workers for pending jobs, up to worker_count"""
+        with self.lock:
+            pending = sum(1 for job in self.jobs if job['status'] == 'pending')
+            to_start = min(pending, self.worker_count - self.active_workers)
+            self.active_workers += to_start
+        for _ in range(to_start):
+            threading.Thread(target=self.worker, daemon=True).start()
+        if to_start:
+            self.update_tray()
+
+    def next_job(self):
+        with self.lock:
+            for job in self.jobs:
+                if job['status'] == 'pending':
+                    job['status'] = 'running'
+                    job['progress'] = 0
+                    self.save()
+                    return job
+            self.active_workers -= 1
+            return None
 
-def select_and_convert(tray_icon):
+    def worker(self):
+        ffmpeg_path = get_ffmpeg_path()
+        while True:
+            job = self.next_job()
+            if job is None:
+                break
+            try:
+                success = self.run_job(ffmpeg_path, job)
+            except Exception as e:
+                # e.g. an input from jobs.json that was deleted before the restart
+                print(f"Error converting {job['input']}: {e}")
+                success = False
+            with self.lock:
+                job['status'] = 'done' if success else 'failed'
+                job['progress'] = 100
+                self.save()
+            self.update_tray()
+        self.on_worker_finished()
+
+    def run_job(self, ffmpeg_path, job):
+        """Probe, plan and convert one job, returns True on success"""
+        plan = plan_conversion(self.prober.probe(job['input']), job.get('profile', DEFAULT_PROFILE))
+        mode = describe_plan(plan)
+        print(f"Converting {job['input']} ({mode}) with {self.threads_per_job} threads")
+
+        def on_progress(current, duration):
+            percent = min(100, int(current / duration * 100))
+            # Only whole-percent changes can change the tray
+            if percent != job['progress']:
+                job['progress'] = percent
+                self.update_tray()
+
+        cmd = build_ffmpeg_cmd(ffmpeg_path, job['input'], job['output'], plan, self.threads_per_job)
+        started = time.monotonic()
+        success = run_ffmpeg_with_progress(cmd, on_progress, plan['duration'])
+        if success and plan['duration']:
+            elapsed = time.monotonic() - started
+            try:
+                self.stats.record(mode, plan['duration'], elapsed,
+                                  os.path.getsize(job['input']), os.path.getsize(job['output']))
+            except OSError as e:
+                # Input or output vanished right after the conversion, only the stats are lost
+                print(f"Could not record stats for {job['input']}: {e}")
+            print(f"{mode}: {plan['duration'] / elapsed:.1f}x realtime for {os.path.basename(job['input'])}")
+        return success
+
+    def on_worker_finished(self):
+        """When the last worker stops, report the batch and clear it from the queue"""
+        with self.lock:
+            if self.active_workers > 0 or any(job['status'] == 'pending' for job in self.jobs):
+                return
+            finished = [job for job in self.jobs if job['status'] == 'done']
+            failed = [job['input'] for job in self.jobs if job['status'] == 'failed']
+            self.jobs = []
+            self.tray_state = None
+            self.save()
+        self.tray_icon.icon = PROGRESS_ICONS[100]
+        self.tray_icon.title = "Conversion failed!" if failed and not finished else "Conversion complete!"
+        if finished or failed:
+            output_paths = [job['output'] for job in finished]
+            threading.Thread(target=show_finished_popup, args=(output_paths, failed), daemon=True).start()
+
+    def update_tray(self):
+        """Aggregate progress of the current batch into the tray icon and title"""
+        with self.lock:
+            total = len(self.jobs)
+            if total == 0:
+                return
+            done = sum(1 for job in self.jobs if job['status'] in ('done', 'failed'))
+            percent = sum(job['progress'] for job in self.jobs) // total
+            if (percent, done, total) == self.tray_state:
+                return
+            self.tray_state = (percent, done, total)
+        self.tray_icon.icon = PROGRESS_ICONS[percent]
+        self.tray_icon.title = f"Progress: {percent}% - {done}/{total} files done"
+
+def ask_overwrite(input_paths, parent):
+    """Drop files whose .mp4 already exists unless the user agrees to overwrite"""
+    existing = [path for path in input_paths if os.path.exists(os.path.splitext(path)[0] + ".mp4")]
+    if not existing:
+        return input_paths
+    names = "\n".join(os.path.basename(os.path.splitext(path)[0] + ".mp4") for path in existing[:10])
+    if len(existing) > 10:
+        names += f"\n... and {len(existing) - 10} more"
+    overwrite = messagebox.askyesno("Overwrite?", f"{len(existing)} file(s) already exist:\n{names}\n\nOverwrite?", parent=parent)
+    if overwrite:
+        return input_paths
+    return [path for path in input_paths if path not in existing]
+
+def select_and_convert(job_queue, folder=False):
     root = tk.Tk()
     root.withdraw()
     root.attributes('-topmost', True)  # Always on top
     try:
-        input_path = filedialog.askopenfilename(title="Select MOV file", filetypes=[("MOV files", "*.mov")], parent=root)
-        if input_path:
-            base, _ = os.path.splitext(input_path)
-            output_path = base + ".mp4"
-            if os.path.exists(output_path):
-                overwrite = messagebox.askyesno("Overwrite?", f"File '{output_path}' already exists. Overwrite?", parent=root)
-                if not overwrite:
-                    print("Conversion cancelled.")
-                    return
-            # Get FFmpeg path (works for both script and exe)
-            ffmpeg_path = get_ffmpeg_path()
-            
-            # Check if ffmpeg exists
-            if not os.path.exists(ffmpeg_path):
-                messagebox.showerror("Error", f"FFmpeg not found at: {ffmpeg_path}", parent=root)
-                return
-            
-            print(f"Using ffmpeg at: {ffmpeg_path}")
-            ffmpeg_cmd = [
-                ffmpeg_path,
-                "-i", input_path,
-                "-c:v", "libx264",
-                "-preset", "slow",
-                "-crf", "18",
-                "-pix_fmt", "yuv420p",
-                "-c:a", "aac",
-                "-b:a", "256k",
-                "-ar", "48000",
-                output_path
-            ]
-            threading.Thread(target=run_ffmpeg_with_progress, args=(ffmpeg_cmd, output_path, tray_icon), daemon=True).start()
+        if folder:
+            folder_path = filedialog.askdirectory(title="Select folder with MOV files", parent=root)
+            input_paths = []
+            if folder_path:
+                input_paths = sorted(
+                    os.path.join(folder_path, name) for name in os.listdir(folder_path)
+                    if name.lower().endswith(".mov")
+                )
         else:
+            input_paths = list(filedialog.askopenfilenames(title="Select MOV files", filetypes=[("MOV files", "*.mov")], parent=root))
+        if not input_paths:
             print("No file selected.")
+            return
+
+        # Check if ffmpeg exists (works for both script and exe)
+        ffmpeg_path = get_ffmpeg_path()
+        if not os.path.exists(ffmpeg_path):
+            messagebox.showerror("Error", f"FFmpeg not found at: {ffmpeg_path}", parent=root)
+            return
+        print(f"Using ffmpeg at: {ffmpeg_path}")
+
+        input_paths = ask_overwrite(input_paths, root)
+        if not input_paths:
+            print("Conversion cancelled.")
+            return
+        job_queue.add(input_paths)
     finally:
         root.destroy()
 
-def on_hotkey(tray_icon):
-    select_and_convert(tray_icon)
-
-def on_convert_click(icon, item):
-    select_and_convert(icon)
+def show_stats(job_queue):
+    popup = tk.Tk()
+    popup.withdraw()
+    messagebox.showinfo("Conversion statistics", job_queue.stats.report(), parent=popup)
+    popup.destroy()
 
 def on_exit(icon, item):
     icon.stop()
     os._exit(0)
 
 def tray_app():
-    icon = pystray.Icon("recoder", show_progress_bar(0), "Recoder", menu=pystray.Menu(
-        pystray.MenuItem("Convert MOV to MP4", on_convert_click),
+    def profile_item(profile):
+        return pystray.MenuItem(
+            profile.capitalize(),
+            lambda icon, item: job_queue.set_profile(profile),
+            checked=lambda item: job_queue.settings['profile'] == profile,
+            radio=True
+        )
+    icon = pystray.Icon("recoder", PROGRESS_ICONS[0], "Recoder", menu=pystray.Menu(
+        pystray.MenuItem("Convert MOV files to MP4", lambda icon, item: select_and_convert(job_queue)),
+        pystray.MenuItem("Convert folder to MP4", lambda icon, item: select_and_convert(job_queue, folder=True)),
+        pystray.MenuItem("Encoding profile", pystray.Menu(*(profile_item(profile) for profile in PROFILES))),
+        pystray.MenuItem("Show statistics", lambda icon, item: show_stats(job_queue)),
         pystray.MenuItem("Exit", on_exit)
     ))
+    job_queue = JobQueue(icon)
     def hotkey_listener():
-        keyboard.add_hotkey('ctrl+alt+x', lambda: on_hotkey(icon))
+        keyboard.add_hotkey('ctrl+alt+x', lambda: select_and_convert(job_queue))
         keyboard.wait()
     threading.Thread(target=hotkey_listener, daemon=True).start()
+    # Resume jobs left over from the last run
+    job_queue.start()
     icon.run()
 
 if __name__ == "__main__":
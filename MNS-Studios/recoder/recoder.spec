@@ -6,7 +6,8 @@ a = Analysis(
     ['main.py'],
     pathex=[],
     binaries=[
-        ('ffmpeg/ffmpeg.exe', 'ffmpeg')
+        ('ffmpeg/ffmpeg.exe', 'ffmpeg'),
+        ('ffmpeg/ffprobe.exe', 'ffmpeg')
     ],
     datas=[],
     hiddenimports=[],
@@ -1,8 +1,15 @@
 import requests
+from requests.adapters import HTTPAdapter
 import os
 import time
 import json
 import sys
+import random
+import re
+import bisect
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
 from dotenv import load_dotenv
 from datetime import datetime, timezone, timedelta
 
@@ -24,89 +31,288 @@ if not webhook_url:
 else:
     print("✅ Webhook URL loaded")
 
-# Track the last known match ID to detect new matches
-last_known_match_id = None
+# API endpoints
+HISTORY_URL = "https://api.henrikdev.xyz/valorant/v1/premier/carings baes/carba/history"
+MATCH_URL = "https://api.henrikdev.xyz/valorant/v2/match/{match_id}"
+
+# HTTP settings: (connect, read) timeout in seconds and retry backoff
+REQUEST_TIMEOUT = (5, 20)
+MAX_RETRIES = 5
+BACKOFF_BASE = 2
+BACKOFF_MAX = 300
+# Methods that are safe to send twice; others are not retried once they may have arrived
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+# Polling intervals in seconds
+POLL_FAST = 10      # a match was just played or we're inside a usual match window
+POLL_NORMAL = 60    # played today, but not right now
+POLL_IDLE = 300     # nothing going on
+RECENT_MATCH_WINDOW = timedelta(hours=2)
+ACTIVE_DAY_WINDOW = timedelta(hours=24)
+MATCH_WINDOW_BEFORE = timedelta(minutes=30)
+MATCH_WINDOW_AFTER = timedelta(hours=2)
+
+# Concurrency and Discord webhook limits
+MAX_DETAIL_WORKERS = 4
+WEBHOOK_MAX_EMBEDS = 10
+WEBHOOK_MAX_CHARS = 6000
+
+# Local store of processed matches and cached match details
+STORE_FILE = os.getenv('STORE_FILE', 'matches.db')
+
+def utc_now():
+    """Current time in UTC (replaced by the replay harness with a virtual clock)"""
+    return datetime.now(timezone.utc)
+
+def create_session():
+    """Create a keep-alive session with connection pooling for the API and webhook"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Accept": "*/*"})
+    return session
+
+http = create_session()
+
+def retry_after_seconds(response):
+    """Read Retry-After (seconds or HTTP date) from a response, None if missing"""
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - utc_now()).total_seconds())
+    except Exception:
+        return None
+
+def request_with_backoff(method, url, **kwargs):
+    """Send a request, retrying network errors, 429 and 5xx with exponential backoff.
+
+    Honors Retry-After when the server sends one. Returns the response, or None
+    when all retries failed. Non-idempotent requests (the webhook POST) are only
+    retried when they cannot have arrived: connection errors and 429 with Retry-After.
+    A 5xx or timeout may come after the message was delivered, so retrying could post it twice.
+    """
+    idempotent = method.upper() in IDEMPOTENT_METHODS
+    delay = BACKOFF_BASE
+    for attempt in range(1, MAX_RETRIES + 1):
+        try:
+            response = http.request(method, url, timeout=REQUEST_TIMEOUT, **kwargs)
+        except requests.RequestException as e:
+            if not idempotent and not isinstance(e, requests.ConnectionError):
+                print(f"⚠️ Request error ({e}), not retrying {method}")
+                return None
+            wait = delay
+            print(f"⚠️ Request error ({e}), retry {attempt}/{MAX_RETRIES} in {wait:.0f}s")
+        else:
+            if response.status_code != 429 and response.status_code < 500:
+                return response
+            retry_after = retry_after_seconds(response)
+            if not idempotent and (response.status_code != 429 or retry_after is None):
+                return response
+            wait = retry_after if retry_after is not None else delay
+            print(f"⚠️ HTTP {response.status_code}, retry {attempt}/{MAX_RETRIES} in {wait:.0f}s")
+        if attempt == MAX_RETRIES:
+            break
+        # Jitter keeps several clients from retrying in lockstep
+        time.sleep(min(wait, BACKOFF_MAX) + random.uniform(0, 1))
+        delay = min(delay * 2, BACKOFF_MAX)
+    return None
 
 def get_team_history():
     """Get the team's match history from the API"""
     try:
-        response = requests.get(
-            "https://api.henrikdev.xyz/valorant/v1/premier/carings baes/carba/history",
-            headers={"Authorization": api_key, "Accept": "*/*"},
-        )
+        response = request_with_backoff("GET", HISTORY_URL, headers={"Authorization": api_key})
         
-        if response.status_code == 200:
+        if response is not None and response.status_code == 200:
             return response.json()
         else:
-            print(f"Error getting history: {response.status_code}")
+            print(f"Error getting history: {response.status_code if response is not None else 'no response'}")
             return None
     except Exception as e:
         print(f"Error fetching history: {e}")
         return None
 
-def get_latest_league_match_id(history_data):
-    """Extract the latest league match ID from history data"""
+# started_at values like 2024-05-01T19:03:12.52Z or 2024-05-01T19:03:12+02:00
+TIMESTAMP_PATTERN = re.compile(
+    r'(\d{4})-(\d{2})-(\d{2})[T ](\d{2}):(\d{2}):(\d{2})(?:\.(\d+))?(?:(Z)|([+-])(\d{2}):?(\d{2}))?$'
+)
+MIN_DATE = datetime.min.replace(tzinfo=timezone.utc)
+
+# Parsed start times per match ID; a match's start time never changes
+match_dates = {}
+
+def parse_timestamp(date_str):
+    """Parse an API timestamp into an aware datetime (naive values are UTC), None if invalid"""
+    m = TIMESTAMP_PATTERN.match(date_str)
+    if not m:
+        return None
+    year, month, day, hour, minute, second, fraction, zulu, sign, tz_hours, tz_minutes = m.groups()
+    tz = timezone.utc
+    if sign:
+        offset = timedelta(hours=int(tz_hours), minutes=int(tz_minutes))
+        tz = timezone(offset if sign == '+' else -offset)
+    # Pad or cut the fraction to microseconds
+    micro = int(fraction.ljust(6, '0')[:6]) if fraction else 0
+    try:
+        return datetime(int(year), int(month), int(day), int(hour), int(minute), int(second), micro, tzinfo=tz)
+    except ValueError:
+        return None
+
+def parse_match_date(match):
+    """Parse a match's started_at into an aware datetime (datetime.min on failure)"""
+    match_id = match.get('id')
+    cached = match_dates.get(match_id)
+    if cached is not None:
+        return cached
+    
+    date_str = match.get('started_at', '')
+    parsed_date = parse_timestamp(date_str) if date_str else None
+    if parsed_date is None:
+        if date_str:
+            print(f"Error parsing date '{date_str}'")
+        parsed_date = MIN_DATE
+    if match_id:
+        match_dates[match_id] = parsed_date
+    return parsed_date
+
+class MatchTimeline:
+    """League matches ordered by start time, so each poll only handles matches it hasn't seen"""
+    
+    def __init__(self):
+        self.starts = []    # sorted start times
+        self.matches = []   # match infos in the same order
+        self.seen = set()
+    
+    def update(self, league_matches):
+        """Add matches not seen before and return them, oldest first"""
+        new_matches = []
+        for match in league_matches:
+            match_id = match.get('id')
+            if not match_id or match_id in self.seen:
+                continue
+            self.seen.add(match_id)
+            started = parse_match_date(match)
+            index = bisect.bisect_right(self.starts, started)
+            self.starts.insert(index, started)
+            self.matches.insert(index, match)
+            new_matches.append(match)
+        new_matches.sort(key=parse_match_date)
+        return new_matches
+    
+    def latest(self):
+        return self.matches[-1] if self.matches else None
+    
+    def match_starts(self):
+        """Start times of all matches with a valid date, oldest first"""
+        first_valid = bisect.bisect_right(self.starts, MIN_DATE)
+        return self.starts[first_valid:]
+
+def get_league_matches(history_data):
+    """Return the league match list from history data (empty if unavailable)"""
+    if not history_data or history_data.get('status') != 200:
+        return []
+    return history_data.get('data', {}).get('league_matches', [])
+
+def in_match_window(now, match_starts):
+    """Check if now falls into a weekly slot in which the team has played before"""
+    week = timedelta(days=7)
+    for started in match_starts:
+        # Shift the past start into the current week and compare
+        offset = (now - started) % week
+        if offset <= MATCH_WINDOW_AFTER or week - offset <= MATCH_WINDOW_BEFORE:
+            return True
+    return False
+
+def next_poll_interval(match_starts, now=None):
+    """Poll fast around matches, slower on match days, and rarely otherwise.
+    
+    match_starts must be sorted oldest first (see MatchTimeline.match_starts).
+    """
+    if now is None:
+        now = utc_now()
+    if not match_starts:
+        return POLL_NORMAL
+    
+    since_latest = now - match_starts[-1]
+    if since_latest <= RECENT_MATCH_WINDOW or in_match_window(now, match_starts):
+        return POLL_FAST
+    if since_latest <= ACTIVE_DAY_WINDOW:
+        return POLL_NORMAL
+    return POLL_IDLE
+
+def get_latest_league_match_id(history_data, timeline):
+    """Add the history's league matches to the timeline and return the latest match ID and info"""
     if not history_data or history_data.get('status') != 200:
         return None
     
-    league_matches = history_data.get('data', {}).get('league_matches', [])
+    league_matches = get_league_matches(history_data)
     if not league_matches:
         return None
     
-    # Sort by date to get the most recent
-    def parse_date(match):
-        try:
-            date_str = match.get('started_at', '')
-            if not date_str:
-                return datetime.min.replace(tzinfo=timezone.utc)
-            
-            # Handle different date formats and ensure timezone awareness
-            if date_str.endswith('Z'):
-                date_str = date_str.replace('Z', '+00:00')
-            
-            # Fix microseconds format - pad to 6 digits if needed
-            if '+' in date_str or '-' in date_str[-6:]:
-                # Split at timezone
-                if '+' in date_str:
-                    dt_part, tz_part = date_str.rsplit('+', 1)
-                    tz_part = '+' + tz_part
-                else:
-                    dt_part, tz_part = date_str.rsplit('-', 1)
-                    tz_part = '-' + tz_part
-                
-                # Fix microseconds in datetime part
-                if '.' in dt_part:
-                    base_part, micro_part = dt_part.rsplit('.', 1)
-                    # Pad microseconds to 6 digits
-                    micro_part = micro_part.ljust(6, '0')[:6]
-                    date_str = f"{base_part}.{micro_part}{tz_part}"
-            
-            parsed_date = datetime.fromisoformat(date_str)
-            
-            # If the datetime is naive (no timezone), assume UTC
-            if parsed_date.tzinfo is None:
-                parsed_date = parsed_date.replace(tzinfo=timezone.utc)
-            
-            return parsed_date
-        except Exception as e:
-            print(f"Error parsing date '{match.get('started_at', '')}': {e}")
-            return datetime.min.replace(tzinfo=timezone.utc)
-    
-    latest_match = max(league_matches, key=parse_date)
+    # The timeline keeps matches sorted by date, the most recent is last
+    timeline.update(league_matches)
+    latest_match = timeline.latest()
     return latest_match.get('id'), latest_match
 
+class MatchStore:
+    """SQLite store of announced match IDs and cached match details"""
+    
+    def __init__(self, path=STORE_FILE):
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS processed_matches (
+                match_id TEXT PRIMARY KEY,
+                started_at TEXT,
+                processed_at TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS match_details (
+                match_id TEXT PRIMARY KEY,
+                data TEXT NOT NULL
+            );
+        """)
+        self.conn.commit()
+        self.processed = {row[0] for row in self.conn.execute("SELECT match_id FROM processed_matches")}
+    
+    def is_empty(self):
+        return not self.processed
+    
+    def mark_processed(self, matches):
+        """Remember matches as handled so they are never announced again"""
+        now = utc_now().isoformat()
+        rows = [(match.get('id'), match.get('started_at'), now) for match in matches if match.get('id')]
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO processed_matches (match_id, started_at, processed_at) VALUES (?, ?, ?)", rows)
+        self.conn.commit()
+        self.processed.update(row[0] for row in rows)
+    
+    def unprocessed(self, league_matches):
+        """Return matches not handled yet, oldest first"""
+        new_matches = [match for match in league_matches if match.get('id') and match['id'] not in self.processed]
+        return sorted(new_matches, key=parse_match_date)
+    
+    def get_details(self, match_id):
+        row = self.conn.execute("SELECT data FROM match_details WHERE match_id = ?", (match_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+    
+    def save_details(self, match_id, match_details):
+        self.conn.execute("INSERT OR REPLACE INTO match_details (match_id, data) VALUES (?, ?)",
+                          (match_id, json.dumps(match_details)))
+        self.conn.commit()
+
 def get_match_details(match_id):
     """Get detailed match information"""
     try:
-        response = requests.get(
-            f"https://api.henrikdev.xyz/valorant/v2/match/{match_id}",
-            headers={"Authorization": api_key, "Accept": "*/*"},
-        )
+        response = request_with_backoff("GET", MATCH_URL.format(match_id=match_id), headers={"Authorization": api_key})
         
-        if response.status_code == 200:
+        if response is not None and response.status_code == 200:
             return response.json()
         else:
-            print(f"Error getting match details: {response.status_code}")
+            print(f"Error getting match details: {response.status_code if response is not None else 'no response'}")
             return None
     except Exception as e:
         print(f"Error fetching match details: {e}")
@@ -177,12 +383,8 @@ def get_match_result(match_data, carba_team_color):
         'final_score': f"{our_rounds} - {enemy_rounds}"
     }
 
-def send_webhook(carba_players, match_result, points_info, match_data):
-    """Send notification to Discord webhook"""
-    if not webhook_url:
-        print("No webhook URL configured")
-        return
-    
+def create_embed(carba_players, match_result, points_info, match_data):
+    """Build the Discord embed for one match"""
     # Get map name
     map_name = match_data.get('data', {}).get('metadata', {}).get('map', 'Unknown')
     
@@ -239,18 +441,68 @@ def send_webhook(carba_players, match_result, points_info, match_data):
         }
     }
     
-    payload = {
-        "embeds": [embed]
-    }
+    return embed
+
+def embed_size(embed):
+    """Count the characters Discord counts against the 6000 per-message limit"""
+    size = len(embed.get('title', '')) + len(embed.get('footer', {}).get('text', ''))
+    for field in embed.get('fields', []):
+        size += len(field['name']) + len(field['value'])
+    return size
+
+def batch_embeds(embeds):
+    """Split embeds into messages of at most 10 embeds and 6000 characters"""
+    batches = []
+    current, current_size = [], 0
+    for embed in embeds:
+        size = embed_size(embed)
+        if current and (len(current) >= WEBHOOK_MAX_EMBEDS or current_size + size > WEBHOOK_MAX_CHARS):
+            batches.append(current)
+            current, current_size = [], 0
+        current.append(embed)
+        current_size += size
+    if current:
+        batches.append(current)
+    return batches
+
+def wait_for_rate_limit(response):
+    """Sleep until the webhook bucket refills if Discord says it is empty"""
+    if response.headers.get('X-RateLimit-Remaining') == '0':
+        try:
+            reset_after = float(response.headers.get('X-RateLimit-Reset-After', 0))
+        except ValueError:
+            reset_after = 0
+        if reset_after > 0:
+            print(f"⏳ Webhook rate limit reached, waiting {reset_after:.1f}s")
+            time.sleep(reset_after)
+
+def send_embeds(embeds):
+    """Send embeds to the Discord webhook in batches. Returns one success flag per embed."""
+    if not webhook_url:
+        print("No webhook URL configured")
+        return [False] * len(embeds)
     
-    try:
-        response = requests.post(webhook_url, json=payload)
-        if response.status_code == 204:
-            print("✅ Webhook sent successfully!")
-        else:
-            print(f"❌ Webhook failed: {response.status_code}")
-    except Exception as e:
-        print(f"❌ Error sending webhook: {e}")
+    results = []
+    for batch in batch_embeds(embeds):
+        sent = False
+        try:
+            # request_with_backoff retries 429s using Discord's Retry-After
+            response = request_with_backoff("POST", webhook_url, json={"embeds": batch})
+            if response is not None and response.status_code == 204:
+                print(f"✅ Webhook sent successfully! ({len(batch)} match(es))")
+                sent = True
+                wait_for_rate_limit(response)
+            else:
+                print(f"❌ Webhook failed: {response.status_code if response is not None else 'no response'}")
+        except Exception as e:
+            print(f"❌ Error sending webhook: {e}")
+        results.extend([sent] * len(batch))
+    return results
+
+def send_webhook(carba_players, match_result, points_info, match_data):
+    """Send notification for a single match to Discord webhook"""
+    embed = create_embed(carba_players, match_result, points_info, match_data)
+    return send_embeds([embed])[0]
 
 def test_webhook():
     """Test the webhook by sending the latest match result"""
@@ -263,7 +515,7 @@ def test_webhook():
         return
     
     # Get latest league match
-    result = get_latest_league_match_id(history_data)
+    result = get_latest_league_match_id(history_data, MatchTimeline())
     if not result:
         print("❌ No league matches found")
         return
@@ -302,27 +554,91 @@ def test_webhook():
     send_webhook(carba_players, match_result, points_info, match_details)
     print("🧪 Test webhook completed!")
 
-def main():
-    global last_known_match_id
+def fetch_missing_details(store, matches):
+    """Load match details from the store and fetch the missing ones concurrently"""
+    details = {match['id']: store.get_details(match['id']) for match in matches}
+    missing = [match_id for match_id, data in details.items() if data is None]
+    if missing:
+        with ThreadPoolExecutor(max_workers=min(MAX_DETAIL_WORKERS, len(missing))) as executor:
+            fetched = executor.map(get_match_details, missing)
+            # The store is only touched from this thread
+            for match_id, match_details in zip(missing, fetched):
+                if match_details and match_details.get('status') == 200:
+                    store.save_details(match_id, match_details)
+                    details[match_id] = match_details
+    return details
+
+def build_match_embed(match_info, match_details):
+    """Build the embed for a match, or None when our team isn't in it"""
+    # Extract our players and team info
+    carba_players, carba_team_color = extract_carba_players(match_details)
+    if not carba_players or not carba_team_color:
+        return None
+    
+    # Get match result
+    match_result = get_match_result(match_details, carba_team_color)
+    
+    # Get points info
+    points_info = {
+        'points_before': match_info.get('points_before', 0),
+        'points_after': match_info.get('points_after', 0),
+        'points_gained': match_info.get('points_after', 0) - match_info.get('points_before', 0)
+    }
+    
+    print(f"📊 Match Result: {match_result['final_score']} ({'WIN' if match_result['won'] else 'LOSS'})")
+    print(f"💰 Points: {points_info['points_after']} (+{points_info['points_gained']})")
+    
+    return create_embed(carba_players, match_result, points_info, match_details)
+
+def announce_new_matches(store, new_matches):
+    """Fetch details for new matches and announce them in batched webhook posts.
+    
+    Matches are marked as processed once announced (or once it's clear they can't be);
+    failed fetches and webhook posts are retried on the next poll.
+    """
+    for match_info in new_matches:
+        print(f"🆕 NEW MATCH DETECTED: {match_info['id']}")
     
+    details = fetch_missing_details(store, new_matches)
+    
+    announced, embeds, skipped = [], [], []
+    for match_info in new_matches:
+        match_details = details[match_info['id']]
+        if match_details is None:
+            print(f"❌ Failed to get match details for {match_info['id']}")
+            continue
+        embed = build_match_embed(match_info, match_details)
+        if embed is None:
+            # Retrying won't change the match data, so don't try again
+            print("❌ Could not find Carings Baes team data")
+            skipped.append(match_info)
+            continue
+        announced.append(match_info)
+        embeds.append(embed)
+    
+    results = send_embeds(embeds) if embeds else []
+    store.mark_processed(skipped + [match for match, sent in zip(announced, results) if sent])
+
+def main():
     # Check for command line arguments
     if len(sys.argv) > 1 and sys.argv[1] == '--test':
         test_webhook()
         return
     
     print("🚀 Starting Premier League Monitor...")
-    print("⏱️  Checking for new matches every 10 seconds")
+    print(f"⏱️  Checking for new matches every {POLL_FAST}-{POLL_IDLE} seconds (faster around match times)")
     print("📡 Press Ctrl+C to stop")
     print("💡 Tip: Run with '--test' to test webhook with latest match")
     
-    # Get initial state
-    history_data = get_team_history()
-    if history_data:
-        result = get_latest_league_match_id(history_data)
-        if result:
-            last_known_match_id, _ = result
-            print(f"🔍 Initial latest match ID: {last_known_match_id}")
+    store = MatchStore(STORE_FILE)
+    timeline = MatchTimeline()
+    pending = []    # seen but not announced yet (failed fetch or webhook)
+    # A fresh store takes the history of the first successful poll as already announced
+    seeded = not store.is_empty()
+    if seeded:
+        print(f"🔍 Resuming with {len(store.processed)} known matches from {STORE_FILE}")
     
+    poll_interval = POLL_NORMAL
     while True:
         try:
             print(f"🔄 Checking for new matches... ({datetime.now().strftime('%H:%M:%S')})")
@@ -331,64 +647,45 @@ def main():
             history_data = get_team_history()
             if not history_data:
                 print("❌ Failed to get history data")
-                time.sleep(10)
+                time.sleep(poll_interval)
                 continue
             
-            # Check for new match
-            result = get_latest_league_match_id(history_data)
-            if not result:
+            league_matches = get_league_matches(history_data)
+            # Only matches not seen in earlier polls need a look
+            seen_now = timeline.update(league_matches)
+            poll_interval = next_poll_interval(timeline.match_starts())
+            
+            # First run: treat the existing history as already announced, even if it is empty,
+            # so the first league match that shows up later still gets announced
+            if not seeded:
+                store.mark_processed(league_matches)
+                seeded = True
+                print(f"🔍 Initial history stored: {len(league_matches)} matches")
+            
+            if not league_matches:
                 print("❌ No league matches found")
-                time.sleep(10)
+                time.sleep(poll_interval)
                 continue
             
-            current_match_id, match_info = result
-            
-            # Check if this is a new match
-            if current_match_id != last_known_match_id:
-                print(f"🆕 NEW MATCH DETECTED: {current_match_id}")
-                
-                # Get detailed match information
-                match_details = get_match_details(current_match_id)
-                if match_details and match_details.get('status') == 200:
-                    
-                    # Extract our players and team info
-                    carba_players, carba_team_color = extract_carba_players(match_details)
-                    
-                    if carba_players and carba_team_color:
-                        # Get match result
-                        match_result = get_match_result(match_details, carba_team_color)
-                        
-                        # Get points info
-                        points_info = {
-                            'points_before': match_info.get('points_before', 0),
-                            'points_after': match_info.get('points_after', 0),
-                            'points_gained': match_info.get('points_after', 0) - match_info.get('points_before', 0)
-                        }
-                        
-                        print(f"📊 Match Result: {match_result['final_score']} ({'WIN' if match_result['won'] else 'LOSS'})")
-                        print(f"💰 Points: {points_info['points_after']} (+{points_info['points_gained']})")
-                        
-                        # Send webhook notification
-                        send_webhook(carba_players, match_result, points_info, match_details)
-                        
-                        # Update last known match
-                        last_known_match_id = current_match_id
-                    else:
-                        print("❌ Could not find Carings Baes team data")
-                else:
-                    print("❌ Failed to get match details")
+            # Newly seen matches plus earlier ones still waiting, diffed against the store
+            # so missed matches catch up exactly once
+            pending = store.unprocessed(pending + seen_now)
+            if pending:
+                announce_new_matches(store, pending)
+                pending = store.unprocessed(pending)
             else:
                 print("✅ No new matches")
             
-            # Wait 10 seconds before next check
-            time.sleep(10)
+            # Wait before next check
+            print(f"💤 Next check in {poll_interval} seconds")
+            time.sleep(poll_interval)
             
         except KeyboardInterrupt:
             print("\n🛑 Monitor stopped by user")
             break
         except Exception as e:
             print(f"❌ Error in main loop: {e}")
-            time.sleep(10)
+            time.sleep(poll_interval)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,340 @@
+"""Offline replay harness and benchmark for the Premier League Monitor.
+
+Runs main() and test_webhook() against a fixture transport instead of the
+henrikdev API and Discord, on a virtual clock, so a simulated match history
+replays deterministically in a fraction of a second.
+
+Usage:
+    python replay.py                      # benchmark all built-in scenarios
+    python replay.py --scenario burst -v  # one scenario with monitor output
+    python replay.py --fixtures recorded/ --replay-last 3
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import re
+import statistics
+import sys
+import threading
+import time
+from datetime import datetime, timezone, timedelta
+from types import SimpleNamespace
+
+import main as monitor
+
+WEBHOOK_URL = "https://discord.invalid/api/webhooks/replay"
+MATCH_LENGTH = timedelta(minutes=40)
+RUN_TAIL = timedelta(hours=1)
+
+# Discord allows 5 webhook posts per 2 seconds
+WEBHOOK_BUCKET_SIZE = 5
+WEBHOOK_BUCKET_WINDOW = 2.0
+
+MAPS = ["Ascent", "Bind", "Haven", "Lotus", "Split", "Sunset", "Icebox"]
+AGENTS = ["Jett", "Sova", "Omen", "Killjoy", "Skye", "Raze", "Viper"]
+ENEMY_PATTERN = re.compile(r" vs (.+)$")
+
+
+class VirtualClock:
+    """Replaces time.sleep and utc_now; stops the monitor at the end of the scenario"""
+
+    def __init__(self, start, end):
+        self.now = start
+        self.end = end
+
+    def sleep(self, seconds):
+        self.now += timedelta(seconds=seconds)
+        if self.now >= self.end:
+            # main() treats this like Ctrl+C and stops cleanly
+            raise KeyboardInterrupt
+
+    def utc_now(self):
+        return self.now
+
+
+class FixtureResponse:
+    def __init__(self, status_code, data=None, headers=None):
+        self.status_code = status_code
+        self.data = data
+        self.headers = headers or {}
+
+    def json(self):
+        return self.data
+
+
+class FixtureSession:
+    """Stands in for requests.Session and answers both endpoints from a scenario"""
+
+    def __init__(self, scenario, clock, rate_limit_every=0):
+        self.scenario = scenario
+        self.clock = clock
+        self.rate_limit_every = rate_limit_every
+        self.details = {entry['match']['id']: entry['details'] for entry in scenario['matches']}
+        self.lock = threading.Lock()
+        self.history_calls = 0
+        self.detail_calls = 0
+        self.rate_limited = 0
+        self.posts = []     # (virtual time, embeds)
+
+    def request(self, method, url, timeout=None, headers=None, json=None):
+        with self.lock:
+            if url == monitor.HISTORY_URL:
+                return self.history()
+            if url.startswith(monitor.MATCH_URL.format(match_id="")):
+                return self.match_details(url.rsplit("/", 1)[-1])
+            if url == WEBHOOK_URL and method == "POST":
+                return self.webhook(json)
+            return FixtureResponse(404)
+
+    def api_call_limited(self):
+        """Every rate_limit_every-th API call answers 429 like henrikdev does when busy"""
+        calls = self.history_calls + self.detail_calls
+        if self.rate_limit_every and calls % self.rate_limit_every == 0:
+            self.rate_limited += 1
+            return FixtureResponse(429, headers={'Retry-After': '30'})
+        return None
+
+    def history(self):
+        self.history_calls += 1
+        limited = self.api_call_limited()
+        if limited:
+            return limited
+        visible = [entry['match'] for entry in self.scenario['matches'] if entry['visible_at'] <= self.clock.now]
+        visible.reverse()   # newest first, like the API
+        return FixtureResponse(200, {'status': 200, 'data': {'league_matches': visible}})
+
+    def match_details(self, match_id):
+        self.detail_calls += 1
+        limited = self.api_call_limited()
+        if limited:
+            return limited
+        if match_id not in self.details:
+            return FixtureResponse(404)
+        return FixtureResponse(200, self.details[match_id])
+
+    def webhook(self, payload):
+        now = self.clock.now
+        window_start = now - timedelta(seconds=WEBHOOK_BUCKET_WINDOW)
+        recent = sum(1 for posted, _ in self.posts if posted > window_start)
+        if recent >= WEBHOOK_BUCKET_SIZE:
+            return FixtureResponse(429, headers={'Retry-After': str(WEBHOOK_BUCKET_WINDOW)})
+        self.posts.append((now, payload['embeds']))
+        return FixtureResponse(204, headers={
+            'X-RateLimit-Remaining': str(WEBHOOK_BUCKET_SIZE - recent - 1),
+            'X-RateLimit-Reset-After': str(WEBHOOK_BUCKET_WINDOW),
+        })
+
+
+def make_details(match_id, rng):
+    """Synthetic v2 match payload with Carings Baes on a random side"""
+    our_color, enemy_color = rng.choice([("red", "blue"), ("blue", "red")])
+    won = rng.random() < 0.5
+    winner_rounds, loser_rounds = 13, rng.randint(2, 11)
+    players = []
+    for color in (our_color, enemy_color):
+        for i in range(5):
+            players.append({
+                'name': f"{color}{i}", 'tag': "EUW", 'team': color.capitalize(),
+                'character': rng.choice(AGENTS),
+                'stats': {'kills': rng.randint(5, 30), 'deaths': rng.randint(5, 25), 'assists': rng.randint(0, 15)},
+            })
+    return {
+        'status': 200,
+        'data': {
+            'metadata': {'map': rng.choice(MAPS)},
+            'players': {'all_players': players},
+            'teams': {
+                our_color: {'has_won': won, 'rounds_won': winner_rounds if won else loser_rounds,
+                            'roster': {'name': 'Carings Baes', 'tag': 'CarBa'}},
+                enemy_color: {'has_won': not won, 'rounds_won': loser_rounds if won else winner_rounds,
+                              'roster': {'name': f"Team {match_id}", 'tag': 'ENEMY'}},
+            },
+        },
+    }
+
+
+def make_scenario(name, starts, start, rng):
+    """Build a scenario from match start times; matches show up in the history when they end"""
+    matches = []
+    points = 0
+    for index, started in enumerate(sorted(starts)):
+        match_id = f"{name}-{index:03d}"
+        gained = rng.choice([25, 50, 75, 100])
+        matches.append({
+            'match': {
+                'id': match_id,
+                'started_at': started.strftime('%Y-%m-%dT%H:%M:%S.') + f"{rng.randint(0, 999):03d}Z",
+                'points_before': points,
+                'points_after': points + gained,
+            },
+            'details': make_details(match_id, rng),
+            'visible_at': started + MATCH_LENGTH,
+        })
+        points += gained
+    end = max(entry['visible_at'] for entry in matches) + RUN_TAIL
+    return {'name': name, 'start': start, 'end': end, 'matches': matches}
+
+
+def weekly_scenario(rng, weeks=4, history_weeks=2):
+    """Two matches on Wednesday and Sunday evenings; earlier weeks are existing history"""
+    first_monday = datetime(2025, 1, 6, tzinfo=timezone.utc)
+    starts = []
+    for week in range(history_weeks + weeks):
+        for day in (2, 6):
+            evening = first_monday + timedelta(weeks=week, days=day, hours=19)
+            starts += [evening, evening + timedelta(hours=1)]
+    # Start off the 10 s grid so polls don't line up with match ends by accident
+    start = first_monday + timedelta(weeks=history_weeks, seconds=7)
+    return make_scenario("weekly", starts, start, rng)
+
+
+def burst_scenario(rng):
+    """The monitor was down during a whole evening: six matches appear at once"""
+    evening = datetime(2025, 2, 5, 17, tzinfo=timezone.utc)
+    history = [evening - timedelta(days=7, hours=-i) for i in range(2)]
+    starts = history + [evening] * 6
+    return make_scenario("burst", starts, evening - timedelta(hours=1, seconds=-7), rng)
+
+
+def fixture_scenario(directory, replay_last):
+    """Replay recorded API responses: history.json plus matches/<id>.json"""
+    with open(os.path.join(directory, "history.json"), 'r', encoding='utf-8') as f:
+        league_matches = json.load(f)['data']['league_matches']
+    matches = []
+    for match in sorted(league_matches, key=monitor.parse_match_date):
+        with open(os.path.join(directory, "matches", f"{match['id']}.json"), 'r', encoding='utf-8') as f:
+            details = json.load(f)
+        matches.append({'match': match, 'details': details,
+                        'visible_at': monitor.parse_match_date(match) + MATCH_LENGTH})
+    monitor.match_dates.clear()
+    replayed = matches[-replay_last:] if replay_last else matches
+    start = replayed[0]['visible_at'] - timedelta(minutes=1)
+    end = matches[-1]['visible_at'] + RUN_TAIL
+    return {'name': os.path.basename(os.path.normpath(directory)), 'start': start, 'end': end, 'matches': matches}
+
+
+def install(scenario, rate_limit_every):
+    """Point the monitor module at the fixture transport and a fresh virtual clock"""
+    clock = VirtualClock(scenario['start'], scenario['end'])
+    session = FixtureSession(scenario, clock, rate_limit_every)
+    monitor.http = session
+    monitor.time = SimpleNamespace(sleep=clock.sleep)
+    monitor.utc_now = clock.utc_now
+    monitor.api_key = "replay"
+    monitor.webhook_url = WEBHOOK_URL
+    monitor.STORE_FILE = ":memory:"
+    monitor.match_dates.clear()
+    random.seed(0)
+    return clock, session
+
+
+def run_monitor(scenario, rate_limit_every=0, verbose=False):
+    """Run main() through the scenario and measure detection latency and API usage"""
+    clock, session = install(scenario, rate_limit_every)
+    output = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+    saved_argv = sys.argv
+    sys.argv = ["main.py"]
+    started = time.perf_counter()
+    try:
+        with output:
+            monitor.main()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sys.argv = saved_argv
+    runtime = time.perf_counter() - started
+
+    # Map each posted embed back to its match via the enemy team name
+    enemy_to_entry = {}
+    for entry in scenario['matches']:
+        teams = entry['details']['data']['teams']
+        for team in teams.values():
+            name = team['roster']['name']
+            if name != 'Carings Baes':
+                enemy_to_entry.setdefault(name, []).append(entry)
+    announced = {}
+    duplicates = 0
+    for posted, embeds in session.posts:
+        for embed in embeds:
+            score_field = next(field for field in embed['fields'] if field['name'] == "🎯 Final Score")
+            candidates = enemy_to_entry.get(ENEMY_PATTERN.search(score_field['value']).group(1), [])
+            entry = next((e for e in candidates if e['match']['id'] not in announced), None)
+            if entry is None:
+                duplicates += 1
+                continue
+            announced[entry['match']['id']] = posted
+
+    expected = [entry for entry in scenario['matches'] if entry['visible_at'] > scenario['start']]
+    latencies = [(announced[entry['match']['id']] - entry['visible_at']).total_seconds()
+                 for entry in expected if entry['match']['id'] in announced]
+    api_calls = session.history_calls + session.detail_calls
+    return {
+        'scenario': scenario['name'],
+        'expected': len(expected),
+        'detected': len(latencies),
+        'unexpected': len(announced) - len(latencies) + duplicates,
+        'latency_mean': statistics.mean(latencies) if latencies else 0,
+        'latency_max': max(latencies) if latencies else 0,
+        'history_calls': session.history_calls,
+        'detail_calls': session.detail_calls,
+        'calls_per_match': api_calls / len(latencies) if latencies else float(api_calls),
+        'webhook_posts': len(session.posts),
+        'rate_limited': session.rate_limited,
+        'runtime': runtime,
+    }
+
+
+def run_test_webhook(scenario, verbose=False):
+    """Run test_webhook() at the end of the scenario; it must post exactly one embed"""
+    clock, session = install(scenario, 0)
+    clock.now = clock.end - timedelta(seconds=1)
+    output = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+    with output:
+        monitor.test_webhook()
+    return len(session.posts) == 1 and len(session.posts[0][1]) == 1
+
+
+def print_report(results):
+    print(f"{'scenario':<14}{'found':>8}{'extra':>7}{'mean lat':>10}{'max lat':>9}"
+          f"{'history':>9}{'details':>9}{'calls/match':>13}{'posts':>7}{'429s':>6}{'runtime':>10}")
+    for r in results:
+        print(f"{r['scenario']:<14}{r['detected']:>4}/{r['expected']:<3}{r['unexpected']:>7}"
+              f"{r['latency_mean']:>9.0f}s{r['latency_max']:>8.0f}s{r['history_calls']:>9}{r['detail_calls']:>9}"
+              f"{r['calls_per_match']:>13.1f}{r['webhook_posts']:>7}{r['rate_limited']:>6}{r['runtime'] * 1000:>8.0f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay simulated or recorded match histories against the monitor")
+    parser.add_argument("--scenario", choices=["weekly", "burst", "rate-limited"], help="run only this scenario")
+    parser.add_argument("--fixtures", help="directory with recorded history.json and matches/<id>.json")
+    parser.add_argument("--replay-last", type=int, default=3, help="recorded matches to replay as new (default: 3)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="show the monitor's output")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    if args.fixtures:
+        runs = [(fixture_scenario(args.fixtures, args.replay_last), 0)]
+    else:
+        runs = [
+            (weekly_scenario(rng), 0),
+            (burst_scenario(rng), 0),
+            (dict(weekly_scenario(random.Random(42)), name="rate-limited"), 5),
+        ]
+        if args.scenario:
+            runs = [run for run in runs if run[0]['name'] == args.scenario]
+
+    results = [run_monitor(scenario, rate_limit_every, args.verbose) for scenario, rate_limit_every in runs]
+    print_report(results)
+
+    test_ok = run_test_webhook(runs[0][0], args.verbose)
+    print(f"\n🧪 test_webhook(): {'✅ posted one embed' if test_ok else '❌ unexpected webhook traffic'}")
+
+    failed = [r for r in results if r['detected'] != r['expected'] or r['unexpected']]
+    return 1 if failed or not test_ok else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())